@@ -1,7 +1,15 @@
-from fastapi import FastAPI, UploadFile, File, APIRouter
+import time
+from typing import List, Optional
+from fastapi import FastAPI, UploadFile, File, APIRouter, Query, Header, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from interfaces.inbound.rest.audio_controller import AudioController
 from interfaces.inbound.rest.transcription_controller import TranscriptionController
+from interfaces.inbound.rest.search_controller import SearchController
+from interfaces.inbound.rest.batch_controller import BatchController, BatchManifest
+from interfaces.inbound.rest.live_controller import LiveController
+from interfaces.inbound.rest.health_controller import HealthController
+from interfaces.inbound.rest.metrics_controller import MetricsController
+from shared.utils.metrics import REGISTRY, HTTP_REQUEST_SECONDS
 from composition_root.container import Container
 from config import APP_HOST, APP_PORT
 import logging
@@ -17,7 +25,14 @@ container = Container()
 
 # Initialize controllers
 audio_controller = AudioController(container.store_audio_usecase)
-transcription_controller = TranscriptionController(container.transcribe_audio_usecase)
+transcription_controller = TranscriptionController(
+    container.transcribe_audio_usecase, container.export_transcript_usecase
+)
+search_controller = SearchController(container.search_transcripts_usecase)
+batch_controller = BatchController(container.batch_transcribe_usecase)
+live_controller = LiveController(container.live_transcribe_usecase)
+health_controller = HealthController(container.model_manager)
+metrics_controller = MetricsController(REGISTRY)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +42,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    response = await call_next(request)
+    # Label by route template (not the raw path) to keep label cardinality bounded
+    route = request.scope.get("route")
+    HTTP_REQUEST_SECONDS.observe(
+        time.perf_counter() - started,
+        method=request.method,
+        route=getattr(route, "path", "unmatched"),
+        status=str(response.status_code)
+    )
+    return response
+
 router = APIRouter(prefix="/api")
 
 # Audio endpoints
@@ -38,29 +67,161 @@ async def upload_audio(file: UploadFile = File(...)):
 async def get_audio(clip_id: str):
     return await audio_controller.get_audio(clip_id)
 
+@router.get("/audio/{clip_id}/content")
+async def get_audio_content(
+    clip_id: str,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    range: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
+    return await audio_controller.get_audio_content(
+        clip_id,
+        start=start,
+        end=end,
+        range_header=range,
+        if_range=if_range,
+        if_none_match=if_none_match
+    )
+
 @router.delete("/audio/{clip_id}")
 async def delete_audio(clip_id: str):
     return await audio_controller.delete_audio(clip_id)
 
 # Transcription endpoints
 @router.post("/transcribe/{clip_id}")
-async def transcribe_audio(clip_id: str):
-    return await transcription_controller.transcribe_audio(clip_id)
+async def transcribe_audio(
+    clip_id: str,
+    model: Optional[str] = None,
+    quality: Optional[str] = None,
+    profile: Optional[str] = None,
+    language: Optional[str] = None,
+    per_speaker_language: bool = False,
+    profiler: bool = False,
+    priority: Optional[str] = None,
+    x_api_key: Optional[str] = Header(None)
+):
+    return await transcription_controller.transcribe_audio(
+        clip_id, model, quality, profile, language, per_speaker_language, profiler,
+        api_key=x_api_key, priority=priority
+    )
 
 @router.get("/transcribe/{clip_id}")
-async def get_transcription(clip_id: str):
-    return await transcription_controller.get_transcription(clip_id)
+async def get_transcription(
+    clip_id: str,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    speaker: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    priority: Optional[str] = None,
+    format: Optional[str] = None,
+    words: bool = False,
+    if_none_match: Optional[str] = Header(None),
+    x_api_key: Optional[str] = Header(None)
+):
+    return await transcription_controller.get_transcription(
+        clip_id,
+        start=start,
+        end=end,
+        speaker=speaker,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        if_none_match=if_none_match,
+        api_key=x_api_key,
+        priority=priority,
+        format=format,
+        words=words
+    )
 
 @router.delete("/transcribe/{clip_id}")
 async def delete_transcription(clip_id: str):
     return await transcription_controller.delete_transcription(clip_id)
 
 @router.get("/transcribe/{clip_id}/stream")
-async def stream_transcription(clip_id: str):
-    return await transcription_controller.stream_transcription(clip_id)
+async def stream_transcription(
+    clip_id: str,
+    model: Optional[str] = None,
+    quality: Optional[str] = None,
+    progressive: bool = False,
+    profile: Optional[str] = None,
+    language: Optional[str] = None,
+    per_speaker_language: bool = False,
+    profiler: bool = False,
+    priority: Optional[str] = None,
+    x_api_key: Optional[str] = Header(None)
+):
+    return await transcription_controller.stream_transcription(
+        clip_id, model, quality, progressive, profile, language, per_speaker_language, profiler,
+        api_key=x_api_key, priority=priority
+    )
+
+@router.get("/transcribe/{clip_id}/trace")
+async def get_transcription_trace(clip_id: str):
+    return await transcription_controller.get_trace(clip_id)
+
+# Batch endpoints (server-sent events as each clip completes)
+@router.post("/batch/transcribe")
+async def batch_transcribe(manifest: BatchManifest, x_api_key: Optional[str] = Header(None)):
+    return await batch_controller.transcribe_manifest(manifest, api_key=x_api_key)
+
+@router.post("/batch/transcribe/upload")
+async def batch_transcribe_upload(
+    files: List[UploadFile] = File(...),
+    model: Optional[str] = None,
+    quality: Optional[str] = None,
+    profile: Optional[str] = None,
+    language: Optional[str] = None,
+    per_speaker_language: bool = False,
+    priority: Optional[str] = None,
+    x_api_key: Optional[str] = Header(None)
+):
+    return await batch_controller.transcribe_bundle(
+        files, model, quality, profile, language, per_speaker_language,
+        api_key=x_api_key, priority=priority
+    )
+
+# Live transcription (WebSocket: PCM frames in, partial/final updates out)
+@router.websocket("/live/transcribe")
+async def live_transcribe(
+    websocket: WebSocket,
+    sample_rate: int = 16000,
+    model: Optional[str] = None,
+    quality: Optional[str] = None,
+    profile: Optional[str] = None,
+    language: Optional[str] = None,
+    x_api_key: Optional[str] = Header(None)
+):
+    await live_controller.transcribe(websocket, sample_rate, model, quality, profile, language, api_key=x_api_key)
+
+# Search endpoints
+@router.get("/search")
+async def search_transcripts(
+    q: str,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    return await search_controller.search(q, limit, offset)
+
+# Health endpoints
+@router.get("/health/live")
+async def liveness():
+    return await health_controller.liveness()
+
+@router.get("/health/ready")
+async def readiness():
+    return await health_controller.readiness()
 
 app.include_router(router)
 
+# Prometheus scrape endpoint (outside /api by convention)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return await metrics_controller.metrics()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app:app", host=APP_HOST, port=APP_PORT, reload=False)
\ No newline at end of file
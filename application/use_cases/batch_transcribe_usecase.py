@@ -0,0 +1,163 @@
+import asyncio
+import time
+import uuid
+from typing import AsyncGenerator, List, Optional, Tuple
+
+from application.use_cases.store_audio_usecase import StoreAudioUseCase
+from application.use_cases.transcribe_audio_usecase import TranscribeAudioUseCase
+from domain.batch_event import COMPLETED, DONE, FAILED, QUEUED, BatchEvent
+from domain.segment_table import SegmentTable
+from shared.utils.fair_scheduler import FairScheduler
+from shared.utils.priority_scheduler import ANONYMOUS_TENANT, BATCH, job_class
+
+
+class BatchTranscribeUseCase:
+    """
+    Use case for transcribing many clips in one request.
+
+    The clips of a batch are queued on a FairScheduler shared by all batches,
+    so concurrent batches take turns on its workers instead of the first
+    large batch holding them all. Every clip goes through the regular
+    transcription use case: loaded models are shared and stored transcripts
+    are returned without transcribing again.
+    """
+    def __init__(self,
+                 transcribe_audio_usecase: TranscribeAudioUseCase,
+                 store_audio_usecase: StoreAudioUseCase,
+                 scheduler: FairScheduler,
+                 max_clips: int = 1000):
+        """
+        Args:
+            transcribe_audio_usecase: Transcribes each clip of a batch
+            store_audio_usecase: Stores the clips of uploaded bundles
+            scheduler: Shares the batch workers between batches
+            max_clips: Largest number of clips accepted in one batch
+        """
+        self.transcribe_audio_usecase = transcribe_audio_usecase
+        self.store_audio_usecase = store_audio_usecase
+        self.scheduler = scheduler
+        self.max_clips = max_clips
+
+    def validate(
+        self,
+        clips: int,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        priority: str = BATCH
+    ) -> None:
+        """
+        Check a batch before it is queued (or its clips are stored)
+
+        Args:
+            clips: Number of clips in the batch
+            model: Requested model
+            profile: Requested decoding profile
+            priority: Priority class the batch's clips are transcribed in
+
+        Raises:
+            LookupError: If the batch is empty or too large
+            UnsupportedTranscriptionOptionError: If the model or decoding profile is unknown
+            AdmissionRejectedError: If the transcription queue is too long
+        """
+        if clips == 0:
+            raise LookupError("The batch contains no clips")
+        if clips > self.max_clips:
+            raise LookupError(f"The batch contains {clips} clips, more than the limit of {self.max_clips}")
+        self.transcribe_audio_usecase.validate_options(model, profile)
+        with job_class(ANONYMOUS_TENANT, priority):
+            self.transcribe_audio_usecase.admit()
+
+    def store_bundle(self, files: List[Tuple[str, bytes]]) -> List[str]:
+        """
+        Store the clips of an uploaded bundle
+
+        Args:
+            files: (filename, content) of each clip
+
+        Returns:
+            The IDs of the stored clips, in bundle order
+        """
+        return [
+            str(self.store_audio_usecase.execute(title=filename, filename=filename, content=content).id)
+            for filename, content in files
+        ]
+
+    async def _transcribe(self, clip_id: str, tenant: str, priority: str, **options) -> dict:
+        began = time.perf_counter()
+        # Scheduler workers are shared by all batches; run the clip for this batch's tenant
+        with job_class(tenant, priority):
+            segments = await self.transcribe_audio_usecase.get_or_transcribe(clip_id, **options)
+        table = SegmentTable.coerce(segments)
+        return {
+            "segments": table.to_records(),
+            "seconds": time.perf_counter() - began,
+        }
+
+    async def execute(
+        self,
+        clip_ids: List[str],
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        tenant: str = ANONYMOUS_TENANT,
+        priority: str = BATCH
+    ) -> AsyncGenerator[BatchEvent, None]:
+        """
+        Transcribe a batch of clips, yielding an event as each clip completes
+
+        Args:
+            clip_ids: IDs of the audio clips
+            model: Model used for clips that still need transcribing
+            profile: Decoding profile used for clips that still need transcribing
+            language: Language used for clips that still need transcribing
+            per_speaker_language: Detect the language of each speaker separately
+            tenant: Tenant the batch's model work is accounted to
+            priority: Priority class of the batch's model work
+
+        Returns:
+            Async generator yielding a queued event, one completed or failed
+            event per clip, then a done event
+        """
+        batch_id = uuid.uuid4().hex
+        began = time.perf_counter()
+        options = dict(
+            tenant=tenant, priority=priority, model=model, profile=profile,
+            language=language, per_speaker_language=per_speaker_language
+        )
+
+        futures = {}
+        for index, clip_id in enumerate(clip_ids):
+            # Audio in remote storage is downloaded while the clip waits in the queue
+            self.transcribe_audio_usecase.prefetch(clip_id)
+            future = self.scheduler.submit(
+                batch_id, lambda clip_id=clip_id: self._transcribe(clip_id, **options)
+            )
+            futures[future] = (index, clip_id)
+
+        try:
+            yield BatchEvent(QUEUED, data={"batch_id": batch_id, "clips": len(clip_ids)})
+
+            completed = failed = 0
+            pending = set(futures)
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in sorted(finished, key=lambda f: futures[f][0]):
+                    index, clip_id = futures[future]
+                    error = future.exception()
+                    if error is None:
+                        completed += 1
+                        yield BatchEvent(COMPLETED, index, clip_id, future.result())
+                    else:
+                        failed += 1
+                        yield BatchEvent(FAILED, index, clip_id, {"error": str(error)})
+
+            yield BatchEvent(DONE, data={
+                "batch_id": batch_id,
+                "completed": completed,
+                "failed": failed,
+                "seconds": time.perf_counter() - began,
+            })
+        finally:
+            # The client went away or the batch finished; drop whatever is still queued
+            self.scheduler.cancel_group(batch_id)
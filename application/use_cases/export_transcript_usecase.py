@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from application.use_cases.transcribe_audio_usecase import TranscribeAudioUseCase
+from domain.repositories import TranscriptExportRepository, TranscriptionTextRepository, WordTimingRepository
+from shared.utils.metrics import EXPORT_CACHE_LOOKUPS
+from shared.utils.transcript_formats import TRANSCRIPT_FORMATS, TranscriptFormat
+
+
+class UnsupportedExportFormatError(LookupError):
+    """Raised when an export names a format that is not offered"""
+
+
+@dataclass
+class TranscriptExport:
+    """A rendered transcript, produced while it is sent"""
+    media_type: str
+    filename: str
+    version: Optional[str]
+    chunks: AsyncIterator[bytes]
+
+
+class ExportTranscriptUseCase:
+    """
+    Use case for exporting transcripts as subtitles (SRT, WebVTT), JSON lines
+    or plain text.
+
+    Exports are rendered page by page from the repository while they are
+    sent, so memory use does not grow with the transcript. Whole-transcript
+    exports are stored in the export repository as they are produced and
+    served from there until the transcript changes.
+    """
+    PAGE_SIZE = 500
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        transcribe_audio_usecase: TranscribeAudioUseCase,
+        transcription_repository: TranscriptionTextRepository,
+        word_timing_repository: Optional[WordTimingRepository] = None,
+        export_repository: Optional[TranscriptExportRepository] = None
+    ):
+        """
+        Args:
+            transcribe_audio_usecase: Transcribes clips that have no transcript yet
+            transcription_repository: Repository of the transcripts
+            word_timing_repository: Word timings recorded during transcription (None exports without them)
+            export_repository: Cache of rendered exports (None renders every request)
+        """
+        self.transcribe_audio_usecase = transcribe_audio_usecase
+        self.transcription_repository = transcription_repository
+        self.word_timing_repository = word_timing_repository
+        self.export_repository = export_repository
+
+    @staticmethod
+    def validate(fmt: str) -> None:
+        """
+        Raises:
+            UnsupportedExportFormatError: If the format is not offered
+        """
+        if fmt not in TRANSCRIPT_FORMATS:
+            raise UnsupportedExportFormatError(
+                f"Unknown export format '{fmt}' (available: {', '.join(TRANSCRIPT_FORMATS)})"
+            )
+
+    async def execute(
+        self,
+        clip_id: str,
+        fmt: str,
+        words: bool = False,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None
+    ) -> TranscriptExport:
+        """
+        Export a transcription, transcribing the clip first if needed
+
+        Args:
+            clip_id: ID of the audio clip
+            fmt: Export format (srt, vtt, jsonl or txt)
+            words: Include word-level timings where the format can show them
+            start: Only segments ending after this time (seconds)
+            end: Only segments starting before this time (seconds)
+            speaker_label: Only segments of this speaker
+
+        Returns:
+            TranscriptExport whose chunks are rendered (or read) as they are consumed
+
+        Raises:
+            UnsupportedExportFormatError: If the format is not offered
+            ValueError: If the clip does not exist
+        """
+        self.validate(fmt)
+        if self.transcription_repository.get_version(clip_id) is None:
+            await self.transcribe_audio_usecase.get_or_transcribe(clip_id)
+        else:
+            await self.transcribe_audio_usecase.record_use(clip_id)
+        version = self.transcription_repository.get_version(clip_id)
+
+        renderer: TranscriptFormat = TRANSCRIPT_FORMATS[fmt]()
+        name = f"words.{fmt}" if words else fmt
+        rendered = self._render(renderer, clip_id, words, start, end, speaker_label)
+
+        whole = start is None and end is None and speaker_label is None
+        if self.export_repository is None or version is None or not whole:
+            chunks = self._encode(rendered)
+        else:
+            path = self.export_repository.get_path(clip_id, version, name)
+            EXPORT_CACHE_LOOKUPS.inc(result="hit" if path is not None else "miss")
+            if path is not None:
+                await rendered.aclose()
+                chunks = self._read(path)
+            else:
+                chunks = self._store(rendered, clip_id, version, name)
+
+        return TranscriptExport(
+            media_type=renderer.media_type,
+            filename=f"{clip_id}.{fmt}",
+            version=version,
+            chunks=chunks
+        )
+
+    async def _render(
+        self,
+        renderer: TranscriptFormat,
+        clip_id: str,
+        words: bool,
+        start: Optional[float],
+        end: Optional[float],
+        speaker_label: Optional[str]
+    ) -> AsyncIterator[str]:
+        """
+        Render the transcript one repository page at a time, from a single pass
+        over the committed segments. Word timings are recorded in transcript
+        order, so they are read alongside the pages and only the current
+        page's records are held.
+        """
+        header = renderer.header()
+        if header:
+            yield header
+
+        pages = self.transcription_repository.iter_pages(
+            clip_id, start=start, end=end, speaker_label=speaker_label, page_size=self.PAGE_SIZE
+        )
+        records = None
+        if words and self.word_timing_repository is not None:
+            records = self.word_timing_repository.iter_records(clip_id)
+        timings, lookahead = {}, None
+        offset = 0
+        try:
+            for page in pages:
+                if records is not None:
+                    last = max(page.starts)
+                    if lookahead is not None and lookahead[0] <= last:
+                        timings[lookahead[0]] = lookahead[1]
+                        lookahead = None
+                    if lookahead is None:
+                        for record in records:
+                            if record[0] > last:
+                                lookahead = record
+                                break
+                            timings[record[0]] = record[1]
+                yield "".join(
+                    renderer.segment(offset + index, segment, timings.get(segment.start, []) if words else None)
+                    for index, segment in enumerate(page)
+                )
+                offset += len(page)
+                if timings:
+                    timings = {segment_start: w for segment_start, w in timings.items() if segment_start >= last}
+        finally:
+            pages.close()
+            if records is not None:
+                records.close()
+
+    @staticmethod
+    async def _encode(rendered: AsyncIterator[str]) -> AsyncIterator[bytes]:
+        async for text in rendered:
+            yield text.encode()
+
+    async def _store(self, rendered: AsyncIterator[str], clip_id: str, version: str, name: str) -> AsyncIterator[bytes]:
+        """Send the rendered export while writing it to the export repository (discarded if not sent in full)"""
+        with self.export_repository.writer(clip_id, version, name) as f:
+            async for text in rendered:
+                chunk = text.encode()
+                f.write(chunk)
+                yield chunk
+
+    async def _read(self, path: str) -> AsyncIterator[bytes]:
+        with open(path, "rb") as f:
+            while chunk := f.read(self.CHUNK_SIZE):
+                yield chunk
@@ -0,0 +1,308 @@
+import asyncio
+import os
+import tempfile
+import wave
+from collections import deque
+from typing import AsyncGenerator, AsyncIterator, Deque, List, Optional
+from uuid import uuid4
+
+from domain.audio_clip import AudioClip
+from domain.ports.speaker_embedding_port import SpeakerEmbeddingPort
+from domain.ports.transcription_port import TranscriptionPort, UnsupportedTranscriptionOptionError
+from domain.speaker_segment import SpeakerSegment
+from domain.transcript_update import FINAL, PARTIAL, TranscriptUpdate
+from shared.utils.metrics import track_job
+from shared.utils.priority_scheduler import PriorityScheduler
+from shared.utils.speaker_tracker import OnlineSpeakerTracker
+from shared.utils.tracing import in_context
+from shared.utils.vad import EnergyVAD
+
+
+def _agreed_prefix(previous: List[str], current: List[str]) -> int:
+    """Number of leading words two hypotheses agree on (ignoring case and punctuation)"""
+    count = 0
+    for a, b in zip(previous, current):
+        if a.strip(".,!?;:").lower() != b.strip(".,!?;:").lower():
+            break
+        count += 1
+    return count
+
+
+def _write_wav(pcm: bytes, sample_rate: int) -> str:
+    fd, path = tempfile.mkstemp(prefix="live_", suffix=".wav")
+    with os.fdopen(fd, "wb") as f, wave.open(f, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return path
+
+
+class _Utterance:
+    def __init__(self, index: int, start: float):
+        self.index = index
+        self.start = start
+        self.pcm = bytearray()
+        self.silence_ms = 0
+        self.decoded_bytes = 0
+        self.hypothesis: List[str] = []
+        self.committed: List[str] = []
+        self.speaker: Optional[str] = None
+
+
+class _LiveSession:
+    """
+    Segments incoming PCM into utterances: speech starts an utterance (with
+    a little audio from before it), and enough trailing silence, or the
+    maximum length, ends it.
+    """
+    PRE_ROLL_MS = 200
+
+    def __init__(self, sample_rate: int, vad: EnergyVAD, silence_ms: int, max_utterance_seconds: float):
+        self.sample_rate = sample_rate
+        self.vad = vad
+        self.silence_ms = silence_ms
+        self.max_utterance_bytes = int(2 * sample_rate * max_utterance_seconds)
+        self.received_bytes = 0
+        self.current: Optional[_Utterance] = None
+        self.finished: Deque[_Utterance] = deque()
+        self.closed = False
+        self._pre_roll: Deque[bytes] = deque(maxlen=max(1, self.PRE_ROLL_MS // vad.frame_ms))
+        self._next_index = 0
+
+    def seconds(self, byte_count: int) -> float:
+        return byte_count / 2 / self.sample_rate
+
+    def feed(self, pcm: bytes) -> None:
+        for frame, speech in self.vad.feed(pcm):
+            if self.current is None:
+                if speech:
+                    pre_roll = b"".join(self._pre_roll)
+                    self.current = _Utterance(
+                        self._next_index, self.seconds(self.received_bytes - len(pre_roll))
+                    )
+                    self._next_index += 1
+                    self.current.pcm += pre_roll
+                    self._pre_roll.clear()
+                else:
+                    self._pre_roll.append(frame)
+            if self.current is not None:
+                self.current.pcm += frame
+                self.current.silence_ms = 0 if speech else self.current.silence_ms + self.vad.frame_ms
+                if self.current.silence_ms >= self.silence_ms or len(self.current.pcm) >= self.max_utterance_bytes:
+                    self._finish()
+            self.received_bytes += len(frame)
+
+    def close(self) -> None:
+        if self.current is not None:
+            self._finish()
+        self.closed = True
+
+    def _finish(self) -> None:
+        self.finished.append(self.current)
+        self.current = None
+
+
+class LiveTranscribeUseCase:
+    """
+    Use case for transcribing audio as it is captured (e.g. a meeting
+    microphone), for live captions.
+
+    Incoming PCM is cut into utterances by voice activity detection. While an
+    utterance is being spoken it is re-decoded with the draft model every
+    partial_interval seconds of new audio; words on which two consecutive
+    hypotheses agree are committed (LocalAgreement), so the ``stable`` part
+    of PARTIAL updates only grows. When the utterance ends it is decoded once
+    more with the requested model and emitted as a FINAL update. Speakers are
+    assigned online from speaker embeddings of each utterance.
+    """
+    MIN_PROVISIONAL_SPEAKER_SECONDS = 1.0
+
+    def __init__(self,
+                 transcription_service: TranscriptionPort,
+                 embedding_service: Optional[SpeakerEmbeddingPort] = None,
+                 draft_model: Optional[str] = None,
+                 partial_interval: float = 0.5,
+                 silence_ms: int = 500,
+                 silence_thresh_db: float = -40.0,
+                 max_utterance_seconds: float = 15.0,
+                 speaker_similarity: float = 0.5,
+                 max_speakers: int = 8,
+                 scheduler: Optional[PriorityScheduler] = None):
+        """
+        Args:
+            transcription_service: Transcribes utterances (models are shared with file transcription)
+            embedding_service: Speaker embeddings for online speaker assignment (None labels no speakers)
+            draft_model: Model for partial hypotheses (None uses the final model with draft decoding)
+            partial_interval: Seconds of new audio between partial hypotheses
+            silence_ms: Trailing silence that ends an utterance
+            silence_thresh_db: Frames below this level (dBFS) are silence
+            max_utterance_seconds: Utterances are cut at this length
+            speaker_similarity: Minimum cosine similarity to an existing speaker's centroid
+            max_speakers: Upper bound on the number of speakers told apart in a session
+            scheduler: Shares the model with file transcription (None decodes without waiting)
+        """
+        self.transcription_service = transcription_service
+        self.embedding_service = embedding_service
+        self.draft_model = draft_model
+        self.partial_interval = partial_interval
+        self.silence_ms = silence_ms
+        self.silence_thresh_db = silence_thresh_db
+        self.max_utterance_seconds = max_utterance_seconds
+        self.speaker_similarity = speaker_similarity
+        self.max_speakers = max_speakers
+        self.scheduler = scheduler
+
+    def validate_options(
+        self, sample_rate: int, model: Optional[str] = None, profile: Optional[str] = None
+    ) -> None:
+        """
+        Check the options of a live session before it starts
+
+        Raises:
+            UnsupportedTranscriptionOptionError: If an option is unsupported
+        """
+        if not 8000 <= sample_rate <= 48000:
+            raise UnsupportedTranscriptionOptionError(f"Unsupported sample rate {sample_rate}")
+        self.transcription_service.resolve_model(model)
+        self.transcription_service.resolve_model(self.draft_model)
+        self.transcription_service.resolve_profile(profile)
+
+    def admit(self) -> None:
+        """
+        Check that a live session may start now, in the current job class
+
+        Raises:
+            AdmissionRejectedError: If the transcription queue is too long
+        """
+        if self.scheduler is not None:
+            self.scheduler.admit()
+
+    async def _transcribe(
+        self, session_id, pcm: bytes, sample_rate: int, **options
+    ) -> str:
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(None, in_context(_write_wav), pcm, sample_rate)
+        try:
+            clip = AudioClip(
+                title="live", filename=os.path.basename(path), content=b"",
+                duration=len(pcm) / 2 / sample_rate, id=session_id, file_path=path
+            )
+            if self.scheduler is None:
+                return (await self.transcription_service.transcribe(clip, 0.0, 0.0, **options)).strip()
+            async with self.scheduler.slot(clip.duration):
+                return (await self.transcription_service.transcribe(clip, 0.0, 0.0, **options)).strip()
+        finally:
+            os.remove(path)
+
+    async def _speaker(
+        self, tracker: OnlineSpeakerTracker, pcm: bytes, sample_rate: int, update: bool
+    ) -> Optional[str]:
+        if self.embedding_service is None:
+            return None
+        embedding = await self.embedding_service.embed(bytes(pcm), sample_rate)
+        if embedding is None:
+            return None
+        return tracker.assign(embedding, weight=len(pcm) / 2 / sample_rate, update=update)
+
+    @track_job("live", audio_end=lambda update: update.segment.end)
+    async def execute(
+        self,
+        audio: AsyncIterator[bytes],
+        sample_rate: int = 16000,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> AsyncGenerator[TranscriptUpdate, None]:
+        """
+        Transcribe live audio.
+
+        Args:
+            audio: 16-bit little-endian mono PCM chunks as they are captured; the
+                session ends (after finalizing the last utterance) when it is exhausted
+            sample_rate: Sample rate of the PCM
+            model: Model for final updates (None for the default model)
+            profile: Decoding profile for final updates (None for the service default)
+            language: Language code to decode in (None detects it per utterance)
+
+        Returns:
+            Async generator yielding PARTIAL and FINAL updates; an utterance's
+            updates share its index
+        """
+        self.validate_options(sample_rate, model, profile)
+        session_id = uuid4()
+        session = _LiveSession(
+            sample_rate,
+            EnergyVAD(sample_rate, threshold_db=self.silence_thresh_db),
+            self.silence_ms,
+            self.max_utterance_seconds
+        )
+        tracker = OnlineSpeakerTracker(self.speaker_similarity, self.max_speakers)
+        received = asyncio.Event()
+
+        async def receive():
+            try:
+                async for chunk in audio:
+                    session.feed(chunk)
+                    received.set()
+            finally:
+                session.close()
+                received.set()
+
+        def segment(utterance: _Utterance, text: str) -> SpeakerSegment:
+            return SpeakerSegment(
+                audio_clip_id=session_id,
+                start=utterance.start,
+                end=utterance.start + session.seconds(len(utterance.pcm)),
+                speaker_label=utterance.speaker,
+                text=text
+            )
+
+        receiver = asyncio.create_task(receive())
+        try:
+            while True:
+                await received.wait()
+                received.clear()
+
+                # Finish ended utterances first: they are what viewers wait on
+                while session.finished:
+                    utterance = session.finished.popleft()
+                    pcm = bytes(utterance.pcm)
+                    text = await self._transcribe(
+                        session_id, pcm, sample_rate, model=model, profile=profile, language=language
+                    )
+                    utterance.speaker = await self._speaker(tracker, pcm, sample_rate, update=True) or utterance.speaker
+                    if text:
+                        yield TranscriptUpdate(FINAL, utterance.index, segment(utterance, text))
+
+                utterance = session.current
+                interval_bytes = int(2 * sample_rate * self.partial_interval)
+                if utterance is not None and len(utterance.pcm) - utterance.decoded_bytes >= interval_bytes:
+                    pcm = bytes(utterance.pcm)
+                    utterance.decoded_bytes = len(pcm)
+                    words = (await self._transcribe(
+                        session_id, pcm, sample_rate, model=self.draft_model, draft=True, language=language
+                    )).split()
+                    agreed = _agreed_prefix(utterance.hypothesis, words)
+                    if agreed > len(utterance.committed):
+                        utterance.committed = words[:agreed]
+                    utterance.hypothesis = words
+                    if utterance.speaker is None and session.seconds(len(pcm)) >= self.MIN_PROVISIONAL_SPEAKER_SECONDS:
+                        utterance.speaker = await self._speaker(tracker, pcm, sample_rate, update=False)
+                    # The utterance may have ended while decoding; its FINAL update follows
+                    if words and session.current is utterance:
+                        yield TranscriptUpdate(
+                            PARTIAL, utterance.index,
+                            segment(utterance, " ".join(utterance.committed + words[len(utterance.committed):])),
+                            stable=" ".join(utterance.committed)
+                        )
+                    # Audio that arrived while decoding may already warrant another pass
+                    received.set()
+
+                if receiver.done() and not session.finished and session.current is None:
+                    # Surface a failed audio source
+                    receiver.result()
+                    return
+        finally:
+            if not receiver.done():
+                receiver.cancel()
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from domain.ports.search_index_port import SearchIndexPort
+from domain.repositories import AudioClipRepository
+from domain.search_hit import SearchHit
+
+
+class SearchTranscriptsUseCase:
+    """Use case for full-text search over stored transcripts"""
+
+    MAX_LIMIT = 100
+
+    def __init__(self, search_index: SearchIndexPort, audio_repository: Optional[AudioClipRepository] = None):
+        """
+        Initialize with a search index
+
+        Args:
+            search_index: SearchIndexPort instance kept up to date by the transcription repository
+            audio_repository: Records the returned clips as used, for storage eviction (None records nothing)
+        """
+        self.search_index = search_index
+        self.audio_repository = audio_repository
+
+    def execute(self, query: str, limit: int = 20, offset: int = 0) -> list[SearchHit]:
+        """
+        Search transcribed segments
+
+        Args:
+            query: Free-text query
+            limit: Page size (capped at MAX_LIMIT)
+            offset: Number of ranked hits to skip
+
+        Returns:
+            list[SearchHit]: Matching segments, best match first
+
+        Raises:
+            ValueError: If the query or pagination parameters are invalid
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query must not be empty")
+        if limit < 1 or offset < 0:
+            raise ValueError("limit must be positive and offset must not be negative")
+
+        hits = self.search_index.search(query, limit=min(limit, self.MAX_LIMIT), offset=offset)
+        if self.audio_repository is not None:
+            for clip_id in {hit.clip_id for hit in hits}:
+                self.audio_repository.touch(clip_id)
+        return hits
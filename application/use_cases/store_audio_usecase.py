@@ -1,19 +1,62 @@
+import os
+from typing import ContextManager, Optional
 from domain.audio_clip import AudioClip
-from domain.repositories import AudioClipRepository
+from domain.audio_content import AudioContent
+from domain.repositories import (
+    AudioClipRepository, TranscriptExportRepository, TranscriptionTextRepository, WordTimingRepository
+)
+from shared.utils.wav_layout import read_wav_layout
 from uuid import uuid4
 
 
+class UnsupportedAudioRangeError(Exception):
+    """Raised when a time range cannot be cut from a clip (not PCM WAV, or an empty range)"""
+
+
+# Uploads are stored as sent; their media type is recognized from the leading bytes
+_MAGIC_MEDIA_TYPES = (
+    (b"RIFF", "audio/wav", ".wav"),
+    (b"ID3", "audio/mpeg", ".mp3"),
+    (b"\xff\xfb", "audio/mpeg", ".mp3"),
+    (b"\xff\xf3", "audio/mpeg", ".mp3"),
+    (b"fLaC", "audio/flac", ".flac"),
+    (b"OggS", "audio/ogg", ".ogg"),
+)
+
+
+def _sniff_media_type(path: str) -> tuple[str, str]:
+    """(media type, file extension) of a stored upload"""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    for prefix, media_type, extension in _MAGIC_MEDIA_TYPES:
+        if magic.startswith(prefix):
+            return media_type, extension
+    return "application/octet-stream", ""
+
+
 class StoreAudioUseCase:
     """Use case for storing audio clips in the repository"""
 
-    def __init__(self, audio_repository: AudioClipRepository):
+    def __init__(
+        self,
+        audio_repository: AudioClipRepository,
+        transcription_repository: Optional[TranscriptionTextRepository] = None,
+        word_timing_repository: Optional[WordTimingRepository] = None,
+        export_repository: Optional[TranscriptExportRepository] = None
+    ):
         """
         Initialize with an audio repository
 
         Args:
             audio_repository: Optional AudioClipRepository instance
+            transcription_repository: Transcripts deleted together with their clip
+            word_timing_repository: Word timings deleted together with their clip
+            export_repository: Transcript exports deleted together with their clip
         """
         self.audio_repository = audio_repository
+        self.transcription_repository = transcription_repository
+        self.word_timing_repository = word_timing_repository
+        self.export_repository = export_repository
 
     def execute(self, title: str, filename: str, content: bytes) -> AudioClip:
         """
@@ -48,9 +91,65 @@ class StoreAudioUseCase:
         """
         return self.audio_repository.get(clip_id)
 
+    def in_use(self, clip_id) -> ContextManager[None]:
+        """Keep the clip's local audio available for the duration of the block (e.g. while it is sent)"""
+        return self.audio_repository.in_use(clip_id)
+
+    def get_content(
+        self,
+        clip_id,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Optional[AudioContent]:
+        """
+        Locate the stored audio of a clip, or of the [start, end) seconds of it.
+        Time ranges are cut from the PCM samples in place: only the WAV header is
+        read, and a header for the cut is generated.
+
+        Args:
+            clip_id: The ID of the clip
+            start: Start of the time range in seconds (None for the beginning)
+            end: End of the time range in seconds (None for the end)
+
+        Returns:
+            AudioContent, or None if the clip does not exist
+
+        Raises:
+            UnsupportedAudioRangeError: If a time range is requested from a file that is
+                not uncompressed WAV, or the range holds no audio
+        """
+        path = self.audio_repository.get_audio_path(clip_id)
+        if path is None:
+            return None
+        stat = os.stat(path)
+        version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        if start is None and end is None:
+            media_type, extension = _sniff_media_type(path)
+            return AudioContent(path, 0, stat.st_size, f"{clip_id}{extension}", version, media_type=media_type)
+
+        try:
+            layout = read_wav_layout(path)
+        except ValueError as e:
+            raise UnsupportedAudioRangeError(f"Time ranges need a PCM WAV clip: {e}")
+        start = start or 0.0
+        end = layout.duration if end is None else end
+        offset, length = layout.frame_range(start, end)
+        if length <= 0:
+            raise UnsupportedAudioRangeError(
+                f"Time range [{start:g}, {end:g}) holds no audio (clip duration {layout.duration:.3f} s)"
+            )
+        return AudioContent(
+            path,
+            offset,
+            length,
+            filename=f"{clip_id}_{start:g}-{end:g}.wav",
+            version=f"{version}-{offset:x}-{length:x}",
+            header=layout.header(length)
+        )
+
     def delete_clip(self, clip_id) -> bool:
         """
-        Delete an audio clip by its ID
+        Delete an audio clip by its ID, together with its transcript
 
         Args:
             clip_id: The ID of the clip to delete
@@ -58,4 +157,11 @@ class StoreAudioUseCase:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        return self.audio_repository.delete(clip_id)
+        deleted = self.audio_repository.delete(clip_id)
+        if self.transcription_repository is not None:
+            # Also removes transcripts left behind by clips deleted before the cascade existed
+            self.transcription_repository.delete(clip_id)
+        for repository in (self.word_timing_repository, self.export_repository):
+            if repository is not None:
+                repository.delete(clip_id)
+        return deleted
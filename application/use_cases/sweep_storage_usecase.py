@@ -0,0 +1,83 @@
+import logging
+import time
+from typing import Callable, Optional, Set
+
+from application.use_cases.store_audio_usecase import StoreAudioUseCase
+from domain.repositories import AudioClipRepository
+from shared.utils.metrics import STORAGE_BYTES, STORAGE_EVICTIONS
+
+logger = logging.getLogger(__name__)
+
+
+class SweepStorageUseCase:
+    """
+    Evicts stored clips (audio, metadata and transcript) that have not been
+    used for ttl seconds, then the least recently used ones until the stored
+    audio fits within the quota. Clips with a running job, and clips used
+    within the last min_idle seconds (such as uploads about to be
+    transcribed), are never evicted.
+    """
+    def __init__(
+        self,
+        audio_repository: AudioClipRepository,
+        store_audio_usecase: StoreAudioUseCase,
+        ttl: Optional[float] = None,
+        quota_bytes: Optional[int] = None,
+        min_idle: float = 600.0,
+        active_clips: Optional[Callable[[], Set[str]]] = None
+    ):
+        """
+        Args:
+            audio_repository: Repository listing the stored clips
+            store_audio_usecase: Deletes clips together with their transcripts
+            ttl: Seconds since last use after which a clip is evicted (None keeps clips forever)
+            quota_bytes: Budget for stored audio (None is unlimited)
+            min_idle: Clips used more recently than this many seconds ago are kept
+            active_clips: Returns the IDs of clips with a running job, which are kept
+        """
+        self.audio_repository = audio_repository
+        self.store_audio_usecase = store_audio_usecase
+        self.ttl = ttl
+        self.quota_bytes = quota_bytes
+        self.min_idle = min_idle
+        self.active_clips = active_clips
+
+    def execute(self) -> dict:
+        """
+        Run one sweep
+
+        Returns:
+            Summary with the number of evicted clips, freed and remaining bytes
+        """
+        now = time.time()
+        # Least recently used first
+        clips = sorted(self.audio_repository.usage(), key=lambda usage: usage.last_access)
+        total = sum(usage.size_bytes for usage in clips)
+        evicted, freed = 0, 0
+
+        for usage in clips:
+            idle = now - usage.last_access
+            expired = self.ttl is not None and idle > self.ttl
+            over_quota = self.quota_bytes is not None and total > self.quota_bytes
+            if idle < self.min_idle or not (expired or over_quota):
+                # Every later clip was used more recently
+                break
+            # Checked per clip, since jobs start while the sweep runs
+            if self.active_clips is not None and usage.clip_id in self.active_clips():
+                continue
+            if not self.store_audio_usecase.delete_clip(usage.clip_id):
+                continue
+            evicted += 1
+            freed += usage.size_bytes
+            total -= usage.size_bytes
+            STORAGE_EVICTIONS.inc(reason="ttl" if expired else "quota")
+
+        STORAGE_BYTES.set(total)
+        if evicted:
+            logger.info("Storage sweep evicted %d clips (%d bytes); %d bytes remain", evicted, freed, total)
+        elif self.quota_bytes is not None and total > self.quota_bytes:
+            logger.warning(
+                "Stored audio (%d bytes) exceeds the quota (%d bytes) but every clip was used recently",
+                total, self.quota_bytes
+            )
+        return {"evicted": evicted, "freed_bytes": freed, "bytes": total}
@@ -1,92 +1,399 @@
-from typing import AsyncGenerator
-from domain.ports.diarization_port import DiarizationPort
+import asyncio
+import hashlib
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Dict, Iterator, Optional, Set
+from domain.ports.diarization_port import DiarizationPort, IncompleteDiarizationError
 from domain.ports.transcription_port import TranscriptionPort
 from domain.speaker_segment import SpeakerSegment
-from domain.repositories import AudioClipRepository, TranscriptionTextRepository
+from domain.repositories import (
+    AudioClipRepository, SpeakerSegmentRepository, TranscriptionTextRepository, WordTimingRepository
+)
+from domain.segment_table import SegmentTable
+from domain.transcript_page import TranscriptPage
+from domain.transcript_update import DRAFT, FINAL, TranscriptUpdate
+from domain.turn_normalizer import TurnNormalizer
+from shared.utils.metrics import DIARIZATION_CACHE_LOOKUPS, track_job
+from shared.utils.priority_scheduler import PriorityScheduler, ScheduledJob, current_job_class
+from shared.utils.tracing import JobTrace, TraceStore, job_trace
+
+# Request value that disables clip-level language pinning (Whisper detects per segment)
+AUTO_LANGUAGE = "auto"
+
+
+class _LanguagePlan:
+    """
+    Picks the decoding language of each segment of one transcription job: the
+    requested language, else the clip's language (detected once and stored on
+    the clip), optionally detected per speaker for code-switched audio.
+    """
+    # Turns shorter than this are too short for a reliable per-speaker detection
+    MIN_SPEAKER_SECONDS = 2.0
+
+    def __init__(self, usecase: "TranscribeAudioUseCase", clip, language: Optional[str], per_speaker: bool):
+        self.usecase = usecase
+        self.clip = clip
+        self.language = language
+        self.per_speaker = per_speaker and not language
+        self._clip_language: Optional[str] = None
+        self._resolved = False
+        self._speakers = {}
+
+    async def clip_language(self) -> Optional[str]:
+        if not self._resolved:
+            self._clip_language = await self.usecase._clip_language(self.clip, self.language)
+            self._resolved = True
+        return self._clip_language
+
+    async def for_segment(self, seg: SpeakerSegment) -> Optional[str]:
+        if not self.per_speaker:
+            return await self.clip_language()
+        if seg.speaker_label in self._speakers:
+            return self._speakers[seg.speaker_label]
+
+        fallback = await self.clip_language()
+        if seg.end - seg.start < self.MIN_SPEAKER_SECONDS:
+            return fallback
+        detection = await self.usecase.transcription_service.detect_language(self.clip, seg.start, seg.end)
+        language = fallback
+        if detection and detection.probability >= self.usecase.language_min_probability:
+            language = detection.language
+        self._speakers[seg.speaker_label] = language
+        return language
 
 
 class TranscribeAudioUseCase:
     def __init__(self, 
-                 diarization_service: DiarizationPort,
+                 diarization_service: Optional[DiarizationPort],
                  transcription_service: TranscriptionPort,
                  audio_repository: AudioClipRepository,
-                 transcription_repository: TranscriptionTextRepository):
+                 transcription_repository: TranscriptionTextRepository,
+                 draft_model: Optional[str] = None,
+                 detect_language: bool = True,
+                 language_min_probability: float = 0.5,
+                 trace_store: Optional[TraceStore] = None,
+                 scheduler: Optional[PriorityScheduler] = None,
+                 turn_normalizer: Optional[TurnNormalizer] = None,
+                 speaker_segment_repository: Optional[SpeakerSegmentRepository] = None,
+                 word_timing_repository: Optional[WordTimingRepository] = None):
+        """
+        Args:
+            diarization_service: Diarization port, or None to transcribe clips as a single segment
+            draft_model: Model for the draft pass of progressive transcription
+                (None uses the final model with draft decoding)
+            detect_language: Detect each clip's language once and pin it for all its segments
+            language_min_probability: Detections below this probability are not pinned
+            trace_store: Keeps the trace timeline of recent jobs (None disables tracing)
+            scheduler: Shares the model between jobs segment by segment, by priority
+                class and tenant, and admits new jobs (None runs every segment at once)
+            turn_normalizer: Merges and filters diarized turns before they are transcribed
+                (None transcribes every diarized turn as it is)
+            speaker_segment_repository: Stores diarization results by audio content and
+                diarization settings, so re-transcriptions skip diarization (None always diarizes)
+            word_timing_repository: Keeps the word timings of final transcriptions for
+                exports (None discards them)
+        """
         self.diarization_service = diarization_service
         self.transcription_service = transcription_service
         self.audio_repository = audio_repository
         self.transcription_repository = transcription_repository
+        self.draft_model = draft_model
+        self.detect_language = detect_language
+        self.language_min_probability = language_min_probability
+        self.trace_store = trace_store
+        self.scheduler = scheduler
+        self.turn_normalizer = turn_normalizer
+        self.speaker_segment_repository = speaker_segment_repository
+        self.word_timing_repository = word_timing_repository
+        # clip_id -> running jobs (read by the storage sweeper's thread)
+        self._active_clips: Dict[str, int] = {}
+        self._active_lock = threading.Lock()
 
-    async def execute(self, clip_id: str) -> list[SpeakerSegment]:
+    def validate_options(self, model: Optional[str] = None, profile: Optional[str] = None) -> None:
         """
-        Transcribe audio file with diarization if available, otherwise do simple transcription
+        Check that the transcription service offers the requested model and decoding profile
+
+        Raises:
+            UnsupportedTranscriptionOptionError: If either is unknown
         """
-        clip = self.audio_repository.get(clip_id)
-        if not clip:
-            raise ValueError(f"Audio clip {clip_id} not found")
+        self.transcription_service.resolve_model(model)
+        self.transcription_service.resolve_profile(profile)
+
+    def admit(self, clip_id: Optional[str] = None) -> None:
+        """
+        Check that a transcription of the clip (or any new job, without clip_id)
+        may start now, in the current job class
 
+        Raises:
+            AdmissionRejectedError: If the queue ahead is too long
+        """
+        if clip_id is not None and self.transcription_repository.get_version(clip_id) is not None:
+            # Stored transcripts are served without the model
+            return
+        if self.scheduler is not None:
+            self.scheduler.admit()
+        if clip_id is not None:
+            self.audio_repository.prefetch(clip_id)
+
+    def prefetch(self, clip_id: str) -> None:
+        """Start fetching the audio of a clip that is queued for transcription"""
+        if self.transcription_repository.get_version(clip_id) is None:
+            self.audio_repository.prefetch(clip_id)
+
+    def active_clips(self) -> Set[str]:
+        """IDs of the clips with a running transcription job"""
+        with self._active_lock:
+            return set(self._active_clips)
+
+    @contextmanager
+    def _using_clip(self, clip_id: str) -> Iterator[None]:
+        """Keep the clip's audio available for the job running in the block"""
+        with self._active_lock:
+            self._active_clips[clip_id] = self._active_clips.get(clip_id, 0) + 1
         try:
-            # Try to use diarization service if available
-            segments = await self.diarization_service.diarize(clip)
+            with self.audio_repository.in_use(clip_id):
+                yield
+        finally:
+            with self._active_lock:
+                remaining = self._active_clips.pop(clip_id) - 1
+                if remaining:
+                    self._active_clips[clip_id] = remaining
 
-            # Get transcription for each segment
-            for seg in segments:
-                text = await self.transcription_service.transcribe(
-                    clip, seg.time_range.start, seg.time_range.end
-                )
-                # We'll attach the text directly to the segment since we don't have a separate TranscriptionText list
-                seg.text = text
+    async def record_use(self, clip_id: str) -> None:
+        """Count a transcript read as a use of the clip, so storage eviction keeps it"""
+        await asyncio.to_thread(self.audio_repository.touch, clip_id)
 
-            self.transcription_repository.save(clip_id, segments)
+    async def _get_clip(self, clip_id: str):
+        """Load a clip off the event loop (its audio may have to be downloaded)"""
+        return await asyncio.to_thread(self.audio_repository.get, clip_id)
 
-            return segments
+    @contextmanager
+    def _scheduled_job(self) -> Iterator[ScheduledJob]:
+        if self.scheduler is None:
+            yield ScheduledJob(current_job_class())
+            return
+        with self.scheduler.job() as job:
+            yield job
 
-        except Exception as e:
-            # If diarization fails, fall back to simple transcription
-            print(
-                f"Diarization failed: {str(e)}. Falling back to simple transcription.")
-            # Create a single segment for the entire audio
-            text = await self.transcription_service.transcribe(clip, 0, 0)
-
-            # Create a dummy segment
-            segment = SpeakerSegment(
-                audio_clip_id=clip.id,
-                start=0.0,
-                end=0.0,  # We don't know the duration
-                speaker_label="UNKNOWN"
-            )
-            segment.text = text
+    async def _clip_language(self, clip, language: Optional[str] = None) -> Optional[str]:
+        """
+        Language to pin for a clip: the requested one, else the clip's detected
+        language, detecting and storing it on first use
+        """
+        if language:
+            return None if language == AUTO_LANGUAGE else language
+        if not self.detect_language:
+            return None
+        if clip.language is None:
+            clip.language = await self.transcription_service.detect_language(clip)
+            if clip.language is not None:
+                self.audio_repository.update(clip)
+        if clip.language is not None and clip.language.probability >= self.language_min_probability:
+            return clip.language.language
+        return None
+
+    def _language_plan(self, clip, language: Optional[str], per_speaker_language: bool) -> _LanguagePlan:
+        return _LanguagePlan(self, clip, language, per_speaker_language)
+
+    async def _transcribe_whole_clip(
+        self,
+        clip,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> SpeakerSegment:
+        """Transcribe a clip as one segment without speaker information"""
+        text = await self._transcribe_text(clip, 0, 0, model, profile=profile, language=language)
+
+        return SpeakerSegment(
+            audio_clip_id=clip.id,
+            start=0.0,
+            end=clip.duration or 0.0,  # 0.0 when we don't know the duration
+            speaker_label="UNKNOWN",
+            text=text
+        )
 
-            return [segment]
+    @track_job("batch")
+    async def execute(
+        self,
+        clip_id: str,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False
+    ) -> list[SpeakerSegment]:
+        """
+        Transcribe audio file with diarization if available, otherwise do simple transcription
 
-    async def get_or_transcribe(self, clip_id: str):
+        Args:
+            clip_id: ID of the audio clip
+            model: Whisper model name, alias or quality preset (None for the default model)
+            profile: Decoding profile name (None for the service default)
+            language: Language code to pin ("auto" lets Whisper detect it per segment;
+                None uses the clip's detected language)
+            per_speaker_language: Detect the language of each speaker separately
+            profiler: Run the job's worker-thread steps under cProfile (reported in its trace)
+        """
+        with (
+            job_trace(self.trace_store, clip_id, "batch", profile=profiler),
+            self._scheduled_job() as job,
+            self._using_clip(clip_id)
+        ):
+            self.validate_options(model, profile)
+            clip = await self._get_clip(clip_id)
+            if not clip:
+                raise ValueError(f"Audio clip {clip_id} not found")
+            job.set_cost(clip.duration or 0.0)
+            languages = self._language_plan(clip, language, per_speaker_language)
+
+            if self.diarization_service is None:
+                segments = [await self._transcribe_whole_clip(clip, model, profile, await languages.clip_language())]
+                self.transcription_repository.save(clip_id, segments)
+                return segments
+
+            try:
+                # Try to use diarization service if available
+                segments = await self._diarize(clip)
+
+                # Get transcription for each segment
+                for seg in segments:
+                    text = await self._transcribe_text(
+                        clip, seg.start, seg.end, model, profile=profile,
+                        language=await languages.for_segment(seg)
+                    )
+                    # We'll attach the text directly to the segment since we don't have a separate TranscriptionText list
+                    seg.text = text
+
+                self.transcription_repository.save(clip_id, segments)
+
+                return segments
+
+            except Exception as e:
+                # If diarization fails, fall back to simple transcription
+                print(
+                    f"Diarization failed: {str(e)}. Falling back to simple transcription.")
+                # Create a single segment for the entire audio
+                return [await self._transcribe_whole_clip(clip, model, profile, await languages.clip_language())]
+
+    async def get_or_transcribe(
+        self,
+        clip_id: str,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False
+    ):
         """
         Get a transcription from the repository if it exists,
         otherwise transcribe the audio and save the result
 
         Args:
             clip_id: ID of the audio clip
+            model: Model used if the clip still needs transcribing
+            profile: Decoding profile used if the clip still needs transcribing
+            language: Language used if the clip still needs transcribing
+            per_speaker_language: Detect the language of each speaker separately
+            profiler: Run the job's worker-thread steps under cProfile (reported in its trace)
 
         Returns:
             List of transcription segments
         """
-        # First try to get existing transcription
-        transcription = self.transcription_repository.list(clip_id)
-        if transcription:
-            return transcription
+        # First try to get existing transcription (committed, possibly empty)
+        if self.transcription_repository.get_version(clip_id) is not None:
+            await self.record_use(clip_id)
+            return self.transcription_repository.list(clip_id) or SegmentTable(clip_id)
 
         # If no transcription exists, get the audio clip
-        audio_clip = self.audio_repository.get(clip_id)
+        audio_clip = await self._get_clip(clip_id)
         if not audio_clip:
             raise ValueError(f"Audio clip {clip_id} not found")
 
-        # Transcribe the audio
-        segments = await self.execute(audio_clip.file_path)
+        with job_trace(self.trace_store, clip_id, "batch", profile=profiler):
+            # Transcribe the audio (execute() saves the transcription)
+            segments = await self.execute(
+                clip_id, model=model, profile=profile, language=language, per_speaker_language=per_speaker_language
+            )
 
-        # Save the transcription
-        self.transcription_repository.save(clip_id, segments)
+            # Return the transcription
+            return segments
 
-        # Return the transcription
-        return segments
+    def get_trace(self, clip_id: str) -> Optional[JobTrace]:
+        """
+        Get the trace of the clip's most recent transcription job
+
+        Args:
+            clip_id: ID of the audio clip
+
+        Returns:
+            The JobTrace (possibly still running), or None if no recent job is traced
+        """
+        if self.trace_store is None:
+            return None
+        return self.trace_store.get(clip_id)
+
+    def get_transcription_version(self, clip_id: str) -> Optional[str]:
+        """
+        Get the version of a stored transcription, for cache validation
+
+        Args:
+            clip_id: ID of the audio clip
+
+        Returns:
+            Opaque version string, or None if the clip has no stored transcription
+        """
+        return self.transcription_repository.get_version(clip_id)
+
+    async def get_transcription_page(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> TranscriptPage:
+        """
+        Get one page of a transcription, transcribing the clip first if needed
+
+        Args:
+            clip_id: ID of the audio clip
+            start: Only segments ending after this time (seconds)
+            end: Only segments starting before this time (seconds)
+            speaker_label: Only segments of this speaker
+            offset: Number of matching segments to skip
+            limit: Page size (None returns all matching segments)
+
+        Returns:
+            TranscriptPage with the matching segments and the next offset, if any
+        """
+        if self.transcription_repository.get_version(clip_id) is None:
+            await self.get_or_transcribe(clip_id)
+        else:
+            await self.record_use(clip_id)
+
+        # Fetch one extra segment to find out whether another page follows
+        segments = self.transcription_repository.query(
+            clip_id,
+            start=start,
+            end=end,
+            speaker_label=speaker_label,
+            offset=offset,
+            limit=limit + 1 if limit is not None else None
+        )
+        next_offset = None
+        if limit is not None and len(segments) > limit:
+            segments = segments[:limit]
+            next_offset = offset + limit
+
+        return TranscriptPage(
+            segments=segments,
+            offset=offset,
+            limit=limit,
+            next_offset=next_offset,
+            version=self.transcription_repository.get_version(clip_id)
+        )
 
     async def delete_transcription(self, clip_id: str):
         """
@@ -104,64 +411,379 @@ class TranscribeAudioUseCase:
         success = self.transcription_repository.delete(clip_id)
         if not success:
             raise Exception(f"Deletion failed for clip {clip_id}")
+        if self.word_timing_repository is not None:
+            self.word_timing_repository.delete(clip_id)
         return True
 
-    async def execute_streaming(self, clip_id: str) -> AsyncGenerator[SpeakerSegment, None]:
+    @track_job("stream")
+    async def execute_streaming(
+        self,
+        clip_id: str,
+        resume_from: float = 0.0,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False
+    ) -> AsyncGenerator[SpeakerSegment, None]:
         """
         Stream transcription segments for a clip:
         1) attempt async diarization
         2) for each segment, do async transcription and yield formatted text
-        3) fallback to simple transcription if diarization fails
+        3) fallback to simple transcription if diarization fails before any segment
+           is produced (later failures are raised)
+
+        Args:
+            clip_id: ID of the audio clip
+            resume_from: Skip diarized segments ending at or before this time (seconds),
+                used to resume an interrupted job without re-transcribing finished segments
+            model: Whisper model name, alias or quality preset (None for the default model)
+            profile: Decoding profile name (None for the service default)
+            language: Language code to pin (see execute)
+            per_speaker_language: Detect the language of each speaker separately
+            profiler: Run the job's worker-thread steps under cProfile (reported in its trace)
         """
-        clip = self.audio_repository.get(clip_id)
-        if not clip:
-            raise ValueError(f"Audio clip {clip_id} not found")
+        with (
+            job_trace(self.trace_store, clip_id, "stream", profile=profiler),
+            self._scheduled_job() as job,
+            self._using_clip(clip_id)
+        ):
+            clip = await self._get_clip(clip_id)
+            if not clip:
+                raise ValueError(f"Audio clip {clip_id} not found")
+            job.set_cost(max(0.0, (clip.duration or 0.0) - resume_from))
+            languages = self._language_plan(clip, language, per_speaker_language)
+
+            if self.diarization_service is None:
+                yield await self._transcribe_whole_clip(clip, model, profile, await languages.clip_language())
+                return
+
+            produced = False
+            try:
+                # Stream diarization segments
+                async for seg in self._diarize_stream(clip):
+                    if resume_from and seg.end <= resume_from:
+                        continue
+
+                    segment_language = await languages.for_segment(seg)
+                    seg.text = await self._transcribe_text(
+                        clip, seg.start, seg.end, model, profile=profile, language=segment_language
+                    )
+                    produced = True
+                    yield seg
+
+            except Exception as e:
+                if produced or resume_from:
+                    # A whole-clip segment would overlap the segments already
+                    # produced; fail instead, so the job can be resumed
+                    raise
+                # Fallback: single-segment transcription
+                print(
+                    f"Diarization failed: {e}. Falling back to simple transcription.")
+                yield await self._transcribe_whole_clip(clip, model, profile, await languages.clip_language())
+
+    async def get_or_transcribe_streaming(
+        self,
+        clip_id: str,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False
+    ) -> AsyncGenerator[SpeakerSegment, None]:
+        """
+        If existing transcription exists, stream it.
+        Otherwise, stream a fresh transcription.
+
+        Each new segment is appended to the repository's segment log as soon as it
+        is produced and the log is committed once the stream completes. If a previous
+        job was interrupted, its persisted segments are replayed and transcription
+        resumes after the last finished segment.
+        """
+        if self.transcription_repository.get_version(clip_id) is not None:
+            # Committed transcripts (even empty ones) are never transcribed again
+            await self.record_use(clip_id)
+            for seg in self.transcription_repository.list(clip_id) or ():
+                yield seg
+            return
+
+        with job_trace(self.trace_store, clip_id, "stream", profile=profiler):
+            # Replay segments persisted by an interrupted job
+            pending = self.transcription_repository.list_pending(clip_id)
+            for seg in pending:
+                yield seg
+            resume_from = max(pending.ends, default=0.0)
+
+            async for seg in self.execute_streaming(
+                clip_id, resume_from=resume_from, model=model, profile=profile,
+                language=language, per_speaker_language=per_speaker_language
+            ):
+                # Appends fsync and commits re-index the transcript: keep both off the event loop
+                await asyncio.to_thread(self.transcription_repository.append, clip_id, seg)
+                yield seg
+
+            # Finalize the segment log (a clip without speech commits an empty transcript)
+            await asyncio.to_thread(self.transcription_repository.commit, clip_id)
+
+    async def _transcribe_text(
+        self,
+        clip,
+        start: float,
+        end: float,
+        model: Optional[str],
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> str:
+        """Transcribe one segment, waiting for a model slot when scheduled"""
+        async with self._model_slot(clip, start, end):
+            if self.word_timing_repository is not None and not draft:
+                text, words = await self.transcription_service.transcribe_timed(
+                    clip, start, end, model=model, profile=profile, language=language
+                )
+                self.word_timing_repository.append(str(clip.id), start, end, words)
+                return text
+            text_chunks = []
+            async for chunk in self.transcription_service.transcribe_stream(
+                clip, start, end, model=model, draft=draft, profile=profile, language=language
+            ):
+                text_chunks.append(chunk)
+            return " ".join(text_chunks)
+
+    @asynccontextmanager
+    async def _model_slot(self, clip, start: float, end: float):
+        if self.scheduler is None:
+            yield
+            return
+        async with self.scheduler.slot(max(0.0, (end or clip.duration or 0.0) - start)):
+            yield
+
+    def _diarization_key(self, clip) -> Optional[str]:
+        """Key of the clip's stored diarization result (None if results are not reused)"""
+        if self.speaker_segment_repository is None or not clip.content_hash:
+            return None
+        config = self.diarization_service.cache_key()
+        if config is None:
+            return None
+        return f"{clip.content_hash}-{hashlib.sha256(config.encode()).hexdigest()[:16]}"
 
+    def _stored_turns(self, clip, key: Optional[str]) -> Optional[SegmentTable]:
+        if key is None:
+            return None
+        turns = self.speaker_segment_repository.list(key)
+        DIARIZATION_CACHE_LOOKUPS.inc(result="miss" if turns is None else "hit")
+        if turns is not None:
+            turns.audio_clip_id = clip.id
+        return turns
+
+    async def _diarize(self, clip) -> list[SpeakerSegment]:
+        """The clip's (normalized) speaker turns, diarizing only if no stored result matches"""
+        key = self._diarization_key(clip)
+        turns = self._stored_turns(clip, key)
+        if turns is not None:
+            segments = list(turns)
+        else:
+            try:
+                segments = await self.diarization_service.diarize(clip)
+            except IncompleteDiarizationError as e:
+                # Use the parts that were diarized, but diarize again next time
+                print(f"Diarization incomplete: {e}")
+                segments = e.segments
+            else:
+                if key is not None and segments:
+                    self.speaker_segment_repository.save(key, segments)
+        if self.turn_normalizer is not None:
+            segments = list(self.turn_normalizer.normalize(segments, clip.id))
+        return segments
+
+    async def _diarize_stream(self, clip) -> AsyncGenerator[SpeakerSegment, None]:
+        """Stream the clip's (normalized) speaker turns, replaying a stored result if one matches"""
+        key = self._diarization_key(clip)
+        stored = self._stored_turns(clip, key)
+        turns = self._replay(stored) if stored is not None else self._diarize_and_store(clip, key)
+        if self.turn_normalizer is not None:
+            turns = self.turn_normalizer.normalize_stream(turns)
+        async for seg in turns:
+            yield seg
+
+    @staticmethod
+    async def _replay(turns: SegmentTable) -> AsyncGenerator[SpeakerSegment, None]:
+        for seg in turns:
+            yield seg
+
+    async def _diarize_and_store(self, clip, key: Optional[str]) -> AsyncGenerator[SpeakerSegment, None]:
+        turns = SegmentTable(clip.id)
         try:
-            # Stream diarization segments
             async for seg in self.diarization_service.diarize_stream(clip):
-                # Collect all text chunks into a single string
-                text_chunks = []
-                async for chunk in self.transcription_service.transcribe_stream(
-                    clip, seg.time_range.start, seg.time_range.end
-                ):
-                    text_chunks.append(chunk)
-
-                seg.text = " ".join(text_chunks)
+                turns.append(seg.start, seg.end, seg.speaker_label, None)
                 yield seg
+        except IncompleteDiarizationError as e:
+            # Keep the parts that were diarized, but diarize again next time
+            print(f"Diarization incomplete: {e}")
+            return
+        # Only complete, non-empty results are stored
+        if key is not None and turns:
+            self.speaker_segment_repository.save(key, turns)
 
+    async def _turns(self, clip, resume_from: float = 0.0) -> AsyncGenerator[SpeakerSegment, None]:
+        """Diarized speaker turns, or the whole clip as one turn without diarization"""
+        whole_clip = SpeakerSegment(
+            audio_clip_id=clip.id,
+            start=0.0,
+            end=clip.duration or 0.0,
+            speaker_label="UNKNOWN",
+            text=None
+        )
+        if self.diarization_service is None:
+            yield whole_clip
+            return
+
+        produced = False
+        try:
+            async for seg in self._diarize_stream(clip):
+                if resume_from and seg.end <= resume_from:
+                    continue
+                produced = True
+                yield seg
         except Exception as e:
-            # Fallback: single-segment transcription
+            if produced:
+                raise
             print(
                 f"Diarization failed: {e}. Falling back to simple transcription.")
-            text = await self.transcription_service.transcribe_stream(clip, 0, 0)
-            seg = SpeakerSegment(
-                audio_clip_id=clip.id,
-                start=0.0,
-                end=0.0,
-                speaker_label="UNKNOWN"
-            )
-            seg.text = text
-            yield seg
+            yield whole_clip
 
-    async def get_or_transcribe_streaming(self, clip_id: str) -> AsyncGenerator[SpeakerSegment, None]:
+    @track_job("progressive", audio_end=lambda update: update.segment.end)
+    async def execute_progressive(
+        self,
+        clip_id: str,
+        resume_from: float = 0.0,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        first_index: int = 0,
+        profiler: bool = False
+    ) -> AsyncGenerator[TranscriptUpdate, None]:
         """
-        If existing transcription exists, stream it.
-        Otherwise, stream a fresh transcription.
+        Two-pass streaming transcription.
+
+        Every speaker turn is first transcribed with the draft model and greedy
+        decoding and yielded as a DRAFT update. Meanwhile a background task
+        re-transcribes the turns in order with the final model; each result is
+        yielded as a FINAL update carrying the index of the draft it replaces.
+
+        Args:
+            clip_id: ID of the audio clip
+            resume_from: Skip diarized segments ending at or before this time (seconds)
+            model: Model for the final pass (None for the default model)
+            profile: Decoding profile for the final pass (None for the service default)
+            language: Language code to pin (see execute)
+            per_speaker_language: Detect the language of each speaker separately
+            first_index: Index of the first produced segment (when resuming)
+            profiler: Run the job's worker-thread steps under cProfile (reported in its trace)
         """
-        existing = self.transcription_repository.list(clip_id)
-        if existing:
-            for seg in existing:
-                yield seg
+        with (
+            job_trace(self.trace_store, clip_id, "progressive", profile=profiler),
+            self._scheduled_job() as job,
+            self._using_clip(clip_id)
+        ):
+            self.validate_options(model, profile)
+            self.validate_options(self.draft_model)
+            clip = await self._get_clip(clip_id)
+            if not clip:
+                raise ValueError(f"Audio clip {clip_id} not found")
+            job.set_cost(max(0.0, (clip.duration or 0.0) - resume_from))
+            languages = self._language_plan(clip, language, per_speaker_language)
+
+            to_refine: asyncio.Queue = asyncio.Queue()
+            refined: asyncio.Queue = asyncio.Queue()
+
+            async def refine():
+                try:
+                    while (item := await to_refine.get()) is not None:
+                        index, seg, segment_language = item
+                        text = await self._transcribe_text(
+                            clip, seg.start, seg.end, model, profile=profile, language=segment_language
+                        )
+                        await refined.put(TranscriptUpdate(FINAL, index, SpeakerSegment(
+                            audio_clip_id=clip.id,
+                            start=seg.start,
+                            end=seg.end,
+                            speaker_label=seg.speaker_label,
+                            text=text
+                        )))
+                finally:
+                    await refined.put(None)
+
+            refiner = asyncio.create_task(refine())
+            try:
+                index = first_index
+                async for seg in self._turns(clip, resume_from):
+                    segment_language = await languages.for_segment(seg)
+                    seg.text = await self._transcribe_text(
+                        clip, seg.start, seg.end, self.draft_model, draft=True, language=segment_language
+                    )
+                    yield TranscriptUpdate(DRAFT, index, seg)
+                    to_refine.put_nowait((index, seg, segment_language))
+                    index += 1
+
+                    # Pass on final results that landed while drafting
+                    while not refined.empty():
+                        update = refined.get_nowait()
+                        if update is None:
+                            await refiner
+                            return
+                        yield update
+
+                to_refine.put_nowait(None)
+                while (update := await refined.get()) is not None:
+                    yield update
+                await refiner
+            finally:
+                if not refiner.done():
+                    refiner.cancel()
+
+    async def get_or_transcribe_progressive(
+        self,
+        clip_id: str,
+        model: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False
+    ) -> AsyncGenerator[TranscriptUpdate, None]:
+        """
+        Progressive counterpart of get_or_transcribe_streaming.
+
+        A stored transcription is replayed as FINAL updates. Otherwise drafts and
+        finals are streamed; final segments are appended to the segment log in
+        order (so interrupted jobs resume as usual), the log is committed once
+        every final has landed and the drafts are kept via save_draft.
+        """
+        if self.transcription_repository.get_version(clip_id) is not None:
+            await self.record_use(clip_id)
+            for index, seg in enumerate(self.transcription_repository.list(clip_id) or ()):
+                yield TranscriptUpdate(FINAL, index, seg)
             return
 
-        segments = []
-        # No existing transcription: run streaming
-        async for seg in self.execute_streaming(clip_id):
-            segments.append(seg)
-            yield seg
+        with job_trace(self.trace_store, clip_id, "progressive", profile=profiler):
+            # Replay segments persisted by an interrupted job
+            pending = self.transcription_repository.list_pending(clip_id)
+            for index, seg in enumerate(pending):
+                yield TranscriptUpdate(FINAL, index, seg)
+            resume_from = max(pending.ends, default=0.0)
+
+            drafts = self.transcription_repository.list_draft(clip_id).filter(end=resume_from)
+            async for update in self.execute_progressive(
+                clip_id, resume_from=resume_from, model=model, profile=profile,
+                language=language, per_speaker_language=per_speaker_language, first_index=len(pending)
+            ):
+                if update.kind == DRAFT:
+                    drafts.append_segment(update.segment)
+                else:
+                    # Finals arrive in segment order from the single refinement task
+                    await asyncio.to_thread(self.transcription_repository.append, clip_id, update.segment)
+                yield update
 
-        if segments:
-            # Save the transcription
-            self.transcription_repository.save(clip_id, segments)
-        return
\ No newline at end of file
+            await asyncio.to_thread(self.transcription_repository.save_draft, clip_id, drafts)
+            await asyncio.to_thread(self.transcription_repository.commit, clip_id)
@@ -0,0 +1,273 @@
+"""
+HTTP load generator for the API in app.py.
+
+Each virtual user repeatedly uploads a clip and transcribes it through one of
+the transcription endpoints: a blocking POST, an SSE stream or a progressive
+SSE stream ("mixed" rotates through all three). Reports latency percentiles
+and throughput per operation and the time to the first streamed segment.
+
+Start the server with CONTAINER_PROFILE=fake to load-test without models, or
+pass --spawn to have this script start one (uvicorn, fake profile, temporary
+storage) for the duration of the run.
+
+Usage:
+    python -m benchmarks.load_test [--url http://localhost:8000 | --spawn] [--users 8]
+        [--iterations 100 | --duration 60] [--mode mixed] [--audio test.wav] [--output results.json]
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.pipeline_benchmark import BUNDLED_CLIP, summarize
+
+OPERATIONS = ("transcribe", "stream", "progressive")
+
+
+class LoadClient:
+    """Minimal HTTP/1.1 client for one virtual user (one keep-alive connection)"""
+    def __init__(self, url: str, timeout: float):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._connection: Optional[http.client.HTTPConnection] = None
+
+    def _request(self, method: str, path: str, body: bytes = None, headers: Dict[str, str] = None):
+        if self._connection is None:
+            self._connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            self._connection.request(method, path, body=body, headers=headers or {})
+            return self._connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def call(self, method: str, path: str, body: bytes = None, headers: Dict[str, str] = None) -> Tuple[int, bytes]:
+        response = self._request(method, path, body, headers)
+        return response.status, response.read()
+
+    def stream(self, path: str, began: float) -> Tuple[int, Optional[float]]:
+        """Read an SSE response to the end; returns the status and the time to its first event"""
+        response = self._request("GET", path, headers={"Accept": "text/event-stream"})
+        first_event = None
+        while True:
+            line = response.readline()
+            if not line:
+                break
+            if first_event is None and line.startswith((b"data:", b"event:")):
+                first_event = time.perf_counter() - began
+        return response.status, first_event
+
+    def upload(self, filename: str, audio: bytes) -> Tuple[int, bytes]:
+        boundary = uuid.uuid4().hex
+        body = b"".join([
+            f"--{boundary}\r\n".encode(),
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'.encode(),
+            b"Content-Type: audio/wav\r\n\r\n",
+            audio,
+            f"\r\n--{boundary}--\r\n".encode(),
+        ])
+        return self.call("POST", "/api/audio", body, {"Content-Type": f"multipart/form-data; boundary={boundary}"})
+
+
+class Recorder:
+    """Thread-safe collection of per-operation samples"""
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.first_segments: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, began: float, status: Optional[int], first_segment: Optional[float] = None) -> bool:
+        latency = time.perf_counter() - began
+        with self._lock:
+            if status is None or status >= 400:
+                self.errors[operation][str(status or "connection")] += 1
+                return False
+            self.latencies[operation].append(latency)
+            if first_segment is not None:
+                self.first_segments[operation].append(first_segment)
+            return True
+
+
+def _run_iteration(client: LoadClient, recorder: Recorder, operation: str, audio: bytes) -> None:
+    began = time.perf_counter()
+    try:
+        status, body = client.upload("load_test.wav", audio)
+    except (http.client.HTTPException, OSError):
+        status, body = None, b""
+    if not recorder.record("upload", began, status):
+        return
+    clip_id = json.loads(body)["clip_id"]
+
+    began = time.perf_counter()
+    first_segment = None
+    try:
+        if operation == "transcribe":
+            status, _ = client.call("POST", f"/api/transcribe/{clip_id}")
+        else:
+            query = "?progressive=true" if operation == "progressive" else ""
+            status, first_segment = client.stream(f"/api/transcribe/{clip_id}/stream{query}", began)
+    except (http.client.HTTPException, OSError):
+        status = None
+    recorder.record(operation, began, status, first_segment)
+
+
+def run_load(args: argparse.Namespace, audio: bytes) -> dict:
+    recorder = Recorder()
+    operations = OPERATIONS if args.mode == "mixed" else (args.mode,)
+    counter = iter(range(args.iterations)) if args.iterations else None
+    counter_lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration if args.duration else None
+
+    def next_iteration() -> Optional[int]:
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        if counter is None:
+            return 0
+        with counter_lock:
+            return next(counter, None)
+
+    def user(index: int) -> None:
+        client = LoadClient(args.url, args.timeout)
+        done = 0
+        try:
+            while next_iteration() is not None:
+                # Users start on different operations so "mixed" load is interleaved
+                operation = operations[(index + done) % len(operations)]
+                _run_iteration(client, recorder, operation, audio)
+                done += 1
+        finally:
+            client.close()
+
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        for future in [pool.submit(user, index) for index in range(args.users)]:
+            future.result()
+    wall = time.perf_counter() - began
+
+    with wave.open(args.audio, "rb") as wav:
+        audio_seconds = wav.getnframes() / float(wav.getframerate())
+    transcriptions = sum(len(recorder.latencies.get(operation, ())) for operation in OPERATIONS)
+    return {
+        "wall_s": wall,
+        "users": args.users,
+        "transcriptions": transcriptions,
+        "transcriptions_per_s": transcriptions / wall if wall else None,
+        # Seconds of audio transcribed per wall-clock second
+        "audio_throughput": transcriptions * audio_seconds / wall if wall else None,
+        "operations": {
+            operation: {
+                "count": len(latencies),
+                "per_s": len(latencies) / wall if wall else None,
+                "latency_s": summarize(latencies),
+                "first_segment_s": (
+                    summarize(recorder.first_segments[operation])
+                    if recorder.first_segments.get(operation) else None
+                ),
+            }
+            for operation, latencies in sorted(recorder.latencies.items())
+        },
+        "errors": {operation: dict(counts) for operation, counts in recorder.errors.items()},
+    }
+
+
+def _wait_until_ready(url: str, timeout: float) -> None:
+    client = LoadClient(url, timeout=5.0)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            status, _ = client.call("GET", "/api/health/ready")
+            if status == 200:
+                return
+        except (http.client.HTTPException, OSError):
+            pass
+        finally:
+            client.close()
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become ready within {timeout:.0f} s")
+
+
+def spawn_server(port: int, storage_path: str) -> subprocess.Popen:
+    """Start the API with the fake container profile and temporary storage"""
+    env = dict(
+        os.environ,
+        CONTAINER_PROFILE="fake",
+        AUDIO_STORAGE_PATH=os.path.join(storage_path, "audio"),
+        TRANSCRIPTION_STORAGE_PATH=os.path.join(storage_path, "transcripts"),
+        SEARCH_INDEX_PATH=os.path.join(storage_path, "search_index.db"),
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load test for the transcription API")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--spawn", action="store_true",
+                        help="Start a server with CONTAINER_PROFILE=fake on the --url port for the run")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent virtual users")
+    parser.add_argument("--iterations", type=int, default=100, help="Upload+transcribe iterations in total")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds instead of --iterations")
+    parser.add_argument("--mode", choices=(*OPERATIONS, "mixed"), default="mixed")
+    parser.add_argument("--audio", default=BUNDLED_CLIP, help="WAV file uploaded by every iteration")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+    if args.duration:
+        args.iterations = None
+
+    with open(args.audio, "rb") as f:
+        audio = f.read()
+
+    with tempfile.TemporaryDirectory() as storage_path:
+        server = spawn_server(urlsplit(args.url).port or 80, storage_path) if args.spawn else None
+        try:
+            _wait_until_ready(args.url, timeout=60.0)
+            results = run_load(args, audio)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    for operation, stats in results["operations"].items():
+        latency = stats["latency_s"]
+        line = (
+            f"{operation:>12} | {stats['count']:>6} ok | {stats['per_s']:.2f}/s "
+            f"| p50 {latency['p50']:.3f} s | p95 {latency['p95']:.3f} s | p99 {latency['p99']:.3f} s"
+        )
+        if stats["first_segment_s"]:
+            line += f" | first segment p50 {stats['first_segment_s']['p50']:.3f} s p95 {stats['first_segment_s']['p95']:.3f} s"
+        print(line)
+    print(
+        f"{results['transcriptions']} transcriptions in {results['wall_s']:.1f} s "
+        f"({results['audio_throughput']:.1f}x real time); errors: {results['errors'] or 'none'}"
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
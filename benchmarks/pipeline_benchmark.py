@@ -0,0 +1,300 @@
+"""
+Benchmark the transcription pipeline without models.
+
+Runs the real TranscribeAudioUseCase and repositories against synthetic
+multi-speaker audio (plus the bundled test.wav), with FakeDiarizationAdapter
+and FakeTranscriptionAdapter standing in for Pyannote and Whisper. The fake
+transcription reads each requested window of the WAV file like the real
+adapter, then returns filler text after an optional simulated decoding time.
+
+For every clip, mode (batch, stream, progressive) and concurrency level it
+records end-to-end throughput and latency, time to first segment, per-stage
+durations and throughput (from the job traces), the Python memory peak and
+event-loop lag.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark [--lengths 30 120 600] [--concurrency 1 4 8]
+        [--modes batch stream progressive] [--storage jsonl] [--output results.json]
+"""
+import argparse
+import array
+import asyncio
+import io
+import json
+import math
+import os
+import platform
+import random
+import resource
+import tempfile
+import time
+import tracemalloc
+import wave
+from collections import defaultdict
+from typing import List, Optional
+
+from application.use_cases.transcribe_audio_usecase import TranscribeAudioUseCase
+from domain.audio_clip import AudioClip
+from interfaces.outbound.diarization.fake_diarization_adapter import FakeDiarizationAdapter
+from interfaces.outbound.repositories.columnar_repository import ColumnarTranscriptionTextRepository
+from interfaces.outbound.repositories.file_system_repository import (
+    FileSystemAudioClipRepository, FileSystemTranscriptionTextRepository
+)
+from interfaces.outbound.repositories.sqlite_repository import SQLiteTranscriptionRepository
+from interfaces.outbound.transcription.fake_transcription_adapter import FakeTranscriptionAdapter
+from shared.utils.tracing import TraceStore
+
+SAMPLE_RATE = 16000
+BUNDLED_CLIP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test.wav")
+MODES = ("batch", "stream", "progressive")
+
+
+def synthetic_wav(seconds: float, speakers: int = 3, seed: int = 0) -> bytes:
+    """
+    Mono 16 kHz 16-bit WAV of alternating speaker turns (2-8 s) separated by
+    short silences. Each speaker is a harmonic tone at its own pitch with a
+    syllable-rate envelope.
+    """
+    rng = random.Random(seed)
+    # One second of "speech" per speaker, tiled to build the turns
+    voices = []
+    for speaker in range(speakers):
+        pitch = 110.0 + 55.0 * speaker
+        voices.append(array.array("h", (
+            int(6000 * (0.6 + 0.4 * math.sin(2 * math.pi * 4.0 * i / SAMPLE_RATE))
+                * (math.sin(2 * math.pi * pitch * i / SAMPLE_RATE)
+                   + 0.5 * math.sin(4 * math.pi * pitch * i / SAMPLE_RATE)) / 1.5)
+            for i in range(SAMPLE_RATE)
+        )))
+
+    total = int(seconds * SAMPLE_RATE)
+    samples = array.array("h")
+    speaker = 0
+    while len(samples) < total:
+        turn = int(rng.uniform(2.0, 8.0) * SAMPLE_RATE)
+        while turn > 0:
+            step = min(turn, SAMPLE_RATE)
+            samples.extend(voices[speaker][:step])
+            turn -= step
+        samples.extend(array.array("h", bytes(2 * int(rng.uniform(0.3, 1.0) * SAMPLE_RATE))))
+        speaker = (speaker + rng.randrange(1, speakers)) % speakers
+    del samples[total:]
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+def summarize(values: List[float]) -> dict:
+    """Mean, percentiles and maximum of a list of durations (None when empty)"""
+    return {
+        "mean": sum(values) / len(values) if values else None,
+        "p50": _percentile(values, 50),
+        "p95": _percentile(values, 95),
+        "p99": _percentile(values, 99),
+        "max": max(values, default=None),
+    }
+
+
+async def _monitor_loop_lag(samples: List[float], stop: asyncio.Event, interval: float = 0.01) -> None:
+    """Record how late the event loop wakes a sleeping coroutine"""
+    while not stop.is_set():
+        began = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - began - interval))
+
+
+def _transcription_repository(storage: str, path: str):
+    if storage == "sqlite":
+        os.makedirs(path, exist_ok=True)
+        return SQLiteTranscriptionRepository(os.path.join(path, "transcriptions.db"))
+    if storage == "columnar":
+        return ColumnarTranscriptionTextRepository(path)
+    return FileSystemTranscriptionTextRepository(path)
+
+
+async def _run_job(usecase: TranscribeAudioUseCase, mode: str, clip_id: str) -> dict:
+    began = time.perf_counter()
+    first_segment = None
+    if mode == "batch":
+        await usecase.execute(clip_id)
+    else:
+        updates = (
+            usecase.get_or_transcribe_streaming(clip_id) if mode == "stream"
+            else usecase.get_or_transcribe_progressive(clip_id)
+        )
+        async for _ in updates:
+            if first_segment is None:
+                first_segment = time.perf_counter() - began
+    return {"latency": time.perf_counter() - began, "first_segment": first_segment}
+
+
+def _stage_stats(traces) -> dict:
+    stages = defaultdict(list)
+    audio = defaultdict(float)
+    for trace in traces:
+        for span in trace.to_dict()["spans"]:
+            stages[span["name"]].append(span["duration"])
+            attrs = span["attrs"]
+            if "audio_seconds" in attrs:
+                audio[span["name"]] += attrs["audio_seconds"]
+            elif "start" in attrs and "end" in attrs:
+                audio[span["name"]] += max(0.0, attrs["end"] - attrs["start"])
+    result = {}
+    for name, durations in sorted(stages.items()):
+        total = sum(durations)
+        result[name] = {
+            "count": len(durations),
+            "total_s": total,
+            **{f"{key}_s": value for key, value in summarize(durations).items()},
+            # Seconds of audio processed per second spent in the stage
+            "audio_throughput": audio[name] / total if audio.get(name) and total else None,
+        }
+    return result
+
+
+async def run_scenario(
+    clip_name: str,
+    audio: bytes,
+    mode: str,
+    concurrency: int,
+    args: argparse.Namespace,
+    storage_path: str
+) -> dict:
+    audio_repository = FileSystemAudioClipRepository(os.path.join(storage_path, "audio"))
+    transcription_repository = _transcription_repository(
+        args.storage, os.path.join(storage_path, "transcripts")
+    )
+    trace_store = TraceStore(concurrency)
+    usecase = TranscribeAudioUseCase(
+        FakeDiarizationAdapter(
+            segment_duration=args.turn_seconds,
+            total_duration=None,
+            delay=args.diarization_delay
+        ),
+        FakeTranscriptionAdapter(
+            seconds_per_audio_second=args.decode_seconds_per_audio_second,
+            cpu_seconds_per_audio_second=args.decode_cpu_seconds_per_audio_second
+        ),
+        audio_repository,
+        transcription_repository,
+        draft_model=None,
+        trace_store=trace_store
+    )
+
+    clips = [
+        audio_repository.save(AudioClip(title=clip_name, filename=f"{clip_name}.wav", content=audio))
+        for _ in range(concurrency)
+    ]
+    audio_seconds = clips[0].duration or 0.0
+
+    lag: List[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_loop_lag(lag, stop))
+    tracemalloc.reset_peak()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    began = time.perf_counter()
+    jobs = await asyncio.gather(*(_run_job(usecase, mode, str(clip.id)) for clip in clips))
+    wall = time.perf_counter() - began
+    memory_peak = tracemalloc.get_traced_memory()[1] - memory_before
+    stop.set()
+    await monitor
+
+    traces = [trace_store.get(str(clip.id)) for clip in clips]
+    for clip in clips:
+        transcription_repository.delete(str(clip.id))
+        audio_repository.delete(str(clip.id))
+
+    first_segments = [job["first_segment"] for job in jobs if job["first_segment"] is not None]
+    return {
+        "clip": clip_name,
+        "audio_seconds": audio_seconds,
+        "mode": mode,
+        "concurrency": concurrency,
+        "wall_s": wall,
+        # Seconds of audio transcribed per wall-clock second, across all jobs
+        "audio_throughput": audio_seconds * concurrency / wall if wall else None,
+        "latency_s": summarize([job["latency"] for job in jobs]),
+        "first_segment_s": summarize(first_segments) if first_segments else None,
+        "stages": _stage_stats(trace for trace in traces if trace is not None),
+        "loop_lag_s": summarize(lag),
+        "memory": {
+            "python_peak_bytes": memory_peak,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> List[dict]:
+    clips = [(f"synthetic-{seconds:g}s", synthetic_wav(seconds, seed=int(seconds))) for seconds in args.lengths]
+    if not args.no_bundled and os.path.exists(BUNDLED_CLIP):
+        with open(BUNDLED_CLIP, "rb") as f:
+            clips.append(("test.wav", f.read()))
+
+    results = []
+    tracemalloc.start()
+    try:
+        with tempfile.TemporaryDirectory() as storage_path:
+            for clip_name, audio in clips:
+                for mode in args.modes:
+                    for concurrency in args.concurrency:
+                        result = await run_scenario(clip_name, audio, mode, concurrency, args, storage_path)
+                        results.append(result)
+                        print(
+                            f"{clip_name:>18} {mode:>11} x{concurrency:<3} "
+                            f"| wall {result['wall_s']:.3f} s "
+                            f"| {result['audio_throughput']:.1f}x real time "
+                            f"| p95 latency {result['latency_s']['p95']:.3f} s "
+                            f"| max loop lag {result['loop_lag_s']['max'] or 0.0:.4f} s "
+                            f"| peak {result['memory']['python_peak_bytes'] / 1e6:.1f} MB"
+                        )
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model-free transcription pipeline benchmark")
+    parser.add_argument("--lengths", type=float, nargs="+", default=[30, 120, 600],
+                        help="Synthetic clip lengths in seconds")
+    parser.add_argument("--no-bundled", action="store_true", help="Skip the bundled test.wav")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--storage", choices=("jsonl", "columnar", "sqlite"), default="jsonl")
+    parser.add_argument("--turn-seconds", type=float, default=5.0, help="Length of the fake speaker turns")
+    parser.add_argument("--diarization-delay", type=float, default=0.0,
+                        help="Simulated diarization time per turn in seconds")
+    parser.add_argument("--decode-seconds-per-audio-second", type=float, default=0.0,
+                        help="Simulated decoding time per second of audio")
+    parser.add_argument("--decode-cpu-seconds-per-audio-second", type=float, default=0.0,
+                        help="CPU burned by simulated decoding per second of audio")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "environment": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                },
+                "config": vars(args),
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compare transcript storage formats by size and load time.
+
+Writes synthetic transcripts with the JSONL (FileSystemTranscriptionTextRepository)
+and columnar (ColumnarTranscriptionTextRepository) repositories, then times a full
+load, a time-window query and random access by index.
+
+Usage:
+    python -m benchmarks.transcript_storage_benchmark [--segments 1000 10000 100000] [--output results.json]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from domain.speaker_segment import SpeakerSegment
+from interfaces.outbound.repositories.columnar_repository import ColumnarTranscriptionTextRepository
+from interfaces.outbound.repositories.file_system_repository import FileSystemTranscriptionTextRepository
+
+WORDS = "the quick brown fox jumps over a lazy dog while speakers take turns talking".split()
+
+
+def synthetic_segments(clip_id: str, count: int, seed: int = 0) -> list[SpeakerSegment]:
+    rng = random.Random(seed)
+    segments, t = [], 0.0
+    for _ in range(count):
+        duration = rng.uniform(0.5, 12.0)
+        segments.append(SpeakerSegment(
+            audio_clip_id=clip_id,
+            start=t,
+            end=t + duration,
+            speaker_label=f"SPEAKER_{rng.randrange(4):02d}",
+            text=" ".join(rng.choice(WORDS) for _ in range(int(duration * 2.5) + 1))
+        ))
+        t += duration + rng.uniform(0.0, 1.0)
+    return segments
+
+
+def _timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def benchmark(count: int, storage_path: str) -> dict:
+    clip_id = f"bench-{count}"
+    segments = synthetic_segments(clip_id, count)
+    duration = segments[-1].end
+    window = (duration / 2, duration / 2 + 60.0)
+    probes = random.Random(1).sample(range(count), min(count, 1000))
+
+    jsonl = FileSystemTranscriptionTextRepository(os.path.join(storage_path, "jsonl"))
+    columnar = ColumnarTranscriptionTextRepository(os.path.join(storage_path, "columnar"))
+    jsonl.save(clip_id, segments)
+    columnar.save(clip_id, segments)
+
+    def random_access_columnar():
+        with columnar.open_transcript(clip_id) as transcript:
+            for i in probes:
+                transcript.segment(i)
+
+    def random_access_jsonl():
+        loaded = jsonl.list(clip_id)
+        for i in probes:
+            loaded[i]
+
+    return {
+        "segments": count,
+        "jsonl": {
+            "bytes": os.path.getsize(jsonl._committed_path(clip_id)),
+            "load_s": _timed(lambda: jsonl.list(clip_id)),
+            "window_query_s": _timed(lambda: jsonl.query(clip_id, start=window[0], end=window[1])),
+            "random_access_s": _timed(random_access_jsonl),
+        },
+        "columnar": {
+            "bytes": os.path.getsize(columnar._committed_path(clip_id)),
+            "load_s": _timed(lambda: columnar.list(clip_id)),
+            "window_query_s": _timed(lambda: columnar.query(clip_id, start=window[0], end=window[1])),
+            "random_access_s": _timed(random_access_columnar),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcript storage format benchmark")
+    parser.add_argument("--segments", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as storage_path:
+        results = [benchmark(count, storage_path) for count in args.segments]
+
+    for result in results:
+        j, c = result["jsonl"], result["columnar"]
+        print(
+            f"{result['segments']:>8} segments | size {j['bytes']:>11} -> {c['bytes']:>10} B "
+            f"| load {j['load_s']:.4f} -> {c['load_s']:.4f} s "
+            f"| window {j['window_query_s']:.4f} -> {c['window_query_s']:.4f} s "
+            f"| random {j['random_access_s']:.4f} -> {c['random_access_s']:.4f} s"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
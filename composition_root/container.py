@@ -1,73 +1,316 @@
 import logging
-from typing import Dict, Type, Any
+from typing import Dict, Type, Any, Optional
 
 # Domain ports
 from domain.ports.diarization_port import DiarizationPort
 from domain.ports.transcription_port import TranscriptionPort
+from domain.ports.search_index_port import SearchIndexPort
+from domain.ports.speaker_embedding_port import SpeakerEmbeddingPort
+from domain.turn_normalizer import TurnNormalizer
 
 # Application use cases
 from application.use_cases.transcribe_audio_usecase import TranscribeAudioUseCase
 from application.use_cases.store_audio_usecase import StoreAudioUseCase
+from application.use_cases.sweep_storage_usecase import SweepStorageUseCase
+from application.use_cases.export_transcript_usecase import ExportTranscriptUseCase
+from application.use_cases.search_transcripts_usecase import SearchTranscriptsUseCase
+from application.use_cases.batch_transcribe_usecase import BatchTranscribeUseCase
+from application.use_cases.live_transcribe_usecase import LiveTranscribeUseCase
 
 # Outbound adapters
 from interfaces.outbound.transcription.whisper_adapter import WhisperAdapter
-from interfaces.outbound.transcription.whisper_model import get_whisper_model
-
+from interfaces.outbound.transcription.whisper_model_registry import WhisperModelRegistry, get_whisper_model_registry
+from interfaces.outbound.transcription.fake_transcription_adapter import FakeTranscriptionAdapter
 from interfaces.outbound.diarization.chunked_diarization_adapter import ChunkedDiarizationAdapter
-from interfaces.outbound.diarization.pyannote_model import load_pyannote_pipeline
+from interfaces.outbound.diarization.fake_diarization_adapter import FakeDiarizationAdapter
+from interfaces.outbound.diarization.pyannote_embedding_adapter import PyannoteEmbeddingAdapter
+from interfaces.outbound.diarization.fake_embedding_adapter import FakeEmbeddingAdapter
 
 from interfaces.outbound.repositories.file_system_repository import FileSystemAudioClipRepository
 from interfaces.outbound.repositories.file_system_repository import FileSystemTranscriptionTextRepository
+from interfaces.outbound.repositories.file_system_repository import FileSystemSpeakerSegmentRepository
+from interfaces.outbound.repositories.file_system_repository import FileSystemWordTimingRepository
+from interfaces.outbound.repositories.file_system_repository import FileSystemTranscriptExportRepository
+from interfaces.outbound.repositories.columnar_repository import ColumnarTranscriptionTextRepository
+from interfaces.outbound.repositories.object_store_repository import ObjectStoreAudioClipRepository
+from interfaces.outbound.object_store.object_store_client import ObjectStoreClient
+from interfaces.outbound.object_store.local_object_store_client import LocalObjectStoreClient
+from interfaces.outbound.object_store.s3_object_store_client import S3ObjectStoreClient
+
+from interfaces.outbound.search.sqlite_fts_search_adapter import SQLiteFTSSearchAdapter
 
 # Domain repositories
 from domain.repositories import AudioClipRepository, TranscriptionTextRepository
 
+# Model lifecycle
+from shared.utils.model_lifecycle import ModelLifecycleManager
+from shared.utils.tracing import TraceStore
+from shared.utils.audio_cache import DecodedAudioCache
+from shared.utils.disk_cache import DiskLRUCache
+from shared.utils.fair_scheduler import FairScheduler
+from shared.utils.priority_scheduler import PriorityScheduler
+from shared.utils.resource_governor import get_resource_governor
+from shared.utils.periodic_task import PeriodicTask
+
 # Configuration
-from config import AUDIO_STORAGE_PATH, PYANNOTE_MODEL, TRANSCRIPTION_STORAGE_PATH
+from config import (
+    AUDIO_STORAGE_PATH, PYANNOTE_MODEL, TRANSCRIPTION_STORAGE_PATH, TRANSCRIPTION_STORAGE_FORMAT,
+    SEARCH_INDEX_PATH, SPEAKER_SEGMENT_STORAGE_PATH, ENABLE_DIARIZATION, PROGRESSIVE_DRAFT_MODEL, DECODING_PROFILE,
+    WHISPER_LANGUAGE, LANGUAGE_DETECTION, LANGUAGE_DETECTION_WINDOWS, LANGUAGE_DETECTION_WINDOW_SECONDS,
+    LANGUAGE_MIN_PROBABILITY, TRACE_MAX_JOBS, CONTAINER_PROFILE, FAKE_SECONDS_PER_AUDIO_SECOND,
+    FAKE_CPU_SECONDS_PER_AUDIO_SECOND, FAKE_DIARIZATION_DELAY, AUDIO_CACHE_MB, BATCH_WORKERS, BATCH_MAX_CLIPS,
+    LIVE_PARTIAL_INTERVAL_SECONDS, LIVE_SILENCE_MS, LIVE_SILENCE_THRESH_DB, LIVE_MAX_UTTERANCE_SECONDS,
+    LIVE_SPEAKER_SIMILARITY, LIVE_MAX_SPEAKERS, MODEL_SLOTS, ADMISSION_MAX_WAIT_SECONDS,
+    SCHEDULER_SECONDS_PER_AUDIO_SECOND, DIARIZATION_MAX_CHUNK_WORKERS, TURN_NORMALIZATION, TURN_MERGE_GAP_SECONDS,
+    TURN_MIN_SECONDS, TURN_MAX_SECONDS, STORAGE_TTL_HOURS, STORAGE_QUOTA_MB, STORAGE_SWEEP_INTERVAL_SECONDS,
+    AUDIO_STORAGE_BACKEND, OBJECT_STORE_BUCKET, OBJECT_STORE_ENDPOINT_URL, OBJECT_STORE_REGION, OBJECT_STORE_PATH,
+    OBJECT_STORE_PREFIX, OBJECT_STORE_PART_SIZE_MB, AUDIO_DISK_CACHE_PATH, AUDIO_DISK_CACHE_MB, AUDIO_PREFETCH_WORKERS,
+    WORD_TIMING_STORAGE_PATH, EXPORT_CACHE_PATH
+)
 
 logger = logging.getLogger(__name__)
 
+
+def _load_pyannote():
+    # Imported lazily: pulling in pyannote/torch alone takes seconds
+    from interfaces.outbound.diarization.pyannote_model import load_pyannote_pipeline
+    return load_pyannote_pipeline(PYANNOTE_MODEL)
+
+
+def _load_whisper():
+    # Preloads the default model into the shared registry
+    return get_whisper_model_registry().get()
+
 class Container:
     """
     Dependency injection container for the application.
     Follows the composition root pattern in hexagonal architecture.
+
+    Models are loaded in parallel on background threads by the
+    ModelLifecycleManager; adapters receive ModelHandles and wait for their
+    model on first use, so routes that need no model serve immediately.
+
+    The "fake" profile wires FakeDiarizationAdapter and FakeTranscriptionAdapter
+    instead, so the service runs (e.g. under load tests) without any model.
     """
-    def __init__(self):
+    FAKE_PROFILE = "fake"
+
+    def __init__(self, profile: str = CONTAINER_PROFILE):
+        self.profile = profile
+
         # Initialize repositories (outbound adapters)
         logger.info("Pre-initializing audio repository...")
-        self._audio_repository = FileSystemAudioClipRepository(AUDIO_STORAGE_PATH)
+        self._audio_repository = self._create_audio_repository()
         logger.info("Audio repository initialized")
         
+        logger.info("Pre-initializing search index...")
+        self._search_index = SQLiteFTSSearchAdapter(SEARCH_INDEX_PATH)
+        logger.info("Search index initialized")
+
         logger.info("Pre-initializing transcription repository...")
-        self._transcription_repository = FileSystemTranscriptionTextRepository(TRANSCRIPTION_STORAGE_PATH)
+        transcription_repository_class = (
+            ColumnarTranscriptionTextRepository
+            if TRANSCRIPTION_STORAGE_FORMAT == "columnar"
+            else FileSystemTranscriptionTextRepository
+        )
+        self._transcription_repository = transcription_repository_class(
+            TRANSCRIPTION_STORAGE_PATH,
+            search_index=self._search_index
+        )
         logger.info("Transcription repository initialized")
 
-        # Initialize diarization service (outbound adapter)
-        logger.info("Pre-initializing diarization service...")
-        pipeline = load_pyannote_pipeline(PYANNOTE_MODEL)
-        self._diarization_service = ChunkedDiarizationAdapter(pipeline)
-        logger.info("Diarization service initialized")
+        # Diarization results outlive transcripts: re-transcribing the same audio only costs ASR
+        self._speaker_segment_repository = (
+            FileSystemSpeakerSegmentRepository(SPEAKER_SEGMENT_STORAGE_PATH)
+            if SPEAKER_SEGMENT_STORAGE_PATH else None
+        )
 
-        # Initialize transcription service (outbound adapter)
-        logger.info("Pre-initializing transcription service...")
-        whisper_model = get_whisper_model()
-        self._transcription_service = WhisperAdapter(whisper_model)
-        logger.info("Transcription service initialized")
+        # Kept next to transcripts for subtitle and text exports
+        self._word_timing_repository = (
+            FileSystemWordTimingRepository(WORD_TIMING_STORAGE_PATH) if WORD_TIMING_STORAGE_PATH else None
+        )
+        self._export_repository = (
+            FileSystemTranscriptExportRepository(EXPORT_CACHE_PATH) if EXPORT_CACHE_PATH else None
+        )
+
+        if profile == self.FAKE_PROFILE:
+            self._init_fake_services()
+        else:
+            self._init_model_services()
 
         # Initialize use cases with their dependencies
         logger.info("Pre-initializing store audio usecase...")
-        self._store_audio_usecase = StoreAudioUseCase(self._audio_repository)
+        self._store_audio_usecase = StoreAudioUseCase(
+            self._audio_repository,
+            self._transcription_repository,
+            word_timing_repository=self._word_timing_repository,
+            export_repository=self._export_repository
+        )
         logger.info("Store audio usecase initialized")
 
+        # Model slots shared by file, batch and live transcription
+        self._scheduler = PriorityScheduler(
+            MODEL_SLOTS,
+            max_wait=ADMISSION_MAX_WAIT_SECONDS,
+            seconds_per_audio_second=SCHEDULER_SECONDS_PER_AUDIO_SECOND
+        )
+
         logger.info("Pre-initializing transcribe audio usecase...")
         self._transcribe_audio_usecase = TranscribeAudioUseCase(
             self._diarization_service,
             self._transcription_service,
             self._audio_repository,
-            self._transcription_repository
+            self._transcription_repository,
+            draft_model=PROGRESSIVE_DRAFT_MODEL,
+            detect_language=LANGUAGE_DETECTION,
+            language_min_probability=LANGUAGE_MIN_PROBABILITY,
+            trace_store=TraceStore(TRACE_MAX_JOBS),
+            scheduler=self._scheduler,
+            turn_normalizer=TurnNormalizer(
+                max_gap=TURN_MERGE_GAP_SECONDS,
+                min_duration=TURN_MIN_SECONDS,
+                max_duration=TURN_MAX_SECONDS
+            ) if TURN_NORMALIZATION else None,
+            speaker_segment_repository=self._speaker_segment_repository,
+            word_timing_repository=self._word_timing_repository
         )
         logger.info("Transcribe audio usecase initialized")
 
+        # Background eviction of unused clips (TTL, then LRU under the disk quota), sparing running jobs
+        self._sweep_storage_usecase = SweepStorageUseCase(
+            self._audio_repository,
+            self._store_audio_usecase,
+            ttl=STORAGE_TTL_HOURS * 3600 or None,
+            quota_bytes=STORAGE_QUOTA_MB * 1024 * 1024 or None,
+            active_clips=self._transcribe_audio_usecase.active_clips
+        )
+        self._storage_sweeper = None
+        if STORAGE_TTL_HOURS or STORAGE_QUOTA_MB:
+            self._storage_sweeper = PeriodicTask(
+                "storage-sweeper", STORAGE_SWEEP_INTERVAL_SECONDS, self._sweep_storage_usecase.execute
+            )
+            self._storage_sweeper.start()
+            logger.info("Storage sweeper started")
+
+        self._export_transcript_usecase = ExportTranscriptUseCase(
+            self._transcribe_audio_usecase,
+            self._transcription_repository,
+            word_timing_repository=self._word_timing_repository,
+            export_repository=self._export_repository
+        )
+
+        logger.info("Pre-initializing search transcripts usecase...")
+        self._search_transcripts_usecase = SearchTranscriptsUseCase(self._search_index, self._audio_repository)
+        logger.info("Search transcripts usecase initialized")
+
+        logger.info("Pre-initializing batch transcribe usecase...")
+        self._batch_transcribe_usecase = BatchTranscribeUseCase(
+            self._transcribe_audio_usecase,
+            self._store_audio_usecase,
+            FairScheduler(BATCH_WORKERS),
+            max_clips=BATCH_MAX_CLIPS
+        )
+        logger.info("Batch transcribe usecase initialized")
+
+        logger.info("Pre-initializing live transcribe usecase...")
+        self._live_transcribe_usecase = LiveTranscribeUseCase(
+            self._transcription_service,
+            self._embedding_service,
+            draft_model=PROGRESSIVE_DRAFT_MODEL,
+            partial_interval=LIVE_PARTIAL_INTERVAL_SECONDS,
+            silence_ms=LIVE_SILENCE_MS,
+            silence_thresh_db=LIVE_SILENCE_THRESH_DB,
+            max_utterance_seconds=LIVE_MAX_UTTERANCE_SECONDS,
+            speaker_similarity=LIVE_SPEAKER_SIMILARITY,
+            max_speakers=LIVE_MAX_SPEAKERS,
+            scheduler=self._scheduler
+        )
+        logger.info("Live transcribe usecase initialized")
+
+    def _init_model_services(self) -> None:
+        """Whisper and Pyannote adapters, with the models loading in the background"""
+        # Start loading models in the background
+        self._model_manager = ModelLifecycleManager()
+        pyannote_handle = self._model_manager.register("pyannote", _load_pyannote, enabled=ENABLE_DIARIZATION)
+        whisper_handle = self._model_manager.register("whisper", _load_whisper)
+        self._model_manager.start()
+
+        # Decoded audio shared by diarization and the transcription of each segment
+        self._audio_cache = DecodedAudioCache(AUDIO_CACHE_MB)
+
+        # Initialize diarization service (outbound adapter)
+        if ENABLE_DIARIZATION:
+            self._diarization_service = ChunkedDiarizationAdapter(
+                pyannote_handle,
+                max_workers=DIARIZATION_MAX_CHUNK_WORKERS,
+                audio_cache=self._audio_cache,
+                governor=get_resource_governor(),
+                model_name=PYANNOTE_MODEL
+            )
+            # Live transcription reuses the pipeline's embedding model to assign speakers
+            self._embedding_service = PyannoteEmbeddingAdapter(pyannote_handle)
+            logger.info("Diarization service initialized (model loading in background)")
+        else:
+            self._diarization_service = None
+            self._embedding_service = None
+            logger.info("Diarization disabled, pyannote will not be loaded")
+
+        # Initialize transcription service (outbound adapter)
+        self._whisper_registry = get_whisper_model_registry()
+        self._transcription_service = WhisperAdapter(
+            whisper_handle,
+            registry=self._whisper_registry,
+            default_profile=DECODING_PROFILE,
+            language=WHISPER_LANGUAGE,
+            language_windows=LANGUAGE_DETECTION_WINDOWS,
+            language_window_seconds=LANGUAGE_DETECTION_WINDOW_SECONDS,
+            audio_cache=self._audio_cache
+        )
+        logger.info("Transcription service initialized (model loading in background)")
+
+    def _create_audio_repository(self) -> AudioClipRepository:
+        """Local audio storage, or an object store shared by every replica behind a local disk cache"""
+        if AUDIO_STORAGE_BACKEND == "filesystem":
+            return FileSystemAudioClipRepository(AUDIO_STORAGE_PATH)
+
+        client: ObjectStoreClient
+        if AUDIO_STORAGE_BACKEND == "s3":
+            if not OBJECT_STORE_BUCKET:
+                raise ValueError("AUDIO_STORAGE_BACKEND=s3 requires OBJECT_STORE_BUCKET")
+            client = S3ObjectStoreClient(
+                OBJECT_STORE_BUCKET,
+                endpoint_url=OBJECT_STORE_ENDPOINT_URL,
+                region=OBJECT_STORE_REGION,
+                part_size=OBJECT_STORE_PART_SIZE_MB * 1024 * 1024
+            )
+        elif AUDIO_STORAGE_BACKEND == "local":
+            client = LocalObjectStoreClient(OBJECT_STORE_PATH)
+        else:
+            raise ValueError(f"Unknown AUDIO_STORAGE_BACKEND '{AUDIO_STORAGE_BACKEND}'")
+        return ObjectStoreAudioClipRepository(
+            client,
+            DiskLRUCache(AUDIO_DISK_CACHE_PATH, max_mb=AUDIO_DISK_CACHE_MB),
+            prefix=OBJECT_STORE_PREFIX,
+            prefetch_workers=AUDIO_PREFETCH_WORKERS
+        )
+
+    def _init_fake_services(self) -> None:
+        """Deterministic fake adapters; no model is registered or loaded"""
+        self._model_manager = ModelLifecycleManager()
+        self._whisper_registry = None
+        self._audio_cache = None
+        if ENABLE_DIARIZATION:
+            self._diarization_service = FakeDiarizationAdapter(total_duration=None, delay=FAKE_DIARIZATION_DELAY)
+            self._embedding_service = FakeEmbeddingAdapter()
+        else:
+            self._diarization_service = None
+            self._embedding_service = None
+        self._transcription_service = FakeTranscriptionAdapter(
+            seconds_per_audio_second=FAKE_SECONDS_PER_AUDIO_SECOND,
+            cpu_seconds_per_audio_second=FAKE_CPU_SECONDS_PER_AUDIO_SECOND
+        )
+        logger.info("Fake diarization and transcription services initialized (no models loaded)")
+
     @property
     def audio_repository(self) -> AudioClipRepository:
         return self._audio_repository
@@ -76,6 +319,22 @@ class Container:
     def transcription_repository(self) -> TranscriptionTextRepository:
         return self._transcription_repository
 
+    @property
+    def model_manager(self) -> ModelLifecycleManager:
+        return self._model_manager
+
+    @property
+    def whisper_registry(self) -> Optional[WhisperModelRegistry]:
+        return self._whisper_registry
+
+    @property
+    def scheduler(self) -> PriorityScheduler:
+        return self._scheduler
+
+    @property
+    def search_index(self) -> SearchIndexPort:
+        return self._search_index
+
     @property
     def diarization_service(self) -> DiarizationPort:
         return self._diarization_service
@@ -84,10 +343,30 @@ class Container:
     def transcription_service(self) -> TranscriptionPort:
         return self._transcription_service
 
+    @property
+    def embedding_service(self) -> Optional[SpeakerEmbeddingPort]:
+        return self._embedding_service
+
     @property
     def store_audio_usecase(self) -> StoreAudioUseCase:
         return self._store_audio_usecase
 
     @property
     def transcribe_audio_usecase(self) -> TranscribeAudioUseCase:
-        return self._transcribe_audio_usecase
\ No newline at end of file
+        return self._transcribe_audio_usecase
+
+    @property
+    def export_transcript_usecase(self) -> ExportTranscriptUseCase:
+        return self._export_transcript_usecase
+
+    @property
+    def search_transcripts_usecase(self) -> SearchTranscriptsUseCase:
+        return self._search_transcripts_usecase
+
+    @property
+    def batch_transcribe_usecase(self) -> BatchTranscribeUseCase:
+        return self._batch_transcribe_usecase
+
+    @property
+    def live_transcribe_usecase(self) -> LiveTranscribeUseCase:
+        return self._live_transcribe_usecase
@@ -11,6 +11,92 @@ APP_PORT = int(os.getenv("APP_PORT", 8000))
 # PyAnnote and Whisper model configurations
 PYANNOTE_MODEL = os.getenv("PYANNOTE_MODEL", "pyannote/speaker-diarization")
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "openai/whisper-large-v3")
+# Memory budget (MB) for Whisper models held by the model registry; least recently used models are unloaded beyond it
+WHISPER_MEMORY_BUDGET_MB = int(os.getenv("WHISPER_MEMORY_BUDGET_MB", 8000))
+# CTranslate2 compute types; int8 on CPU is several times faster than float32 with little accuracy loss
+WHISPER_CPU_COMPUTE_TYPE = os.getenv("WHISPER_CPU_COMPUTE_TYPE", "int8")
+WHISPER_GPU_COMPUTE_TYPE = os.getenv("WHISPER_GPU_COMPUTE_TYPE", "int8_float16")
+# Default decoding profile: fast, balanced, accurate or turns (selectable per request with ?profile=)
+DECODING_PROFILE = os.getenv("DECODING_PROFILE", "balanced")
+# Pin the transcription language (e.g. "en") instead of auto-detecting it; empty auto-detects
+WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE") or None
+# Detect each clip's language once (from a few sampled windows) and pin it for all segments
+LANGUAGE_DETECTION = os.getenv("LANGUAGE_DETECTION", "true").lower() in ("1", "true", "yes")
+LANGUAGE_DETECTION_WINDOWS = int(os.getenv("LANGUAGE_DETECTION_WINDOWS", 3))
+LANGUAGE_DETECTION_WINDOW_SECONDS = float(os.getenv("LANGUAGE_DETECTION_WINDOW_SECONDS", 30))
+# Detected languages below this probability are not pinned (Whisper then detects per segment)
+LANGUAGE_MIN_PROBABILITY = float(os.getenv("LANGUAGE_MIN_PROBABILITY", 0.5))
+# Model for the draft pass of progressive streaming (alias or quality preset; empty uses WHISPER_MODEL)
+PROGRESSIVE_DRAFT_MODEL = os.getenv("PROGRESSIVE_DRAFT_MODEL", "draft") or None
+# "fake" swaps Whisper and Pyannote for deterministic fake adapters (load tests, machines without models)
+CONTAINER_PROFILE = os.getenv("CONTAINER_PROFILE", "default")
+# Simulated cost of the fake adapters: latency and CPU per second of audio, delay per diarized turn
+FAKE_SECONDS_PER_AUDIO_SECOND = float(os.getenv("FAKE_SECONDS_PER_AUDIO_SECOND", 0.05))
+FAKE_CPU_SECONDS_PER_AUDIO_SECOND = float(os.getenv("FAKE_CPU_SECONDS_PER_AUDIO_SECOND", 0.0))
+FAKE_DIARIZATION_DELAY = float(os.getenv("FAKE_DIARIZATION_DELAY", 0.05))
+# Set to "false" to transcribe without speaker diarization (pyannote is then never loaded)
+ENABLE_DIARIZATION = os.getenv("ENABLE_DIARIZATION", "true").lower() in ("1", "true", "yes")
+# Number of recent transcription jobs whose trace timeline is kept (GET /api/transcribe/{clip_id}/trace)
+TRACE_MAX_JOBS = int(os.getenv("TRACE_MAX_JOBS", 100))
+# Concurrent model calls, shared segment by segment: interactive before batch, fair between tenants (X-API-Key)
+MODEL_SLOTS = int(os.getenv("MODEL_SLOTS", 2))
+# New jobs get 429 when the estimated queue wait ahead of them exceeds this (seconds)
+ADMISSION_MAX_WAIT_SECONDS = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", 300))
+# Initial estimate of model seconds per audio second (refined from observed segments) for the wait estimate
+SCHEDULER_SECONDS_PER_AUDIO_SECOND = float(os.getenv("SCHEDULER_SECONDS_PER_AUDIO_SECOND", 0.5))
+# Diarized turns are normalized before transcription: same-speaker turns less than TURN_MERGE_GAP_SECONDS apart
+# are merged up to TURN_MAX_SECONDS (the Whisper window), shorter turns than TURN_MIN_SECONDS are absorbed into
+# the preceding turn or dropped. TURN_NORMALIZATION=false transcribes every diarized turn as it is
+TURN_NORMALIZATION = os.getenv("TURN_NORMALIZATION", "true").lower() in ("1", "true", "yes")
+TURN_MERGE_GAP_SECONDS = float(os.getenv("TURN_MERGE_GAP_SECONDS", 0.5))
+TURN_MIN_SECONDS = float(os.getenv("TURN_MIN_SECONDS", 0.2))
+TURN_MAX_SECONDS = float(os.getenv("TURN_MAX_SECONDS", 30))
+# Memory budget (MB) for decoded audio shared between diarization and the transcription of each segment
+AUDIO_CACHE_MB = int(os.getenv("AUDIO_CACHE_MB", 256))
+# Clips of batch requests transcribed concurrently (shared fairly between batches) and the largest batch accepted
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", 2))
+BATCH_MAX_CLIPS = int(os.getenv("BATCH_MAX_CLIPS", 1000))
+# Live transcription (WebSocket): seconds of new audio between partial hypotheses, trailing silence (ms) and
+# level (dBFS) ending an utterance, longest utterance, and online speaker assignment
+LIVE_PARTIAL_INTERVAL_SECONDS = float(os.getenv("LIVE_PARTIAL_INTERVAL_SECONDS", 0.5))
+LIVE_SILENCE_MS = int(os.getenv("LIVE_SILENCE_MS", 500))
+LIVE_SILENCE_THRESH_DB = float(os.getenv("LIVE_SILENCE_THRESH_DB", -40))
+LIVE_MAX_UTTERANCE_SECONDS = float(os.getenv("LIVE_MAX_UTTERANCE_SECONDS", 15))
+LIVE_SPEAKER_SIMILARITY = float(os.getenv("LIVE_SPEAKER_SIMILARITY", 0.5))
+LIVE_MAX_SPEAKERS = int(os.getenv("LIVE_MAX_SPEAKERS", 8))
+# Cores split between Pyannote (torch threads, DIARIZATION_CPU_SHARE of them) and Whisper (CTranslate2 threads);
+# 0 uses every core. Diarization chunks run up to DIARIZATION_MAX_CHUNK_WORKERS at once, tuned from observed
+# throughput, load and resident memory (halved above MEMORY_HIGH_WATERMARK_MB; 0 means 80% of physical memory)
+CPU_THREADS = int(os.getenv("CPU_THREADS", 0))
+DIARIZATION_CPU_SHARE = float(os.getenv("DIARIZATION_CPU_SHARE", 0.5))
+DIARIZATION_MAX_CHUNK_WORKERS = int(os.getenv("DIARIZATION_MAX_CHUNK_WORKERS", 4))
+MEMORY_HIGH_WATERMARK_MB = int(os.getenv("MEMORY_HIGH_WATERMARK_MB", 0))
 AUDIO_STORAGE_PATH = os.getenv("AUDIO_STORAGE_PATH", "/tmp/whisper_v3_server_storage")
+# Where clip audio lives: "filesystem" (AUDIO_STORAGE_PATH, local to this instance), "s3" (an S3-compatible bucket
+# shared by every replica) or "local" (an object store kept in the OBJECT_STORE_PATH directory, e.g. a shared mount)
+AUDIO_STORAGE_BACKEND = os.getenv("AUDIO_STORAGE_BACKEND", "filesystem")
+OBJECT_STORE_BUCKET = os.getenv("OBJECT_STORE_BUCKET", "")
+OBJECT_STORE_ENDPOINT_URL = os.getenv("OBJECT_STORE_ENDPOINT_URL", "")
+OBJECT_STORE_REGION = os.getenv("OBJECT_STORE_REGION", "")
+OBJECT_STORE_PATH = os.getenv("OBJECT_STORE_PATH", "/tmp/whisper_v3_server_storage/object_store")
+OBJECT_STORE_PREFIX = os.getenv("OBJECT_STORE_PREFIX", "audio/")
+OBJECT_STORE_PART_SIZE_MB = int(os.getenv("OBJECT_STORE_PART_SIZE_MB", 8))
+# Local disk cache of object store audio, and concurrent downloads of clips queued for transcription
+AUDIO_DISK_CACHE_PATH = os.getenv("AUDIO_DISK_CACHE_PATH", "/tmp/whisper_v3_server_storage/audio_cache")
+AUDIO_DISK_CACHE_MB = int(os.getenv("AUDIO_DISK_CACHE_MB", 2048))
+AUDIO_PREFETCH_WORKERS = int(os.getenv("AUDIO_PREFETCH_WORKERS", 2))
 TRANSCRIPTION_STORAGE_PATH = os.getenv("TRANSCRIPTION_STORAGE_PATH", "/tmp/whisper_v3_server_storage/transcription_texts")
+# Transcript storage format: "jsonl" (text segment log) or "columnar" (compact binary .seg files)
+TRANSCRIPTION_STORAGE_FORMAT = os.getenv("TRANSCRIPTION_STORAGE_FORMAT", "jsonl")
+SEARCH_INDEX_PATH = os.getenv("SEARCH_INDEX_PATH", "/tmp/whisper_v3_server_storage/search_index.db")
+# Clips (audio and transcript) unused for STORAGE_TTL_HOURS are evicted, then the least recently used ones while
+# stored audio exceeds STORAGE_QUOTA_MB; 0 disables either. The sweeper runs every STORAGE_SWEEP_INTERVAL_SECONDS
+STORAGE_TTL_HOURS = float(os.getenv("STORAGE_TTL_HOURS", 0))
+STORAGE_QUOTA_MB = int(os.getenv("STORAGE_QUOTA_MB", 0))
+STORAGE_SWEEP_INTERVAL_SECONDS = float(os.getenv("STORAGE_SWEEP_INTERVAL_SECONDS", 300))
+# Diarization results by audio content and diarization settings, reused by re-transcriptions (empty disables)
+SPEAKER_SEGMENT_STORAGE_PATH = os.getenv("SPEAKER_SEGMENT_STORAGE_PATH", "/tmp/whisper_v3_server_storage/speaker_segments")
+# Word timings of transcribed segments and rendered transcript exports (empty disables either)
+WORD_TIMING_STORAGE_PATH = os.getenv("WORD_TIMING_STORAGE_PATH", "/tmp/whisper_v3_server_storage/transcription_texts/words")
+EXPORT_CACHE_PATH = os.getenv("EXPORT_CACHE_PATH", "/tmp/whisper_v3_server_storage/transcription_texts/exports")
 HUGGINGFACE_AUTH_TOKEN = os.getenv("HUGGINGFACE_AUTH_TOKEN")
\ No newline at end of file
@@ -1,12 +1,19 @@
+from typing import Optional
 from uuid import uuid4
+from .value_objects import LanguageDetection
 
 class AudioClip:
-    def __init__(self, title: str, filename: str, content: bytes, duration: float = None):
-        self.id = uuid4()
+    def __init__(self, title: str, filename: str, content: bytes, duration: float = None,
+                 id=None, file_path: str = None, language: Optional[LanguageDetection] = None,
+                 content_hash: Optional[str] = None):
+        self.id = id if id is not None else uuid4()
         self.title = title
         self.filename = filename
         self.content = content
-        self.duration = duration  # in seconds 
+        self.duration = duration  # in seconds
+        self.file_path = file_path
+        self.language = language  # detected once per clip, reused for every segment
+        self.content_hash = content_hash  # digest of the audio, shared by clips with identical audio
 
     def get_file_path(self):
-        return f"{self.id}.wav"
\ No newline at end of file
+        return f"{self.id}.wav"
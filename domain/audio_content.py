@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AudioContent:
+    """
+    Audio served from a stored file: ``length`` bytes of the file at ``path``
+    starting at ``offset``, preceded by ``header`` (a generated WAV header when
+    only a time range of the clip is served, empty otherwise).
+    """
+    path: str
+    offset: int
+    length: int
+    filename: str
+    version: str
+    header: bytes = b""
+    media_type: str = "audio/wav"
+
+    @property
+    def size(self) -> int:
+        return len(self.header) + self.length
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+QUEUED = "queued"
+COMPLETED = "completed"
+FAILED = "failed"
+DONE = "done"
+
+
+@dataclass(frozen=True)
+class BatchEvent:
+    """
+    One event of a batch transcription: the batch was queued, one of its
+    clips completed or failed (in completion order, not submission order),
+    or the whole batch is done.
+    """
+    kind: str
+    index: Optional[int] = None
+    clip_id: Optional[str] = None
+    data: dict = field(default_factory=dict)
+
+    def to_dict(self):
+        result = dict(self.data)
+        if self.index is not None:
+            result["index"] = self.index
+            result["clip_id"] = self.clip_id
+        return result
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ClipUsage:
+    """Storage a clip takes up and when it was last used"""
+    clip_id: str
+    size_bytes: int
+    last_access: float  # seconds since the epoch
@@ -1,4 +1,6 @@
 from .diarization_port import DiarizationPort
 from .transcription_port import TranscriptionPort
+from .search_index_port import SearchIndexPort
+from .speaker_embedding_port import SpeakerEmbeddingPort
 
-__all__ = ['DiarizationPort', 'TranscriptionPort'] 
\ No newline at end of file
+__all__ = ['DiarizationPort', 'TranscriptionPort', 'SearchIndexPort', 'SpeakerEmbeddingPort']
@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, List
+from typing import AsyncGenerator, List, Optional
 from ..audio_clip import AudioClip
 from ..speaker_segment import SpeakerSegment
 
+
+class IncompleteDiarizationError(RuntimeError):
+    """
+    Raised when parts of a clip could not be diarized. The turns of the parts
+    that succeeded are still usable but must not be stored as the clip's result.
+    """
+    def __init__(self, message: str, segments: Optional[List[SpeakerSegment]] = None):
+        super().__init__(message)
+        # Turns of the parts that were diarized
+        self.segments = segments if segments is not None else []
+
+
 class DiarizationPort(ABC):
     """
     Port interface for speaker diarization services.
@@ -18,6 +30,9 @@ class DiarizationPort(ABC):
             
         Returns:
             List of speaker segments with timing information
+
+        Raises:
+            IncompleteDiarizationError: If parts of the clip could not be diarized
         """
         pass
         
@@ -31,5 +46,19 @@ class DiarizationPort(ABC):
             
         Returns:
             Async generator yielding speaker segments as they are processed
+
+        Raises:
+            IncompleteDiarizationError: After the segments of the parts that
+                succeeded, if other parts of the clip could not be diarized
+        """
+        pass
+
+    def cache_key(self) -> Optional[str]:
+        """
+        Identify the model and settings that determine this adapter's output,
+        so diarization results can be reused for the same audio.
+
+        Returns:
+            A stable string, or None if results must not be reused
         """
-        pass 
\ No newline at end of file
+        return None 
\ No newline at end of file
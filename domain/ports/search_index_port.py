@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import List, Union
+from ..search_hit import SearchHit
+from ..segment_table import SegmentTable
+from ..speaker_segment import SpeakerSegment
+
+class SearchIndexPort(ABC):
+    """
+    Port interface for full-text search over stored transcripts.
+    This defines the contract that any search index adapter must implement.
+    """
+    @abstractmethod
+    def index(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """
+        Index (or re-index) the segments of a clip, replacing any previous entries.
+        
+        Args:
+            clip_id: ID of the audio clip
+            segments: The clip's transcribed speaker segments
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, clip_id: str) -> None:
+        """
+        Remove all entries of a clip from the index.
+        
+        Args:
+            clip_id: ID of the audio clip
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[SearchHit]:
+        """
+        Search indexed segments.
+        
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits to return
+            offset: Number of ranked hits to skip
+            
+        Returns:
+            Matching segments, best match first
+        """
+        pass
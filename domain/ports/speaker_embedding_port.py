@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class SpeakerEmbeddingPort(ABC):
+    """
+    Port interface for speaker embedding services, used to tell speakers
+    apart online (utterance by utterance) rather than diarizing a whole clip.
+    """
+    @abstractmethod
+    async def embed(self, pcm: bytes, sample_rate: int) -> Optional[List[float]]:
+        """
+        Compute the speaker embedding of an utterance.
+
+        Args:
+            pcm: 16-bit little-endian mono PCM samples
+            sample_rate: Sample rate of the PCM
+
+        Returns:
+            The embedding vector, or None if the utterance cannot be embedded
+            (e.g. too short)
+        """
+        pass
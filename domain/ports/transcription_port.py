@@ -1,6 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List, Optional, Tuple
 from ..audio_clip import AudioClip
+from ..value_objects import LanguageDetection
+from ..word_timing import WordTiming
+
+
+class UnsupportedTranscriptionOptionError(LookupError):
+    """Raised when a transcription request names an option value the service does not offer"""
+
+
+class UnknownModelError(UnsupportedTranscriptionOptionError):
+    """Raised when a transcription request names a model the service does not offer"""
+
+
+class UnknownDecodingProfileError(UnsupportedTranscriptionOptionError):
+    """Raised when a transcription request names an unknown decoding profile"""
+
 
 class TranscriptionPort(ABC):
     """
@@ -8,31 +23,116 @@ class TranscriptionPort(ABC):
     This defines the contract that any transcription adapter must implement.
     """
     @abstractmethod
-    def transcribe(self, clip: AudioClip, start: float, end: float) -> str:
+    def transcribe(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> str:
         """
         Transcribe a segment of an audio clip.
-        
+
         Args:
             clip: The audio clip to process
             start: Start time in seconds
             end: End time in seconds
-            
+            model: Model name, alias or quality preset (None for the default model)
+            draft: Favor speed over accuracy (e.g. greedy decoding) for a quick first pass
+            profile: Named decoding profile (None for the service default); ignored for drafts
+            language: Language code to decode in (None keeps the profile's setting)
+
         Returns:
             Transcribed text
         """
         pass
-        
+
     @abstractmethod
-    async def transcribe_stream(self, clip: AudioClip, start: float, end: float) -> AsyncGenerator[str, None]:
+    async def transcribe_stream(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream transcription results as they become available.
-        
+
         Args:
             clip: The audio clip to process
             start: Start time in seconds
             end: End time in seconds
-            
+            model: Model name, alias or quality preset (None for the default model)
+            draft: Favor speed over accuracy (e.g. greedy decoding) for a quick first pass
+            profile: Named decoding profile (None for the service default); ignored for drafts
+            language: Language code to decode in (None keeps the profile's setting)
+
         Returns:
             Async generator yielding transcription text as it is processed
         """
-        pass 
\ No newline at end of file
+        pass
+
+    async def transcribe_timed(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[str, List[WordTiming]]:
+        """
+        Transcribe a segment of an audio clip along with the timing of each word.
+        Adapters without word timestamps return the text with no words.
+
+        Returns:
+            The transcribed text and its words (times from the start of the clip)
+        """
+        chunks = [chunk async for chunk in self.transcribe_stream(
+            clip, start, end, model=model, draft=draft, profile=profile, language=language
+        )]
+        return " ".join(chunks), []
+
+    def resolve_model(self, model: Optional[str]) -> Optional[str]:
+        """
+        Validate a requested model before any work starts.
+        Adapters without model selection accept any value.
+
+        Raises:
+            UnknownModelError: If the adapter does not offer the model
+        """
+        return model
+
+    def resolve_profile(self, profile: Optional[str]) -> Optional[str]:
+        """
+        Validate a requested decoding profile before any work starts.
+        Adapters without decoding profiles accept any value.
+
+        Raises:
+            UnknownDecodingProfileError: If the adapter does not offer the profile
+        """
+        return profile
+
+    async def detect_language(
+        self, clip: AudioClip, start: float = 0.0, end: float = 0.0
+    ) -> Optional[LanguageDetection]:
+        """
+        Identify the spoken language of a clip (or of the [start, end) window).
+        Adapters without language identification return None.
+
+        Args:
+            clip: The audio clip to process
+            start: Start time in seconds
+            end: End time in seconds (0 for the end of the clip)
+
+        Returns:
+            The most likely language with its probability, or None
+        """
+        return None
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import BinaryIO, ContextManager, Dict, Iterator, List, Optional, Tuple
 from .audio_clip import AudioClip
+from .clip_usage import ClipUsage
+from .segment_table import SegmentTable
 from .speaker_segment import SpeakerSegment
 from .transcription_text import TranscriptionText
+from .word_timing import WordTiming
 
 class AudioClipRepository(ABC):
     @abstractmethod
@@ -16,17 +21,60 @@ class AudioClipRepository(ABC):
     def delete(self, clip_id):
         pass
 
+    @abstractmethod
+    def update(self, clip: AudioClip):
+        """Persist changed clip metadata (e.g. the detected language) without rewriting the audio"""
+        pass
+
+    @abstractmethod
+    def get_audio_path(self, clip_id) -> Optional[str]:
+        """Local path of the clip's audio file, without reading it (None if the clip does not exist)"""
+        pass
+
+    @abstractmethod
+    def usage(self) -> Iterator[ClipUsage]:
+        """Stored size and last access time of every clip (for eviction)"""
+        pass
+
+    def touch(self, clip_id) -> None:
+        """
+        Record a use of the clip that does not read its audio, such as serving
+        its transcript, so eviction does not take it for unused. A no-op by default.
+        """
+        pass
+
+    def prefetch(self, clip_id) -> None:
+        """
+        Start making the clip's audio locally available ahead of a job that
+        will read it. Returns immediately; a no-op for local storage.
+        """
+        pass
+
+    @contextmanager
+    def in_use(self, clip_id) -> Iterator[None]:
+        """
+        Keep the clip's local audio available while a job reads it, for the
+        duration of the block. A no-op for local storage.
+        """
+        yield
+
 class SpeakerSegmentRepository(ABC):
+    """
+    Diarized speaker turns (without text), stored apart from transcripts so
+    re-transcriptions reuse them. Keys identify the audio content and the
+    diarization settings rather than a clip.
+    """
     @abstractmethod
-    def save(self, clip_id: str, segments: list[SpeakerSegment]):
+    def save(self, key: str, segments: list[SpeakerSegment]):
         pass
 
     @abstractmethod
-    def list(self, clip_id):
+    def list(self, key: str) -> Optional[SegmentTable]:
+        """Turns stored under the key (None if there are none)"""
         pass
 
     @abstractmethod
-    def delete(self, clip_id):
+    def delete(self, key: str):
         pass
 
 class TranscriptionTextRepository(ABC):
@@ -40,4 +88,130 @@ class TranscriptionTextRepository(ABC):
 
     @abstractmethod
     def delete(self, clip_id):
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def append(self, clip_id: str, segment: SpeakerSegment):
+        """Append a single segment to the clip's uncommitted segment log"""
+        pass
+
+    @abstractmethod
+    def commit(self, clip_id: str):
+        """Mark the clip's segment log as finished so it is returned by list()"""
+        pass
+
+    @abstractmethod
+    def list_pending(self, clip_id) -> SegmentTable:
+        """List segments appended but not yet committed (used to resume a job)"""
+        pass
+
+    @abstractmethod
+    def list_range(self, clip_id: str, start: float, end: float) -> SegmentTable:
+        """List committed segments overlapping the [start, end) time window"""
+        pass
+
+    @abstractmethod
+    def list_by_speaker(self, clip_id: str, speaker_label: str) -> SegmentTable:
+        """List committed segments spoken by one speaker"""
+        pass
+
+    @abstractmethod
+    def query(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> SegmentTable:
+        """Page through committed segments overlapping [start, end) and/or spoken by one speaker"""
+        pass
+
+    def iter_pages(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        page_size: int = 500
+    ) -> Iterator[SegmentTable]:
+        """
+        All committed segments matching the filters (as in query), in pages of
+        at most page_size segments. Implementations read the transcript once;
+        this default pages through query().
+        """
+        offset = 0
+        while True:
+            page = self.query(clip_id, start=start, end=end, speaker_label=speaker_label, offset=offset, limit=page_size)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    @abstractmethod
+    def get_version(self, clip_id: str) -> Optional[str]:
+        """Opaque version of the committed transcript (None if there is none)"""
+        pass
+
+    @abstractmethod
+    def save_draft(self, clip_id: str, segments: SegmentTable):
+        """Store the quick draft of a transcript next to the final one (not searchable)"""
+        pass
+
+    @abstractmethod
+    def list_draft(self, clip_id: str) -> SegmentTable:
+        """List the draft segments of a clip (empty if there is no draft)"""
+        pass
+
+class WordTimingRepository(ABC):
+    """
+    Word-level timings of transcribed segments, kept next to the transcript
+    (whose segments stay plain text). Each record belongs to the segment
+    starting at the same time; a later record for the same segment replaces
+    an earlier one.
+    """
+    @abstractmethod
+    def append(self, clip_id: str, start: float, end: float, words: List[WordTiming]):
+        """Record the words of the clip's segment spanning [start, end]"""
+        pass
+
+    @abstractmethod
+    def list(self, clip_id: str, start: Optional[float] = None, end: Optional[float] = None) -> Dict[float, List[WordTiming]]:
+        """Words of the segments starting within [start, end], keyed by segment start"""
+        pass
+
+    @abstractmethod
+    def iter_records(self, clip_id: str) -> Iterator[Tuple[float, List[WordTiming]]]:
+        """(segment start, words) of every record in the order recorded (transcript order), read lazily"""
+        pass
+
+    @abstractmethod
+    def delete(self, clip_id: str):
+        pass
+
+class TranscriptExportRepository(ABC):
+    """
+    Rendered exports (subtitles, text) of committed transcripts. An export is
+    named after its format and options and belongs to one transcript version,
+    so a changed transcript never serves a stale export.
+    """
+    @abstractmethod
+    def get_path(self, clip_id: str, version: str, name: str) -> Optional[str]:
+        """Local file of a stored export (None if there is none)"""
+        pass
+
+    @abstractmethod
+    def writer(self, clip_id: str, version: str, name: str) -> ContextManager[BinaryIO]:
+        """
+        File to write an export to; it is stored when the block exits
+        normally and discarded if it raises
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, clip_id: str):
+        """Delete every export of the clip"""
+        pass
+
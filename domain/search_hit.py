@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    clip_id: str
+    start: float
+    end: float
+    speaker_label: str
+    text: str
+    snippet: str
+    score: float
+
+    def to_dict(self):
+        return {
+            "clip_id": self.clip_id,
+            "start": self.start,
+            "end": self.end,
+            "speaker": self.speaker_label,
+            "text": self.text,
+            "snippet": self.snippet,
+            "score": self.score
+        }
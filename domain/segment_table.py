@@ -0,0 +1,176 @@
+from array import array
+from itertools import compress
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .speaker_segment import SpeakerSegment
+
+_NO_SPEAKER = -1
+
+
+class SegmentTable:
+    """
+    Struct-of-arrays collection of speaker segments belonging to one clip.
+
+    Start/end times live in float arrays and speakers are dictionary-encoded
+    into an int array, so bulk operations (sort, merge, filter, serialize) run
+    over flat columns. SpeakerSegment objects are only created when a caller
+    indexes or iterates the table.
+    """
+    __slots__ = ("audio_clip_id", "starts", "ends", "speaker_codes", "speakers", "texts", "_speaker_index")
+
+    def __init__(self, audio_clip_id=None):
+        self.audio_clip_id = audio_clip_id
+        self.starts = array("d")
+        self.ends = array("d")
+        self.speaker_codes = array("i")
+        self.speakers: List[str] = []
+        self.texts: List[Optional[str]] = []
+        self._speaker_index = {}
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[SpeakerSegment], audio_clip_id=None) -> "SegmentTable":
+        table = cls(audio_clip_id)
+        for seg in segments:
+            if table.audio_clip_id is None:
+                table.audio_clip_id = seg.audio_clip_id
+            table.append(seg.start, seg.end, seg.speaker_label, seg.text)
+        return table
+
+    @classmethod
+    def coerce(cls, segments: Union["SegmentTable", Iterable[SpeakerSegment]], audio_clip_id=None) -> "SegmentTable":
+        """Return ``segments`` unchanged if it already is a table, otherwise build one"""
+        if isinstance(segments, cls):
+            return segments
+        return cls.from_segments(segments, audio_clip_id)
+
+    @classmethod
+    def from_columns(
+        cls,
+        audio_clip_id,
+        starts: array,
+        ends: array,
+        speaker_codes: array,
+        speakers: List[str],
+        texts: List[Optional[str]]
+    ) -> "SegmentTable":
+        """Wrap pre-built columns (e.g. read from columnar storage) without copying"""
+        table = cls(audio_clip_id)
+        table.starts, table.ends, table.speaker_codes = starts, ends, speaker_codes
+        table.speakers, table.texts = speakers, texts
+        table._speaker_index = {label: code for code, label in enumerate(speakers)}
+        return table
+
+    def _speaker_code(self, speaker_label: Optional[str]) -> int:
+        if speaker_label is None:
+            return _NO_SPEAKER
+        code = self._speaker_index.get(speaker_label)
+        if code is None:
+            code = self._speaker_index[speaker_label] = len(self.speakers)
+            self.speakers.append(speaker_label)
+        return code
+
+    def append(self, start: float, end: float, speaker_label: Optional[str], text: Optional[str]) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.speaker_codes.append(self._speaker_code(speaker_label))
+        self.texts.append(text)
+
+    def append_segment(self, segment: SpeakerSegment) -> None:
+        self.append(segment.start, segment.end, segment.speaker_label, segment.text)
+
+    def speaker_label(self, index: int) -> Optional[str]:
+        code = self.speaker_codes[index]
+        return None if code == _NO_SPEAKER else self.speakers[code]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return len(self.starts) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        return SpeakerSegment(
+            audio_clip_id=self.audio_clip_id,
+            start=self.starts[index],
+            end=self.ends[index],
+            speaker_label=self.speaker_label(index),
+            text=self.texts[index]
+        )
+
+    def __iter__(self) -> Iterator[SpeakerSegment]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def rows(self) -> Iterator[Tuple[float, float, Optional[str], Optional[str]]]:
+        """Iterate (start, end, speaker_label, text) tuples without creating segments"""
+        labels = [*self.speakers, None]  # code -1 maps to the trailing None
+        for start, end, code, text in zip(self.starts, self.ends, self.speaker_codes, self.texts):
+            yield start, end, labels[code], text
+
+    def take(self, indices: Sequence[int]) -> "SegmentTable":
+        """New table holding the rows at ``indices`` (in that order) with the same speaker dictionary"""
+        return SegmentTable.from_columns(
+            self.audio_clip_id,
+            array("d", (self.starts[i] for i in indices)),
+            array("d", (self.ends[i] for i in indices)),
+            array("i", (self.speaker_codes[i] for i in indices)),
+            list(self.speakers),
+            [self.texts[i] for i in indices]
+        )
+
+    def sorted_by_start(self) -> "SegmentTable":
+        order = sorted(range(len(self)), key=lambda i: (self.starts[i], self.ends[i]))
+        return self.take(order)
+
+    def filter(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None
+    ) -> "SegmentTable":
+        """Rows overlapping [start, end) and/or spoken by ``speaker_label``"""
+        if speaker_label is not None and speaker_label not in self._speaker_index:
+            return SegmentTable(self.audio_clip_id)
+        code = self._speaker_index.get(speaker_label) if speaker_label is not None else None
+        mask = [
+            (start is None or e > start) and (end is None or s < end) and (code is None or c == code)
+            for s, e, c in zip(self.starts, self.ends, self.speaker_codes)
+        ]
+        return self.take(list(compress(range(len(self)), mask)))
+
+    def merge(self, other: "SegmentTable") -> "SegmentTable":
+        """Combine two tables of the same clip, ordered by start time"""
+        merged = SegmentTable.from_columns(
+            self.audio_clip_id,
+            array("d", self.starts),
+            array("d", self.ends),
+            array("i", self.speaker_codes),
+            list(self.speakers),
+            list(self.texts)
+        )
+        remap = array("i", (merged._speaker_code(label) for label in other.speakers))
+        merged.starts.extend(other.starts)
+        merged.ends.extend(other.ends)
+        merged.speaker_codes.extend(c if c == _NO_SPEAKER else remap[c] for c in other.speaker_codes)
+        merged.texts.extend(other.texts)
+        return merged.sorted_by_start()
+
+    def to_records(self) -> List[dict]:
+        """Serialize to the REST response shape"""
+        return [
+            {"start": start, "end": end, "speaker": speaker, "text": text}
+            for start, end, speaker, text in self.rows()
+        ]
+
+    def to_dicts(self) -> Iterator[dict]:
+        """Serialize to the storage shape (see SpeakerSegment.to_dict, without per-segment ids)"""
+        audio_clip_id = str(self.audio_clip_id)
+        for start, end, speaker_label, text in self.rows():
+            yield {
+                "audio_clip_id": audio_clip_id,
+                "start": start,
+                "end": end,
+                "speaker_label": speaker_label,
+                "text": text
+            }
@@ -1,21 +1,65 @@
-from dataclasses import dataclass, field
+from typing import Optional
 from uuid import UUID, uuid4
 from .value_objects import TimeRange
 
 
-@dataclass
 class SpeakerSegment:
-    id: UUID = field(default_factory=uuid4)
-    audio_clip_id: UUID = None
-    start: float = None
-    end: float = None
-    speaker_label: str = None
-    text: str = None
+    """
+    A speaker turn with its transcribed text.
+
+    Slotted and allocation-light: the UUID is only generated when ``id`` is
+    first read, so bulk-loaded segments that are never addressed individually
+    do not pay for one.
+    """
+    __slots__ = ("_id", "audio_clip_id", "start", "end", "speaker_label", "text")
+
+    def __init__(
+        self,
+        id: Optional[UUID] = None,
+        audio_clip_id: UUID = None,
+        start: float = None,
+        end: float = None,
+        speaker_label: str = None,
+        text: str = None
+    ):
+        self._id = id
+        self.audio_clip_id = audio_clip_id
+        self.start = start
+        self.end = end
+        self.speaker_label = speaker_label
+        self.text = text
+
+    @property
+    def id(self) -> UUID:
+        if self._id is None:
+            self._id = uuid4()
+        return self._id
+
+    @id.setter
+    def id(self, value: UUID):
+        self._id = value
 
     @property
     def time_range(self) -> TimeRange:
         return TimeRange(self.start, self.end)
 
+    def _fields(self) -> tuple:
+        return (self.id, self.audio_clip_id, self.start, self.end, self.speaker_label, self.text)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"SpeakerSegment(id={self.id!r}, audio_clip_id={self.audio_clip_id!r}, "
+            f"start={self.start!r}, end={self.end!r}, "
+            f"speaker_label={self.speaker_label!r}, text={self.text!r})"
+        )
+
     def to_dict(self):
         return {
             "id": str(self.id),
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+from .segment_table import SegmentTable
+
+
+@dataclass(frozen=True)
+class TranscriptPage:
+    segments: SegmentTable
+    offset: int
+    limit: Optional[int]
+    next_offset: Optional[int]
+    version: Optional[str]
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+from .speaker_segment import SpeakerSegment
+
+DRAFT = "draft"
+FINAL = "final"
+# Live transcription: the utterance being spoken, revised until its FINAL update
+PARTIAL = "partial"
+
+
+@dataclass(frozen=True)
+class TranscriptUpdate:
+    """
+    One event of a progressive transcription: a quick draft of a segment, or
+    the final text replacing the draft with the same index. In live
+    transcription, PARTIAL updates carry the utterance so far; ``stable`` is
+    the leading text that later partials will not change.
+    """
+    kind: str
+    index: int
+    segment: SpeakerSegment
+    stable: Optional[str] = None
+
+    def to_dict(self):
+        result = {
+            "index": self.index,
+            "start": self.segment.start,
+            "end": self.segment.end,
+            "speaker": self.segment.speaker_label,
+            "text": self.segment.text
+        }
+        if self.stable is not None:
+            result["stable"] = self.stable
+        return result
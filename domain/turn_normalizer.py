@@ -0,0 +1,106 @@
+from typing import AsyncIterator, Iterable, Iterator, Optional, Tuple, Union
+from .segment_table import SegmentTable
+from .speaker_segment import SpeakerSegment
+
+# (start, end, speaker_label)
+Turn = Tuple[float, float, Optional[str]]
+
+
+class TurnNormalizer:
+    """
+    Normalizes diarized speaker turns before transcription, in one pass over
+    turns ordered by start time:
+
+    - turns shorter than min_duration are absorbed into the preceding turn when
+      they start within max_gap of its end and it stays within max_duration,
+      and dropped otherwise
+    - consecutive turns of the same speaker separated by at most max_gap are
+      merged, as long as the merged turn stays within max_duration
+
+    Fewer, longer turns mean fewer transcription calls, each with more context.
+    Turns diarized longer than max_duration are kept as they are.
+    """
+    def __init__(self, max_gap: float = 0.5, min_duration: float = 0.2, max_duration: float = 30.0):
+        """
+        Args:
+            max_gap: Longest pause (seconds) bridged when merging or absorbing
+            min_duration: Turns shorter than this (seconds) are absorbed or dropped
+            max_duration: Merged turns never exceed this length (seconds)
+        """
+        self.max_gap = max_gap
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+
+    def feed(self, pending: Optional[Turn], turn: Turn) -> Tuple[Optional[Turn], Optional[Turn]]:
+        """
+        Combine the turn held back so far with the next one
+
+        Returns:
+            (finished turn or None, turn to hold back)
+        """
+        start, end, speaker = turn
+        if end - start < self.min_duration:
+            if (
+                pending is not None
+                and start - pending[1] <= self.max_gap
+                and max(pending[1], end) - pending[0] <= self.max_duration
+            ):
+                # Absorb the blip so its audio is still transcribed
+                return None, (pending[0], max(pending[1], end), pending[2])
+            return None, pending
+
+        if pending is None:
+            return None, turn
+        if (
+            speaker == pending[2]
+            and start - pending[1] <= self.max_gap
+            and max(pending[1], end) - pending[0] <= self.max_duration
+        ):
+            return None, (pending[0], max(pending[1], end), speaker)
+        return pending, turn
+
+    def normalize_rows(self, turns: Iterable[Turn]) -> Iterator[Turn]:
+        pending = None
+        for turn in turns:
+            finished, pending = self.feed(pending, turn)
+            if finished is not None:
+                yield finished
+        if pending is not None:
+            yield pending
+
+    def normalize(self, segments: Union[SegmentTable, Iterable[SpeakerSegment]], audio_clip_id=None) -> SegmentTable:
+        """Normalized copy of a clip's diarized turns (texts are not carried over)"""
+        table = SegmentTable.coerce(segments, audio_clip_id)
+        if not table:
+            return SegmentTable(table.audio_clip_id)
+        ordered = table.sorted_by_start()
+        labels = [*ordered.speakers, None]  # code -1 maps to the trailing None
+        normalized = SegmentTable(table.audio_clip_id)
+        for start, end, speaker in self.normalize_rows(
+            zip(ordered.starts, ordered.ends, (labels[code] for code in ordered.speaker_codes))
+        ):
+            normalized.append(start, end, speaker, None)
+        return normalized
+
+    async def normalize_stream(
+        self,
+        segments: AsyncIterator[SpeakerSegment]
+    ) -> AsyncIterator[SpeakerSegment]:
+        """
+        Normalize turns as they are diarized; each turn is yielded once the next
+        one shows it cannot grow any further (so one turn of lookahead)
+        """
+        pending: Optional[Turn] = None
+        audio_clip_id = None
+        async for seg in segments:
+            audio_clip_id = seg.audio_clip_id
+            finished, pending = self.feed(pending, (seg.start, seg.end, seg.speaker_label))
+            if finished is not None:
+                yield _segment(audio_clip_id, finished)
+        if pending is not None:
+            yield _segment(audio_clip_id, pending)
+
+
+def _segment(audio_clip_id, turn: Turn) -> SpeakerSegment:
+    start, end, speaker = turn
+    return SpeakerSegment(audio_clip_id=audio_clip_id, start=start, end=end, speaker_label=speaker)
@@ -8,3 +8,12 @@ class TimeRange:
     def __post_init__(self):
         if self.end < self.start:
             raise ValueError(f"Invalid TimeRange: end ({self.end}) < start ({self.start})")
+
+@dataclass(frozen=True)
+class LanguageDetection:
+    language: str
+    probability: float
+
+    def __post_init__(self):
+        if not 0.0 <= self.probability <= 1.0:
+            raise ValueError(f"Invalid LanguageDetection: probability ({self.probability}) outside [0, 1]")
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WordTiming:
+    """A transcribed word and when it is spoken (seconds from the start of the clip)"""
+    start: float
+    end: float
+    text: str
@@ -0,0 +1,129 @@
+import asyncio
+import os
+from typing import Mapping, Optional, Tuple
+
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from domain.audio_content import AudioContent
+
+# ASGI extension letting the server send file bytes itself (sendfile) instead of through the app
+ZERO_COPY_SEND = "http.response.zerocopysend"
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a single-range ``Range`` header against a body of ``size`` bytes
+
+    Returns:
+        Inclusive (first, last) byte positions, or None to send the whole body
+        (no header, or one with several ranges or another unit)
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length <= 0 or size == 0:
+                raise ValueError
+            return max(0, size - length), size - 1
+        first = int(first)
+        last = int(last) if last else size - 1
+    except ValueError:
+        raise ValueError(f"Malformed range '{range_header}'")
+    if first >= size or last < first:
+        raise ValueError(f"Range '{range_header}' not satisfiable for {size} bytes")
+    return first, min(last, size - 1)
+
+
+class AudioContentResponse(Response):
+    """
+    Sends the bytes [first, last] of an AudioContent (its generated header
+    followed by a slice of the stored file).
+
+    The file slice is handed to the server for zero-copy sendfile when it
+    offers the ``http.response.zerocopysend`` ASGI extension, and is otherwise
+    read with pread on a worker thread in CHUNK_SIZE pieces. The background
+    task runs even if sending fails, so it can release the file.
+    """
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        content: AudioContent,
+        first: int,
+        last: int,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None
+    ):
+        self.content = content
+        self.first = first
+        self.last = last
+        self.status_code = status_code
+        self.media_type = content.media_type
+        self.background = background
+        self.init_headers(headers)
+        self.headers["content-length"] = str(last - first + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            if scope.get("method") == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            else:
+                await self._send_body(scope, send)
+        finally:
+            if self.background is not None:
+                await self.background()
+
+    async def _send_body(self, scope: Scope, send: Send) -> None:
+        header = self.content.header
+        end = self.last + 1
+        if end <= self.first:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        if self.first < len(header):
+            await send({
+                "type": "http.response.body",
+                "body": header[self.first:min(end, len(header))],
+                "more_body": end > len(header),
+            })
+        # Bytes of the stored file still to send
+        position = max(self.first, len(header)) - len(header) + self.content.offset
+        remaining = end - max(self.first, len(header))
+        if remaining <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        with open(self.content.path, "rb") as f:
+            if ZERO_COPY_SEND in scope.get("extensions", {}):
+                await send({
+                    "type": ZERO_COPY_SEND,
+                    "file": f,
+                    "offset": position,
+                    "count": remaining,
+                    "more_body": False,
+                })
+                return
+            while remaining > 0:
+                chunk = await loop.run_in_executor(
+                    None, os.pread, f.fileno(), min(self.CHUNK_SIZE, remaining), position
+                )
+                if not chunk:
+                    # File truncated underneath us; end the body early
+                    break
+                position += len(chunk)
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -1,10 +1,20 @@
-from fastapi import HTTPException, UploadFile
-from application.use_cases.store_audio_usecase import StoreAudioUseCase
+import asyncio
+import hashlib
+from contextlib import ExitStack
+from typing import Optional
+from fastapi import HTTPException, Response, UploadFile
+from starlette.background import BackgroundTask
+from application.use_cases.store_audio_usecase import StoreAudioUseCase, UnsupportedAudioRangeError
+from interfaces.inbound.rest.audio_content_response import AudioContentResponse, parse_range
+from shared.utils.metrics import STAGE_SECONDS
 
 class AudioController:
     """
     REST controller for audio operations.
     This is an inbound adapter in the hexagonal architecture.
+
+    Storage calls run on worker threads: with an object store they upload,
+    download or rewrite objects.
     """
     def __init__(self, store_audio_usecase: StoreAudioUseCase):
         self.store_audio_usecase = store_audio_usecase
@@ -12,12 +22,14 @@ class AudioController:
     async def upload_audio(self, file: UploadFile) -> dict:
         """Handle audio file upload"""
         try:
-            content = await file.read()
-            clip = self.store_audio_usecase.execute(
-                title=file.filename,
-                filename=file.filename,
-                content=content
-            )
+            with STAGE_SECONDS.time(stage="upload"):
+                content = await file.read()
+                clip = await asyncio.to_thread(
+                    self.store_audio_usecase.execute,
+                    title=file.filename,
+                    filename=file.filename,
+                    content=content
+                )
             return {"clip_id": str(clip.id)}
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -25,23 +37,97 @@ class AudioController:
     async def get_audio(self, clip_id: str) -> dict:
         """Get audio clip by ID"""
         try:
-            clip = self.store_audio_usecase.get_clip(clip_id)
+            clip = await asyncio.to_thread(self.store_audio_usecase.get_clip, clip_id)
             if not clip:
                 raise HTTPException(status_code=404, detail="Audio clip not found")
             return {
                 "id": str(clip.id),
                 "title": clip.title,
-                "filename": clip.filename
+                "filename": clip.filename,
+                "duration": clip.duration,
+                "language": clip.language.language if clip.language else None,
+                "language_probability": clip.language.probability if clip.language else None
             }
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    @staticmethod
+    def _etag(version: str) -> str:
+        return f'"{hashlib.sha1(version.encode()).hexdigest()}"'
+
+    @staticmethod
+    def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    async def get_audio_content(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+        if_none_match: Optional[str] = None
+    ) -> Response:
+        """
+        Serve a clip's audio, or the [start, end) seconds of it as a WAV file.
+        Supports single byte ranges (``Range``/``If-Range``) and ETag revalidation.
+        The clip's audio is kept in use until the response has been sent.
+        """
+        in_use = ExitStack()
+        sending = False
+        try:
+            in_use.enter_context(self.store_audio_usecase.in_use(clip_id))
+            content = await asyncio.to_thread(self.store_audio_usecase.get_content, clip_id, start=start, end=end)
+            if content is None:
+                raise HTTPException(status_code=404, detail="Audio clip not found")
+
+            etag = self._etag(content.version)
+            headers = {
+                "Accept-Ranges": "bytes",
+                "ETag": etag,
+                "Content-Disposition": f'inline; filename="{content.filename}"',
+            }
+            if self._etag_matches(etag, if_none_match):
+                return Response(status_code=304, headers=headers)
+
+            # A stale If-Range validator asks for the whole (changed) file
+            if if_range is not None and if_range.strip() != etag:
+                range_header = None
+            try:
+                byte_range = parse_range(range_header, content.size)
+            except ValueError as e:
+                return Response(
+                    str(e),
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"bytes */{content.size}"}
+                )
+
+            release = BackgroundTask(in_use.close)
+            sending = True
+            if byte_range is None:
+                return AudioContentResponse(content, 0, content.size - 1, headers=headers, background=release)
+            first, last = byte_range
+            headers["Content-Range"] = f"bytes {first}-{last}/{content.size}"
+            return AudioContentResponse(content, first, last, status_code=206, headers=headers, background=release)
+        except HTTPException:
+            raise
+        except UnsupportedAudioRangeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        finally:
+            if not sending:
+                in_use.close()
+
     async def delete_audio(self, clip_id: str) -> dict:
         """Delete audio clip by ID"""
         try:
-            success = self.store_audio_usecase.delete_clip(clip_id)
+            success = await asyncio.to_thread(self.store_audio_usecase.delete_clip, clip_id)
             if not success:
                 raise HTTPException(status_code=404, detail="Audio clip not found")
             return {"message": "Audio clip deleted successfully"}
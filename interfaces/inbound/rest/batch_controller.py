@@ -0,0 +1,120 @@
+import json
+from typing import List, Optional
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from application.use_cases.batch_transcribe_usecase import BatchTranscribeUseCase
+from shared.utils.metrics import STAGE_SECONDS
+from shared.utils.priority_scheduler import (
+    BATCH, AdmissionRejectedError, UnknownPriorityError, check_priority, tenant_id
+)
+
+
+class BatchManifest(BaseModel):
+    """Clips of a batch and the transcription options applied to all of them"""
+    clip_ids: List[str]
+    model: Optional[str] = None
+    quality: Optional[str] = None
+    profile: Optional[str] = None
+    language: Optional[str] = None
+    per_speaker_language: bool = False
+    priority: Optional[str] = None
+
+
+class BatchController:
+    """
+    REST controller for batch transcription.
+    This is an inbound adapter in the hexagonal architecture.
+    """
+    def __init__(self, batch_transcribe_usecase: BatchTranscribeUseCase):
+        self.batch_transcribe_usecase = batch_transcribe_usecase
+
+    async def transcribe_manifest(self, manifest: BatchManifest, api_key: Optional[str] = None):
+        """Transcribe stored clips, streaming an event as each completes"""
+        return self._stream(
+            manifest.clip_ids, manifest.model, manifest.quality, manifest.profile,
+            manifest.language, manifest.per_speaker_language, api_key, manifest.priority
+        )
+
+    async def transcribe_bundle(
+        self,
+        files: List[UploadFile],
+        model: Optional[str] = None,
+        quality: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        api_key: Optional[str] = None,
+        priority: Optional[str] = None
+    ):
+        """Store an uploaded bundle of clips, then transcribe them like a manifest"""
+        try:
+            # Check the options and the queue before storing anything
+            self.batch_transcribe_usecase.validate(
+                len(files), self._requested_model(model, quality), profile, self._priority(priority)
+            )
+            with STAGE_SECONDS.time(stage="upload"):
+                clip_ids = self.batch_transcribe_usecase.store_bundle(
+                    [(file.filename, await file.read()) for file in files]
+                )
+        except HTTPException:
+            raise
+        except AdmissionRejectedError as e:
+            raise self._too_busy(e)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return self._stream(clip_ids, model, quality, profile, language, per_speaker_language, api_key, priority)
+
+    @staticmethod
+    def _requested_model(model: Optional[str], quality: Optional[str]) -> Optional[str]:
+        if model and quality:
+            raise HTTPException(status_code=400, detail="Specify either model or quality, not both")
+        return model or quality
+
+    @staticmethod
+    def _priority(priority: Optional[str]) -> str:
+        try:
+            return check_priority(priority, default=BATCH)
+        except UnknownPriorityError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    def _too_busy(error: AdmissionRejectedError) -> HTTPException:
+        return HTTPException(
+            status_code=429, detail=str(error), headers={"Retry-After": str(int(error.retry_after))}
+        )
+
+    def _stream(
+        self,
+        clip_ids: List[str],
+        model: Optional[str],
+        quality: Optional[str],
+        profile: Optional[str],
+        language: Optional[str],
+        per_speaker_language: bool,
+        api_key: Optional[str],
+        priority: Optional[str]
+    ) -> StreamingResponse:
+        try:
+            requested_model = self._requested_model(model, quality)
+            requested_priority = self._priority(priority)
+            # Reject the batch before the response starts streaming
+            self.batch_transcribe_usecase.validate(len(clip_ids), requested_model, profile, requested_priority)
+        except HTTPException:
+            raise
+        except AdmissionRejectedError as e:
+            raise self._too_busy(e)
+        except LookupError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        async def generate():
+            async for event in self.batch_transcribe_usecase.execute(
+                clip_ids, model=requested_model, profile=profile,
+                language=language, per_speaker_language=per_speaker_language,
+                tenant=tenant_id(api_key), priority=requested_priority
+            ):
+                yield f"event: {event.kind}\ndata: {json.dumps(event.to_dict())}\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
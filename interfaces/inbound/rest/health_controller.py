@@ -0,0 +1,25 @@
+from fastapi.responses import JSONResponse
+from shared.utils.model_lifecycle import ModelLifecycleManager
+
+class HealthController:
+    """
+    REST controller for liveness and readiness probes.
+    This is an inbound adapter in the hexagonal architecture.
+    """
+    def __init__(self, model_manager: ModelLifecycleManager):
+        self.model_manager = model_manager
+
+    async def liveness(self) -> dict:
+        """The process is up and serving requests"""
+        return {"status": "alive"}
+
+    async def readiness(self) -> JSONResponse:
+        """Ready once every enabled model is loaded; reports per-model state"""
+        ready = self.model_manager.is_ready()
+        return JSONResponse(
+            {
+                "status": "ready" if ready else "loading",
+                "models": self.model_manager.status()
+            },
+            status_code=200 if ready else 503
+        )
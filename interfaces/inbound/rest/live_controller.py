@@ -0,0 +1,79 @@
+from typing import AsyncGenerator, Optional
+from fastapi import WebSocket, WebSocketDisconnect
+from application.use_cases.live_transcribe_usecase import LiveTranscribeUseCase
+from shared.utils.priority_scheduler import INTERACTIVE, AdmissionRejectedError, job_class, tenant_id
+
+# Text message a client sends to end its session (the last utterance is still finalized)
+END_OF_STREAM = "end"
+
+
+class LiveController:
+    """
+    WebSocket controller for live transcription.
+    This is an inbound adapter in the hexagonal architecture.
+
+    Clients send binary messages of 16-bit little-endian mono PCM and receive
+    JSON messages: ``partial`` and ``final`` updates of each utterance, then
+    ``done`` after they send ``end``.
+    """
+    def __init__(self, live_transcribe_usecase: LiveTranscribeUseCase):
+        self.live_transcribe_usecase = live_transcribe_usecase
+
+    @staticmethod
+    async def _frames(websocket: WebSocket) -> AsyncGenerator[bytes, None]:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes"):
+                yield message["bytes"]
+            elif (message.get("text") or "").strip().lower() == END_OF_STREAM:
+                return
+
+    async def transcribe(
+        self,
+        websocket: WebSocket,
+        sample_rate: int = 16000,
+        model: Optional[str] = None,
+        quality: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        api_key: Optional[str] = None
+    ) -> None:
+        """
+        Transcribe PCM streamed over a WebSocket, sending updates back as they are
+        ready. Live captions are scheduled in the interactive class.
+        """
+        await websocket.accept()
+        tenant = tenant_id(api_key)
+        try:
+            if model and quality:
+                raise LookupError("Specify either model or quality, not both")
+            requested_model = model or quality
+            self.live_transcribe_usecase.validate_options(sample_rate, requested_model, profile)
+            with job_class(tenant, INTERACTIVE):
+                self.live_transcribe_usecase.admit()
+        except LookupError as e:
+            await websocket.send_json({"type": "error", "detail": str(e)})
+            await websocket.close(code=1008)
+            return
+        except AdmissionRejectedError as e:
+            await websocket.send_json({"type": "error", "detail": str(e), "retry_after": e.retry_after})
+            # Try again later
+            await websocket.close(code=1013)
+            return
+
+        try:
+            with job_class(tenant, INTERACTIVE):
+                async for update in self.live_transcribe_usecase.execute(
+                    self._frames(websocket), sample_rate=sample_rate, model=requested_model,
+                    profile=profile, language=language
+                ):
+                    await websocket.send_json({"type": update.kind, **update.to_dict()})
+            await websocket.send_json({"type": "done"})
+            await websocket.close()
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            await websocket.send_json({"type": "error", "detail": str(e)})
+            await websocket.close(code=1011)
@@ -0,0 +1,14 @@
+from fastapi import Response
+from shared.utils.metrics import CONTENT_TYPE, MetricsRegistry
+
+class MetricsController:
+    """
+    REST controller exposing metrics in the Prometheus text format.
+    This is an inbound adapter in the hexagonal architecture.
+    """
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+
+    async def metrics(self) -> Response:
+        """Current values of all registered metrics"""
+        return Response(self.registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,29 @@
+import asyncio
+
+from fastapi import HTTPException
+from application.use_cases.search_transcripts_usecase import SearchTranscriptsUseCase
+
+class SearchController:
+    """
+    REST controller for transcript search.
+    This is an inbound adapter in the hexagonal architecture.
+    """
+    def __init__(self, search_transcripts_usecase: SearchTranscriptsUseCase):
+        self.search_transcripts_usecase = search_transcripts_usecase
+
+    async def search(self, query: str, limit: int, offset: int) -> dict:
+        """Search stored transcripts"""
+        try:
+            # Off the event loop: the search and the clips' access records do I/O
+            hits = await asyncio.to_thread(self.search_transcripts_usecase.execute, query, limit=limit, offset=offset)
+            return {
+                "query": query,
+                "offset": offset,
+                "limit": limit,
+                "hits": [hit.to_dict() for hit in hits],
+                "next_offset": offset + len(hits) if len(hits) == limit else None
+            }
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
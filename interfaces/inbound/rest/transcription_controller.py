@@ -1,55 +1,237 @@
-from fastapi import HTTPException
-from fastapi.responses import StreamingResponse
+import base64
+import binascii
+import hashlib
+import json
+from typing import Optional
+from fastapi import HTTPException, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from application.use_cases.export_transcript_usecase import ExportTranscriptUseCase, UnsupportedExportFormatError
 from application.use_cases.transcribe_audio_usecase import TranscribeAudioUseCase
+from domain.ports.transcription_port import UnsupportedTranscriptionOptionError
+from domain.segment_table import SegmentTable
+from shared.utils.priority_scheduler import (
+    INTERACTIVE, AdmissionRejectedError, JobClass, UnknownPriorityError, check_priority, job_class, tenant_id
+)
 
 class TranscriptionController:
     """
     REST controller for transcription operations.
     This is an inbound adapter in the hexagonal architecture.
     """
-    def __init__(self, transcribe_audio_usecase: TranscribeAudioUseCase):
+    def __init__(
+        self,
+        transcribe_audio_usecase: TranscribeAudioUseCase,
+        export_transcript_usecase: Optional[ExportTranscriptUseCase] = None
+    ):
         self.transcribe_audio_usecase = transcribe_audio_usecase
+        self.export_transcript_usecase = export_transcript_usecase
 
-    async def transcribe_audio(self, clip_id: str) -> dict:
-        """Transcribe an audio clip"""
+    @staticmethod
+    def _requested_model(model: Optional[str], quality: Optional[str]) -> Optional[str]:
+        if model and quality:
+            raise HTTPException(status_code=400, detail="Specify either model or quality, not both")
+        return model or quality
+
+    @staticmethod
+    def _job_class(api_key: Optional[str], priority: Optional[str]) -> JobClass:
+        try:
+            return JobClass(tenant_id(api_key), check_priority(priority, default=INTERACTIVE))
+        except UnknownPriorityError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    def _too_busy(error: AdmissionRejectedError) -> HTTPException:
+        return HTTPException(
+            status_code=429, detail=str(error), headers={"Retry-After": str(int(error.retry_after))}
+        )
+
+    async def transcribe_audio(
+        self,
+        clip_id: str,
+        model: Optional[str] = None,
+        quality: Optional[str] = None,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False,
+        api_key: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> dict:
+        """
+        Transcribe an audio clip, optionally with a specific model, quality preset,
+        decoding profile or language. The job is scheduled for the API key's
+        tenant in the requested priority class.
+        """
         try:
-            segments = await self.transcribe_audio_usecase.execute(clip_id)
+            requested = self._job_class(api_key, priority)
+            with job_class(requested.tenant, requested.priority):
+                self.transcribe_audio_usecase.admit(clip_id)
+                segments = await self.transcribe_audio_usecase.execute(
+                    clip_id,
+                    model=self._requested_model(model, quality),
+                    profile=profile,
+                    language=language,
+                    per_speaker_language=per_speaker_language,
+                    profiler=profiler
+                )
             return {
-                "segments": [
-                    {
-                        "start": seg.start,
-                        "end": seg.end,
-                        "speaker": seg.speaker_label,
-                        "text": seg.text
-                    }
-                    for seg in segments
-                ]
+                "segments": SegmentTable.coerce(segments).to_records()
             }
+        except HTTPException:
+            raise
+        except AdmissionRejectedError as e:
+            raise self._too_busy(e)
+        except UnsupportedTranscriptionOptionError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def get_transcription(self, clip_id: str) -> dict:
-        """Get transcription by audio clip ID"""
+    @staticmethod
+    def _encode_cursor(offset: int) -> str:
+        return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> int:
         try:
-            segments = await self.transcribe_audio_usecase.get_or_transcribe(clip_id)
-            return {
-                "segments": [
-                    {
-                        "start": seg.start,
-                        "end": seg.end,
-                        "speaker": seg.speaker_label,
-                        "text": seg.text
-                    }
-                    for seg in segments
-                ]
+            padded = cursor + "=" * (-len(cursor) % 4)
+            prefix, value = base64.urlsafe_b64decode(padded).decode().split(":", 1)
+            if prefix != "o" or int(value) < 0:
+                raise ValueError
+            return int(value)
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    @staticmethod
+    def _etag(version: str, *params) -> str:
+        digest = hashlib.sha1("|".join([version, *map(str, params)]).encode()).hexdigest()
+        return f'"{digest}"'
+
+    @staticmethod
+    def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    async def get_transcription(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        api_key: Optional[str] = None,
+        priority: Optional[str] = None,
+        format: Optional[str] = None,
+        words: bool = False
+    ) -> Response:
+        """
+        Get transcription by audio clip ID.
+        Supports time/speaker filters, offset or cursor pagination and ETag revalidation.
+        Other formats than JSON (srt, vtt, jsonl, txt) are streamed as a whole.
+        """
+        try:
+            if format is not None and format != "json":
+                return await self._export(
+                    clip_id, format, words, start, end, speaker, offset, limit, cursor, if_none_match, api_key, priority
+                )
+            if cursor:
+                offset = self._decode_cursor(cursor)
+            params = (start, end, speaker, offset, limit)
+
+            # Answer revalidation requests without reading any segments
+            version = self.transcribe_audio_usecase.get_transcription_version(clip_id)
+            if version is not None and self._etag_matches(self._etag(version, *params), if_none_match):
+                return Response(status_code=304, headers={"ETag": self._etag(version, *params)})
+
+            # Transcribes the clip first if it has no stored transcription
+            requested = self._job_class(api_key, priority)
+            with job_class(requested.tenant, requested.priority):
+                self.transcribe_audio_usecase.admit(clip_id)
+                page = await self.transcribe_audio_usecase.get_transcription_page(
+                    clip_id,
+                    start=start,
+                    end=end,
+                    speaker_label=speaker,
+                    offset=offset,
+                    limit=limit
+                )
+            body = {
+                "segments": page.segments.to_records()
             }
+            if limit is not None:
+                body["offset"] = page.offset
+                body["limit"] = page.limit
+                body["next_offset"] = page.next_offset
+                body["next_cursor"] = (
+                    self._encode_cursor(page.next_offset) if page.next_offset is not None else None
+                )
+
+            headers = {}
+            if page.version is not None:
+                headers["ETag"] = self._etag(page.version, *params)
+            return JSONResponse(body, headers=headers)
+        except HTTPException:
+            raise
+        except AdmissionRejectedError as e:
+            raise self._too_busy(e)
+        except UnsupportedExportFormatError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def _export(
+        self,
+        clip_id: str,
+        fmt: str,
+        words: bool,
+        start: Optional[float],
+        end: Optional[float],
+        speaker: Optional[str],
+        offset: int,
+        limit: Optional[int],
+        cursor: Optional[str],
+        if_none_match: Optional[str],
+        api_key: Optional[str],
+        priority: Optional[str]
+    ) -> Response:
+        """Stream the transcription in an export format (errors are mapped by get_transcription)"""
+        if self.export_transcript_usecase is None:
+            raise HTTPException(status_code=400, detail="Transcript exports are not available")
+        if offset or limit is not None or cursor:
+            raise HTTPException(status_code=400, detail="Exports are not paginated; use start/end to select a part")
+        self.export_transcript_usecase.validate(fmt)
+        params = (start, end, speaker, fmt, words)
+
+        version = self.transcribe_audio_usecase.get_transcription_version(clip_id)
+        if version is not None and self._etag_matches(self._etag(version, *params), if_none_match):
+            return Response(status_code=304, headers={"ETag": self._etag(version, *params)})
+
+        requested = self._job_class(api_key, priority)
+        with job_class(requested.tenant, requested.priority):
+            self.transcribe_audio_usecase.admit(clip_id)
+            export = await self.export_transcript_usecase.execute(
+                clip_id, fmt, words=words, start=start, end=end, speaker_label=speaker
+            )
+        headers = {"Content-Disposition": f'inline; filename="{export.filename}"'}
+        if export.version is not None:
+            headers["ETag"] = self._etag(export.version, *params)
+        return StreamingResponse(export.chunks, media_type=export.media_type, headers=headers)
+
+    async def get_trace(self, clip_id: str) -> dict:
+        """Get the span timeline (and profile, if requested) of the clip's latest transcription job"""
+        trace = self.transcribe_audio_usecase.get_trace(clip_id)
+        if trace is None:
+            raise HTTPException(status_code=404, detail=f"No recent transcription job traced for clip {clip_id}")
+        return trace.to_dict()
+
     async def delete_transcription(self, clip_id: str) -> dict:
         """Delete transcription by audio clip ID"""
         try:
@@ -58,22 +240,69 @@ class TranscriptionController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def stream_transcription(self, clip_id: str):
-        """Stream transcription results"""
+    async def stream_transcription(
+        self,
+        clip_id: str,
+        model: Optional[str] = None,
+        quality: Optional[str] = None,
+        progressive: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None,
+        per_speaker_language: bool = False,
+        profiler: bool = False,
+        api_key: Optional[str] = None,
+        priority: Optional[str] = None
+    ):
+        """
+        Stream transcription results.
+        In progressive mode, ``draft`` events carry quick drafts and ``final``
+        events replace the draft with the same index.
+        """
         try:
+            requested_model = self._requested_model(model, quality)
+            requested = self._job_class(api_key, priority)
+            # Reject unknown models and full queues before the response starts streaming
+            self.transcribe_audio_usecase.validate_options(requested_model, profile)
+            with job_class(requested.tenant, requested.priority):
+                self.transcribe_audio_usecase.admit(clip_id)
+
+            if progressive:
+                async def generate_progressive():
+                    with job_class(requested.tenant, requested.priority):
+                        async for update in self.transcribe_audio_usecase.get_or_transcribe_progressive(
+                            clip_id, model=requested_model, profile=profile,
+                            language=language, per_speaker_language=per_speaker_language, profiler=profiler
+                        ):
+                            yield f"event: {update.kind}\ndata: {json.dumps(update.to_dict())}\n\n"
+
+                return StreamingResponse(
+                    generate_progressive(),
+                    media_type="text/event-stream"
+                )
+
             async def generate():
-                async for segment in self.transcribe_audio_usecase.get_or_transcribe_streaming(clip_id):
-                    yield f"data: {{\n"
-                    yield f'  "start": {segment.start},\n'
-                    yield f'  "end": {segment.end},\n'
-                    yield f'  "speaker": "{segment.speaker_label}",\n'
-                    yield f'  "text": "{segment.text}"\n'
-                    yield "}\n\n"
+                with job_class(requested.tenant, requested.priority):
+                    async for segment in self.transcribe_audio_usecase.get_or_transcribe_streaming(
+                        clip_id, model=requested_model, profile=profile,
+                        language=language, per_speaker_language=per_speaker_language, profiler=profiler
+                    ):
+                        yield f"data: {{\n"
+                        yield f'  "start": {segment.start},\n'
+                        yield f'  "end": {segment.end},\n'
+                        yield f'  "speaker": "{segment.speaker_label}",\n'
+                        yield f'  "text": "{segment.text}"\n'
+                        yield "}\n\n"
 
             return StreamingResponse(
                 generate(),
                 media_type="text/event-stream"
             )
+        except HTTPException:
+            raise
+        except AdmissionRejectedError as e:
+            raise self._too_busy(e)
+        except UnsupportedTranscriptionOptionError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
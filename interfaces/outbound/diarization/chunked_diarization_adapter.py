@@ -1,21 +1,31 @@
 import os
 import asyncio
+import functools
 import tempfile
-from typing import AsyncGenerator, List, Tuple, Dict, Any
+import time
+from typing import TYPE_CHECKING, AsyncGenerator, List, Optional, Tuple, Dict, Any, Union
 from concurrent.futures import ThreadPoolExecutor
 
 from pydub import AudioSegment, silence
-from pyannote.audio import Pipeline
 
-from domain.ports.diarization_port import DiarizationPort
+from domain.ports.diarization_port import DiarizationPort, IncompleteDiarizationError
 from domain.audio_clip import AudioClip
 from domain.speaker_segment import SpeakerSegment
+from shared.utils.audio_cache import DecodedAudioCache
+from shared.utils.model_lifecycle import ModelHandle, resolve_model_async
+from shared.utils.metrics import QUEUE_DEPTH, measure
+from shared.utils.resource_governor import ResourceGovernor
+from shared.utils.tracing import in_context
+
+if TYPE_CHECKING:
+    from pyannote.audio import Pipeline
 
 def detect_chunks(
     file_path: str,
     min_silence_ms: int = 600,
     silence_thresh_db: int = -40,
-    min_chunk_duration: float = 0.5  # Minimum chunk duration in seconds
+    min_chunk_duration: float = 0.5,  # Minimum chunk duration in seconds
+    audio: Optional[AudioSegment] = None
 ) -> List[Tuple[float, float]]:
     """
     Detect chunks in audio file based on silence detection.
@@ -26,8 +36,10 @@ def detect_chunks(
         min_silence_ms: Minimum silence duration in milliseconds
         silence_thresh_db: Silence threshold in dB
         min_chunk_duration: Minimum chunk duration in seconds
+        audio: The file's already decoded audio (decoded from file_path if None)
     """
-    audio = AudioSegment.from_file(file_path)
+    if audio is None:
+        audio = AudioSegment.from_file(file_path)
     silent_ranges = silence.detect_silence(
         audio,
         min_silence_len=min_silence_ms,
@@ -67,23 +79,31 @@ class ChunkedDiarizationAdapter(DiarizationPort):
     """
     def __init__(
         self, 
-        pipeline: Pipeline, 
+        pipeline: Union["Pipeline", ModelHandle], 
         min_silence_ms: int = 600, 
         silence_thresh_db: int = -40,
         min_chunk_duration: float = 0.5,
         max_workers: int = 3,
-        temp_dir: str = None
+        temp_dir: str = None,
+        audio_cache: Optional[DecodedAudioCache] = None,
+        governor: Optional[ResourceGovernor] = None,
+        model_name: Optional[str] = None
     ):
         """
         Initialize chunked diarization adapter.
         
         Args:
-            pipeline: Pyannote pipeline for speaker diarization
+            pipeline: Pyannote pipeline for speaker diarization (or a ModelHandle loading it)
             min_silence_ms: Minimum silence duration in milliseconds
             silence_thresh_db: Silence threshold in dB
             min_chunk_duration: Minimum chunk duration in seconds
-            max_workers: Maximum number of parallel workers
+            max_workers: Maximum number of parallel workers (when no governor is given)
             temp_dir: Directory for temporary files (uses system default if None)
+            audio_cache: Cache of decoded clips shared with other adapters (None decodes every time)
+            governor: Resource governor adjusting the number of parallel workers from observed
+                chunk latency and memory (None keeps max_workers)
+            model_name: Name of the Pyannote model behind the pipeline (results are not
+                cached without it)
         """
         self.pipeline = pipeline
         self.min_silence_ms = min_silence_ms
@@ -91,16 +111,42 @@ class ChunkedDiarizationAdapter(DiarizationPort):
         self.min_chunk_duration = min_chunk_duration
         self.max_workers = max_workers
         self.temp_dir = temp_dir
+        self.audio_cache = audio_cache
+        self.governor = governor
+        self.model_name = model_name
         
     async def diarize(self, clip: AudioClip) -> List[SpeakerSegment]:
         """
         Diarize the audio clip and return a list of speaker segments.
         """
-        segments = [seg async for seg in self.diarize_stream(clip)]
+        segments = []
+        try:
+            async for seg in self.diarize_stream(clip):
+                segments.append(seg)
+        except IncompleteDiarizationError as e:
+            raise IncompleteDiarizationError(str(e), segments) from None
         return segments
 
+    def cache_key(self) -> Optional[str]:
+        if self.model_name is None:
+            return None
+        # Chunking determines the turns as much as the model does
+        return (
+            f"pyannote:{self.model_name}:silence={self.min_silence_ms}:thresh={self.silence_thresh_db}"
+            f":min_chunk={self.min_chunk_duration}"
+        )
+
+    def _workers(self) -> int:
+        return self.governor.chunk_workers if self.governor is not None else self.max_workers
+
+    def _decode(self, file_path: str) -> AudioSegment:
+        if self.audio_cache is None:
+            return AudioSegment.from_file(file_path)
+        return self.audio_cache.get(file_path, AudioSegment.from_file)
+
     async def _process_chunk(
         self, 
+        pipeline: "Pipeline",
         clip: AudioClip, 
         chunk_start: float, 
         chunk_end: float,
@@ -110,7 +156,7 @@ class ChunkedDiarizationAdapter(DiarizationPort):
         results = []
         
         # Create a temporary file for the chunk
-        with tempfile.NamedTemporaryFile(
+        with measure("process_chunk", start=chunk_start, end=chunk_end) as attrs, tempfile.NamedTemporaryFile(
             suffix=".wav", 
             delete=False,
             dir=self.temp_dir
@@ -122,10 +168,14 @@ class ChunkedDiarizationAdapter(DiarizationPort):
                 
                 # Run the pipeline
                 loop = asyncio.get_running_loop()
+                started = time.perf_counter()
                 diarization = await loop.run_in_executor(
                     None, 
-                    lambda: self.pipeline({"audio": tmp.name})
+                    in_context(pipeline),
+                    {"audio": tmp.name}
                 )
+                if self.governor is not None:
+                    self.governor.observe_chunk(chunk_end - chunk_start, time.perf_counter() - started)
 
                 # Create speaker segments with adjusted timestamps
                 for turn, _, speaker in diarization.itertracks(yield_label=True):
@@ -137,6 +187,7 @@ class ChunkedDiarizationAdapter(DiarizationPort):
                     )
                     results.append(segment)
                 
+                attrs["segments"] = len(results)
                 return results
             finally:
                 # Clean up temporary file
@@ -148,44 +199,67 @@ class ChunkedDiarizationAdapter(DiarizationPort):
         Stream speaker segments as soon as they are available.
         Processes audio in chunks based on silence detection for better performance.
         Chunks are processed in parallel for faster results.
+        A chunk that fails is skipped, and IncompleteDiarizationError is raised
+        once the other chunks' segments have been yielded.
         """
-        if not self.pipeline:
+        pipeline = await resolve_model_async(self.pipeline)
+        if not pipeline:
             raise ValueError("Diarization pipeline is not available")
 
         try:
-            # Load the audio file once
-            audio = AudioSegment.from_file(clip.file_path)
+            # Load the audio file once, on a worker thread
+            loop = asyncio.get_running_loop()
+            with measure("audio_decode") as attrs:
+                audio = await loop.run_in_executor(None, in_context(self._decode), clip.file_path)
+                attrs["audio_seconds"] = len(audio) / 1000
             
-            # Detect chunks based on silence
-            chunks = detect_chunks(
-                clip.file_path, 
-                min_silence_ms=self.min_silence_ms, 
-                silence_thresh_db=self.silence_thresh_db,
-                min_chunk_duration=self.min_chunk_duration
-            )
+            # Detect chunks based on silence in the decoded audio
+            with measure("detect_chunks") as attrs:
+                chunks = await loop.run_in_executor(None, in_context(functools.partial(
+                    detect_chunks,
+                    clip.file_path, 
+                    min_silence_ms=self.min_silence_ms, 
+                    silence_thresh_db=self.silence_thresh_db,
+                    min_chunk_duration=self.min_chunk_duration,
+                    audio=audio
+                )))
+                attrs["chunks"] = len(chunks)
             
-            # Process chunks in batches to limit concurrent processing
-            for i in range(0, len(chunks), self.max_workers):
-                batch = chunks[i:i+self.max_workers]
-                tasks = [
-                    self._process_chunk(clip, start, end, audio)
-                    for start, end in batch
-                ]
-                
-                # Wait for all tasks in the batch to complete
-                chunk_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results in order
-                for result in chunk_results:
-                    if isinstance(result, Exception):
+            # Keep up to the current worker count of chunks in flight and yield their
+            # segments in chunk order; the count may change between chunks
+            pending = {}
+            next_chunk = finished = failed = 0
+            QUEUE_DEPTH.inc(len(chunks), queue="diarization_chunks")
+            try:
+                for index in range(len(chunks)):
+                    while next_chunk < len(chunks) and len(pending) < self._workers():
+                        start, end = chunks[next_chunk]
+                        pending[next_chunk] = asyncio.ensure_future(
+                            self._process_chunk(pipeline, clip, start, end, audio)
+                        )
+                        next_chunk += 1
+
+                    try:
+                        result = await pending.pop(index)
+                    except Exception as e:
                         # Log the error but continue processing
-                        print(f"Error processing chunk: {result}")
+                        print(f"Error processing chunk: {e}")
+                        failed += 1
                         continue
-                    
+                    finally:
+                        finished += 1
+                        QUEUE_DEPTH.dec(queue="diarization_chunks")
+
                     # Yield segments in order
                     for segment in sorted(result, key=lambda s: s.start):
                         yield segment
-                        
+                if failed:
+                    raise IncompleteDiarizationError(f"{failed} of {len(chunks)} chunks could not be diarized")
+            finally:
+                for task in pending.values():
+                    task.cancel()
+                QUEUE_DEPTH.dec(len(chunks) - finished, queue="diarization_chunks")
+
         except Exception as e:
             # Handle any unexpected errors
             print(f"Error in diarize_stream: {e}")
@@ -1,10 +1,11 @@
-from typing import AsyncGenerator, List
+from typing import AsyncGenerator, List, Optional
 import asyncio
 from uuid import UUID
 
 from domain.ports.diarization_port import DiarizationPort
 from domain.audio_clip import AudioClip
 from domain.speaker_segment import SpeakerSegment
+from shared.utils.metrics import measure
 
 """
 Fake outbound adapter for diarization used in testing.
@@ -24,19 +25,31 @@ class FakeDiarizationAdapter(DiarizationPort):
     
     def __init__(self, 
                  segment_duration: float = 5.0, 
-                 total_duration: float = 30.0,
-                 num_speakers: int = 2):
+                 total_duration: Optional[float] = 30.0,
+                 num_speakers: int = 2,
+                 delay: float = 0.05):
         """
         Initialize the fake diarization adapter.
         
         Args:
             segment_duration: Duration of each segment in seconds
-            total_duration: Total duration of the audio in seconds
+            total_duration: Total duration of the audio in seconds (None uses the clip's duration)
             num_speakers: Number of unique speakers to generate
+            delay: Simulated processing time per segment in seconds
         """
         self.segment_duration = segment_duration
         self.total_duration = total_duration
         self.num_speakers = num_speakers
+        self.delay = delay
+
+    def cache_key(self) -> Optional[str]:
+        return f"fake:turn={self.segment_duration}:total={self.total_duration}:speakers={self.num_speakers}"
+
+    async def diarize(self, clip: AudioClip) -> List[SpeakerSegment]:
+        """
+        Return all fake speaker segments at once.
+        """
+        return [segment async for segment in self.diarize_stream(clip)]
     
     async def diarize_stream(self, clip: AudioClip) -> AsyncGenerator[SpeakerSegment, None]:
         """
@@ -49,9 +62,10 @@ class FakeDiarizationAdapter(DiarizationPort):
             Async generator yielding speaker segments
         """
         current_time = 0.0
+        total_duration = self.total_duration if self.total_duration is not None else (clip.duration or 0.0)
         
-        while current_time < self.total_duration:
-            end_time = min(current_time + self.segment_duration, self.total_duration)
+        while current_time < total_duration:
+            end_time = min(current_time + self.segment_duration, total_duration)
             speaker_idx = int(current_time / self.segment_duration) % self.num_speakers
             
             segment = SpeakerSegment(
@@ -61,8 +75,9 @@ class FakeDiarizationAdapter(DiarizationPort):
                 speaker_label=f"SPEAKER_{speaker_idx + 1}"
             )
             
-            # Simulate some processing time
-            await asyncio.sleep(0.05)
+            # Simulate some processing time (recorded like a real diarization chunk)
+            with measure("process_chunk", start=current_time, end=end_time, segments=1):
+                await asyncio.sleep(self.delay)
             
             yield segment
             current_time = end_time
\ No newline at end of file
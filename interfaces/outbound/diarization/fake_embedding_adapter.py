@@ -0,0 +1,64 @@
+from typing import List, Optional
+import array
+import asyncio
+import math
+import sys
+
+from domain.ports.speaker_embedding_port import SpeakerEmbeddingPort
+from shared.utils.metrics import measure
+from shared.utils.tracing import in_context
+
+"""
+Fake outbound adapter for speaker embeddings used in testing, benchmarks and load tests.
+
+In hexagonal architecture:
+- Outbound adapters implement ports defined by the domain
+- This fake adapter lets live transcription tell speakers apart without Pyannote
+"""
+
+# Pitch bands (Hz) whose energies make up the fake embedding
+BANDS = [80.0 + 20.0 * i for i in range(24)]
+
+
+class FakeEmbeddingAdapter(SpeakerEmbeddingPort):
+    """
+    A fake implementation of the SpeakerEmbeddingPort for testing purposes.
+    The embedding is the normalized energy of the utterance in a few pitch
+    bands, which separates speakers of clearly different pitch (such as the
+    synthetic voices of the benchmarks).
+    """
+    def __init__(self, max_seconds: float = 2.0):
+        """
+        Args:
+            max_seconds: Only the first max_seconds of an utterance are analysed
+        """
+        self.max_seconds = max_seconds
+
+    def _embed(self, pcm: bytes, sample_rate: int) -> List[float]:
+        samples = array.array("h", pcm[:2 * int(self.max_seconds * sample_rate)])
+        if sys.byteorder == "big":
+            samples.byteswap()
+        # Blocks as long as a band is wide, so a pitch between two bands still registers
+        block = int(sample_rate / (BANDS[1] - BANDS[0]))
+        energies = [0.0] * len(BANDS)
+        for offset in range(0, len(samples) - block + 1, block):
+            window = samples[offset:offset + block]
+            for band, frequency in enumerate(BANDS):
+                # Goertzel filter: energy of one frequency
+                coefficient = 2 * math.cos(2 * math.pi * frequency / sample_rate)
+                previous = before = 0.0
+                for sample in window:
+                    previous, before = sample + coefficient * previous - before, previous
+                energies[band] += max(0.0, previous * previous + before * before - coefficient * previous * before)
+        norm = math.sqrt(sum(energy * energy for energy in energies)) or 1.0
+        return [energy / norm for energy in energies]
+
+    async def embed(self, pcm: bytes, sample_rate: int) -> Optional[List[float]]:
+        """
+        Return the fake embedding of an utterance.
+        """
+        if not pcm:
+            return None
+        loop = asyncio.get_running_loop()
+        with measure("speaker_embedding", audio_seconds=len(pcm) / 2 / sample_rate):
+            return await loop.run_in_executor(None, in_context(self._embed), pcm, sample_rate)
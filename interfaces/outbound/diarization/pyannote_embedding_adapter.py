@@ -0,0 +1,59 @@
+import asyncio
+import math
+from typing import TYPE_CHECKING, List, Optional, Union
+
+from domain.ports.speaker_embedding_port import SpeakerEmbeddingPort
+from shared.utils.model_lifecycle import ModelHandle, resolve_model_async
+from shared.utils.metrics import measure
+from shared.utils.tracing import in_context
+
+if TYPE_CHECKING:
+    from pyannote.audio import Pipeline
+
+
+class PyannoteEmbeddingAdapter(SpeakerEmbeddingPort):
+    """
+    Adapter implementation of the SpeakerEmbeddingPort interface that reuses
+    the embedding model of the loaded Pyannote diarization pipeline, so live
+    speaker assignment needs no extra model.
+    """
+    # Shorter utterances give unreliable embeddings
+    MIN_SECONDS = 0.5
+
+    def __init__(self, pipeline: Union["Pipeline", ModelHandle]):
+        """
+        Args:
+            pipeline: Pyannote speaker diarization pipeline (or a ModelHandle loading it)
+        """
+        self.pipeline = pipeline
+
+    @staticmethod
+    def _embed(model, pcm: bytes) -> Optional[List[float]]:
+        """Blocking part of an embedding; runs on a worker thread"""
+        import numpy as np
+        import torch
+
+        waveform = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        # (batch, channel, sample)
+        embeddings = model(torch.from_numpy(waveform).reshape(1, 1, -1))
+        embedding = [float(value) for value in embeddings[0]]
+        return None if any(math.isnan(value) for value in embedding) else embedding
+
+    async def embed(self, pcm: bytes, sample_rate: int) -> Optional[List[float]]:
+        """
+        Compute the speaker embedding of an utterance with the pipeline's
+        embedding model.
+        """
+        pipeline = await resolve_model_async(self.pipeline)
+        # SpeakerDiarization pipelines keep their embedding model here
+        model = getattr(pipeline, "_embedding", None) if pipeline else None
+        if model is None:
+            raise ValueError("Speaker embedding model is not available")
+        if sample_rate != getattr(model, "sample_rate", sample_rate):
+            return None
+        if len(pcm) / 2 / sample_rate < self.MIN_SECONDS:
+            return None
+
+        loop = asyncio.get_running_loop()
+        with measure("speaker_embedding", audio_seconds=len(pcm) / 2 / sample_rate):
+            return await loop.run_in_executor(None, in_context(self._embed), model, pcm)
@@ -1,5 +1,6 @@
 from pyannote.audio import Pipeline
 from config import HUGGINGFACE_AUTH_TOKEN
+from shared.utils.resource_governor import get_resource_governor
 
 _pyannote_pipeline = None
 
@@ -15,6 +16,8 @@ def load_pyannote_pipeline(model_name):
     """
     global _pyannote_pipeline
     if _pyannote_pipeline is None:
+        # Leave the cores the resource governor assigns to CTranslate2 to Whisper
+        get_resource_governor().apply_torch_threads()
         _pyannote_pipeline = Pipeline.from_pretrained(
             model_name,
             use_auth_token=HUGGINGFACE_AUTH_TOKEN
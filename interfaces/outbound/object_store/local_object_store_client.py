@@ -0,0 +1,87 @@
+import os
+import shutil
+from typing import BinaryIO, Iterator, Optional
+
+from interfaces.outbound.object_store.object_store_client import ObjectInfo, ObjectStoreClient
+
+
+class LocalObjectStoreClient(ObjectStoreClient):
+    """
+    Object store kept in a local (or shared, network-mounted) directory: each
+    object is a file at its key. A stand-in for a bucket in development and
+    benchmarks, with the same visibility rule (objects appear atomically once
+    fully written).
+    """
+    PART_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid object key '{key}'")
+        return path
+
+    def _write(self, key: str, write) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.part"
+        try:
+            with open(tmp_path, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def upload(self, key: str, stream: BinaryIO) -> None:
+        def write(f):
+            for part in iter(lambda: stream.read(self.PART_SIZE), b""):
+                f.write(part)
+        self._write(key, write)
+
+    def download(self, key: str, path: str) -> None:
+        shutil.copyfile(self._path(key), path)
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        self._write(key, lambda f: f.write(data))
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            stat = os.stat(self._path(key))
+        except FileNotFoundError:
+            return None
+        return ObjectInfo(key, stat.st_size, stat.st_mtime)
+
+    def list(self, prefix: str) -> Iterator[ObjectInfo]:
+        # Only walk the directory the prefix points into
+        directory = os.path.dirname(os.path.join(self.root, prefix))
+        if not os.path.isdir(directory):
+            return
+        for dirpath, _, filenames in os.walk(directory):
+            for name in filenames:
+                if name.endswith(".part"):
+                    continue
+                key = os.path.relpath(os.path.join(dirpath, name), self.root).replace(os.sep, "/")
+                if not key.startswith(prefix):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(dirpath, name))
+                except FileNotFoundError:
+                    continue
+                yield ObjectInfo(key, stat.st_size, stat.st_mtime)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
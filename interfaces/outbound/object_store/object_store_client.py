@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """A stored object's key, size and last modification"""
+    key: str
+    size: int
+    last_modified: float  # seconds since the epoch
+
+
+class ObjectStoreClient(ABC):
+    """
+    The few object store operations the object store repositories need, so
+    they run against S3-compatible stores and a local directory alike.
+    Calls are blocking.
+    """
+    @abstractmethod
+    def upload(self, key: str, stream: BinaryIO) -> None:
+        """Store the stream's content under ``key``, reading it in parts; the object appears only once complete"""
+        pass
+
+    @abstractmethod
+    def download(self, key: str, path: str) -> None:
+        """
+        Write the object to a local file
+
+        Raises:
+            FileNotFoundError: If there is no such object
+        """
+        pass
+
+    @abstractmethod
+    def put_bytes(self, key: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """The object's content (None if there is no such object)"""
+        pass
+
+    @abstractmethod
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        pass
+
+    @abstractmethod
+    def list(self, prefix: str) -> Iterator[ObjectInfo]:
+        """Every object whose key starts with ``prefix``"""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the object if it exists"""
+        pass
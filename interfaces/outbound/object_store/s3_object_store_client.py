@@ -0,0 +1,105 @@
+from typing import BinaryIO, Iterator, Optional
+
+from interfaces.outbound.object_store.object_store_client import ObjectInfo, ObjectStoreClient
+
+
+class S3ObjectStoreClient(ObjectStoreClient):
+    """
+    Object store client for S3 and S3-compatible stores (MinIO, Ceph, R2, ...).
+
+    Uploads are streamed as multipart uploads of ``part_size`` bytes, so a
+    clip is never held in memory whole; downloads use boto3's ranged
+    transfer. Credentials come from the usual AWS environment variables or
+    instance profile. boto3 is only needed when this client is used.
+    """
+    # S3 rejects multipart parts below 5 MiB (except the last one)
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        part_size: int = 8 * 1024 * 1024
+    ):
+        """
+        Args:
+            bucket: Bucket name
+            endpoint_url: Endpoint of an S3-compatible store (None for AWS)
+            region: Bucket region
+            part_size: Multipart upload part size in bytes
+        """
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError as e:
+            raise RuntimeError("The s3 audio storage backend requires boto3 (pip install boto3)") from e
+        self.bucket = bucket
+        self.part_size = max(part_size, self.MIN_PART_SIZE)
+        self._client_error = ClientError
+        self._s3 = boto3.client("s3", endpoint_url=endpoint_url or None, region_name=region or None)
+
+    def _is_missing(self, error: Exception) -> bool:
+        return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def upload(self, key: str, stream: BinaryIO) -> None:
+        first = stream.read(self.part_size)
+        if len(first) < self.part_size:
+            # Fits in one part; a plain PUT is cheaper than a multipart upload
+            self._s3.put_object(Bucket=self.bucket, Key=key, Body=first)
+            return
+
+        upload_id = self._s3.create_multipart_upload(Bucket=self.bucket, Key=key)["UploadId"]
+        parts = []
+        try:
+            part = first
+            while part:
+                response = self._s3.upload_part(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=len(parts) + 1, Body=part
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+                part = stream.read(self.part_size)
+            self._s3.complete_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            # Don't leave billed, invisible parts behind
+            self._s3.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            raise
+
+    def download(self, key: str, path: str) -> None:
+        try:
+            self._s3.download_file(self.bucket, key, path)
+        except self._client_error as e:
+            if self._is_missing(e):
+                raise FileNotFoundError(key) from e
+            raise
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        self._s3.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        try:
+            return self._s3.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+        except self._client_error as e:
+            if self._is_missing(e):
+                return None
+            raise
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            head = self._s3.head_object(Bucket=self.bucket, Key=key)
+        except self._client_error as e:
+            if self._is_missing(e):
+                return None
+            raise
+        return ObjectInfo(key, head["ContentLength"], head["LastModified"].timestamp())
+
+    def list(self, prefix: str) -> Iterator[ObjectInfo]:
+        paginator = self._s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                yield ObjectInfo(item["Key"], item["Size"], item["LastModified"].timestamp())
+
+    def delete(self, key: str) -> None:
+        self._s3.delete_object(Bucket=self.bucket, Key=key)
@@ -0,0 +1,147 @@
+import os
+from itertools import islice
+from typing import Iterator, List, Optional, Union
+
+from domain.segment_table import SegmentTable
+from domain.speaker_segment import SpeakerSegment
+from interfaces.outbound.repositories.columnar_transcript_format import ColumnarTranscript, write_transcript
+from interfaces.outbound.repositories.file_system_repository import FileSystemTranscriptionTextRepository
+from shared.utils.metrics import timed
+
+class ColumnarTranscriptionTextRepository(FileSystemTranscriptionTextRepository):
+    """
+    File system transcription repository storing committed transcripts in the
+    compact columnar ``.seg`` format (see columnar_transcript_format).
+    This is an outbound adapter in the hexagonal architecture.
+
+    In-progress jobs still append to the JSONL segment log; committing a log
+    converts it into a ``.seg`` file. JSONL and legacy JSON transcripts written
+    by FileSystemTranscriptionTextRepository remain readable.
+    """
+    def _get_columnar_path(self, clip_id: str, create: bool = False) -> str:
+        """Get the full file path for a columnar transcript"""
+        return self._path(clip_id, ".seg", create)
+
+    def _committed_path(self, clip_id: str) -> Optional[str]:
+        columnar_path = self._get_columnar_path(clip_id)
+        if os.path.exists(columnar_path):
+            return columnar_path
+        return super()._committed_path(clip_id)
+
+    def _remove_text_files(self, clip_id: str) -> None:
+        for path in (self._get_log_path(clip_id), self._get_file_path(clip_id)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def open_transcript(self, clip_id: str) -> Optional[ColumnarTranscript]:
+        """Open the memory-mapped columnar transcript of a clip, if it has one"""
+        columnar_path = self._get_columnar_path(clip_id)
+        if not os.path.exists(columnar_path):
+            return None
+        return ColumnarTranscript(columnar_path)
+
+    @timed("repository_save", attrs=lambda self, clip_id, segments: {"segments": len(segments)})
+    def save(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """Save a list of speaker segments as a columnar transcript"""
+        table = SegmentTable.coerce(segments, clip_id)
+        write_transcript(self._get_columnar_path(clip_id, create=True), clip_id, table)
+        self._remove_text_files(clip_id)
+
+        if self.search_index:
+            self.search_index.index(clip_id, table)
+
+    @timed("repository_commit")
+    def commit(self, clip_id: str) -> None:
+        """Convert the clip's segment log into a columnar transcript"""
+        segments = self.list_pending(clip_id)
+        write_transcript(self._get_columnar_path(clip_id, create=True), clip_id, segments)
+        self._remove_text_files(clip_id)
+
+        if self.search_index:
+            self.search_index.index(clip_id, segments)
+
+    @timed("repository_list")
+    def list(self, clip_id: str) -> SegmentTable:
+        """List all speaker segments for a given clip ID"""
+        transcript = self.open_transcript(clip_id)
+        if transcript is None:
+            return super().list(clip_id)
+        with transcript:
+            return transcript.to_table()
+
+    def query(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> SegmentTable:
+        """
+        Page through committed segments matching optional filters.
+        Filters run over the start/end/speaker columns; only the text of the
+        returned page is decoded.
+        """
+        transcript = self.open_transcript(clip_id)
+        if transcript is None:
+            return super().query(clip_id, start, end, speaker_label, offset, limit)
+
+        with transcript:
+            stop = offset + limit if limit is not None else None
+            return transcript.to_table(list(islice(self._matches(transcript, start, end, speaker_label), offset, stop)))
+
+    def iter_pages(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        page_size: int = 500
+    ) -> Iterator[SegmentTable]:
+        """Committed segments matching optional filters, in pages, from one scan of the columns"""
+        transcript = self.open_transcript(clip_id)
+        if transcript is None:
+            yield from super().iter_pages(clip_id, start, end, speaker_label, page_size)
+            return
+
+        with transcript:
+            matches = self._matches(transcript, start, end, speaker_label)
+            while indices := list(islice(matches, page_size)):
+                yield transcript.to_table(indices)
+
+    @staticmethod
+    def _matches(
+        transcript: ColumnarTranscript,
+        start: Optional[float],
+        end: Optional[float],
+        speaker_label: Optional[str]
+    ) -> Iterator[int]:
+        """Indices of the segments matching the filters, in order"""
+        if speaker_label is not None and speaker_label not in transcript.speakers:
+            return iter(())
+        code = transcript.speakers.index(speaker_label) if speaker_label is not None else None
+        starts, ends = transcript.starts(), transcript.ends()
+        codes = transcript.speaker_codes() if code is not None else None
+        return (
+            i for i in range(len(transcript))
+            if (start is None or ends[i] > start)
+            and (end is None or starts[i] < end)
+            and (code is None or codes[i] == code)
+        )
+
+    def delete(self, clip_id: str) -> bool:
+        """Delete a transcription (columnar, log and legacy files)"""
+        columnar_path = self._get_columnar_path(clip_id)
+        removed_columnar = False
+        if os.path.exists(columnar_path):
+            try:
+                os.remove(columnar_path)
+                removed_columnar = True
+            except Exception:
+                return False
+
+        deleted = super().delete(clip_id)
+        if removed_columnar and not deleted and self.search_index:
+            self.search_index.remove(clip_id)
+        return deleted or removed_columnar
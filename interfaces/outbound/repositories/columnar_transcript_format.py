@@ -0,0 +1,234 @@
+"""
+Compact columnar storage format for transcripts (``.seg`` files).
+
+Layout (little-endian, every section aligned to 8 bytes):
+
+    header        magic "WSEG", version, segment count, speaker count,
+                  clip id length, text blob length
+    clip id       UTF-8
+    speakers      uint32 offsets[speaker_count + 1] + UTF-8 blob
+    starts        float64[count]
+    ends          float64[count]
+    speaker codes int32[count]      (index into the speaker table, -1 = none)
+    text offsets  uint64[count + 1] (into the text blob)
+    text blob     UTF-8
+
+Columns are fixed-width, so a memory-mapped file gives O(1) random access to
+any segment without parsing the rest of the transcript.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Optional, Sequence, Union
+
+from domain.segment_table import SegmentTable
+from domain.speaker_segment import SpeakerSegment
+
+MAGIC = b"WSEG"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIIIQ4x")
+_NO_SPEAKER = -1
+
+
+def _pad(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _to_le_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le_bytes(typecode: str, data) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_transcript(clip_id: str, segments: Union[SegmentTable, Iterable[SpeakerSegment]]) -> bytes:
+    """
+    Encode speaker segments into the columnar format.
+
+    Args:
+        clip_id: ID of the audio clip (stored once, not per segment)
+        segments: Segments in transcript order
+
+    Returns:
+        The encoded file content
+    """
+    table = SegmentTable.coerce(segments, clip_id)
+    text_offsets = array("Q", [0])
+    text_parts: List[bytes] = []
+    text_size = 0
+    for text in table.texts:
+        encoded = (text or "").encode("utf-8")
+        text_parts.append(encoded)
+        text_size += len(encoded)
+        text_offsets.append(text_size)
+
+    speaker_blob = b""
+    speaker_offsets = array("I", [0])
+    for label in table.speakers:
+        speaker_blob += label.encode("utf-8")
+        speaker_offsets.append(len(speaker_blob))
+
+    clip_bytes = clip_id.encode("utf-8")
+    sections = [
+        clip_bytes,
+        _to_le_bytes(speaker_offsets) + speaker_blob,
+        _to_le_bytes(table.starts),
+        _to_le_bytes(table.ends),
+        _to_le_bytes(table.speaker_codes),
+        _to_le_bytes(text_offsets),
+    ]
+    out = bytearray(_HEADER.pack(
+        MAGIC, VERSION, 0, len(table), len(table.speakers), len(clip_bytes), text_size
+    ))
+    for section in sections:
+        out += section
+        out += b"\0" * (_pad(len(section)) - len(section))
+    for part in text_parts:
+        out += part
+    return bytes(out)
+
+
+def write_transcript(path: str, clip_id: str, segments: Union[SegmentTable, Iterable[SpeakerSegment]]) -> None:
+    """Atomically write a columnar transcript file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encode_transcript(clip_id, segments))
+    os.replace(tmp_path, path)
+
+
+class ColumnarTranscript:
+    """
+    Memory-mapped, read-only view of a columnar transcript file.
+    Individual fields are read on demand; bulk column accessors return arrays.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not a columnar transcript: {path}")
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, speaker_count, clip_len, text_size = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Unsupported transcript format in {path}")
+        self._count = count
+
+        offset = _HEADER.size
+        self.clip_id = bytes(self._buffer[offset:offset + clip_len]).decode("utf-8")
+        offset += _pad(clip_len)
+
+        speaker_offsets = _from_le_bytes("I", self._buffer[offset:offset + 4 * (speaker_count + 1)])
+        blob_start = offset + 4 * (speaker_count + 1)
+        self.speakers = [
+            bytes(self._buffer[blob_start + speaker_offsets[i]:blob_start + speaker_offsets[i + 1]]).decode("utf-8")
+            for i in range(speaker_count)
+        ]
+        offset += _pad(4 * (speaker_count + 1) + speaker_offsets[-1])
+
+        self._starts_at = offset
+        offset += _pad(8 * count)
+        self._ends_at = offset
+        offset += _pad(8 * count)
+        self._codes_at = offset
+        offset += _pad(4 * count)
+        self._text_offsets_at = offset
+        offset += _pad(8 * (count + 1))
+        self._text_at = offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("segment index out of range")
+        return index
+
+    def start(self, index: int) -> float:
+        index = self._check_index(index)
+        return struct.unpack_from("<d", self._buffer, self._starts_at + 8 * index)[0]
+
+    def end(self, index: int) -> float:
+        index = self._check_index(index)
+        return struct.unpack_from("<d", self._buffer, self._ends_at + 8 * index)[0]
+
+    def speaker_label(self, index: int) -> Optional[str]:
+        index = self._check_index(index)
+        code = struct.unpack_from("<i", self._buffer, self._codes_at + 4 * index)[0]
+        return None if code == _NO_SPEAKER else self.speakers[code]
+
+    def text(self, index: int) -> str:
+        index = self._check_index(index)
+        lo, hi = struct.unpack_from("<QQ", self._buffer, self._text_offsets_at + 8 * index)
+        return bytes(self._buffer[self._text_at + lo:self._text_at + hi]).decode("utf-8")
+
+    def segment(self, index: int) -> SpeakerSegment:
+        """Materialize one segment by position"""
+        return SpeakerSegment(
+            audio_clip_id=self.clip_id,
+            start=self.start(index),
+            end=self.end(index),
+            speaker_label=self.speaker_label(index),
+            text=self.text(index)
+        )
+
+    def starts(self) -> array:
+        return _from_le_bytes("d", self._buffer[self._starts_at:self._starts_at + 8 * self._count])
+
+    def ends(self) -> array:
+        return _from_le_bytes("d", self._buffer[self._ends_at:self._ends_at + 8 * self._count])
+
+    def speaker_codes(self) -> array:
+        return _from_le_bytes("i", self._buffer[self._codes_at:self._codes_at + 4 * self._count])
+
+    def texts(self, indices: Sequence[int]) -> List[str]:
+        """Decode the text of the given segment positions"""
+        offsets = _from_le_bytes("Q", self._buffer[self._text_offsets_at:self._text_offsets_at + 8 * (self._count + 1)])
+        base = self._text_at
+        return [
+            bytes(self._buffer[base + offsets[i]:base + offsets[i + 1]]).decode("utf-8")
+            for i in indices
+        ]
+
+    def to_table(self, indices: Optional[Sequence[int]] = None) -> SegmentTable:
+        """Load the given segment positions (all segments by default) as a SegmentTable"""
+        if indices is None:
+            return SegmentTable.from_columns(
+                self.clip_id,
+                self.starts(),
+                self.ends(),
+                self.speaker_codes(),
+                list(self.speakers),
+                self.texts(range(self._count))
+            )
+        starts, ends, codes = self.starts(), self.ends(), self.speaker_codes()
+        return SegmentTable.from_columns(
+            self.clip_id,
+            array("d", (starts[i] for i in indices)),
+            array("d", (ends[i] for i in indices)),
+            array("i", (codes[i] for i in indices)),
+            list(self.speakers),
+            self.texts(indices)
+        )
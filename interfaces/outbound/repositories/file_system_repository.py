@@ -1,27 +1,90 @@
+import hashlib
 import json
 import os
 import shutil
-from typing import Optional
+import threading
+import time
+import wave
+from contextlib import contextmanager
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from domain.audio_clip import AudioClip
-from domain.repositories import AudioClipRepository, TranscriptionTextRepository
+from domain.clip_usage import ClipUsage
+from domain.ports.search_index_port import SearchIndexPort
+from domain.repositories import (
+    AudioClipRepository, SpeakerSegmentRepository, TranscriptExportRepository, TranscriptionTextRepository,
+    WordTimingRepository
+)
+from domain.segment_table import SegmentTable
 from domain.speaker_segment import SpeakerSegment
+from domain.value_objects import LanguageDetection
+from domain.word_timing import WordTiming
+from shared.utils.metrics import timed
+from shared.utils.sharded_layout import ShardedLayout
 
 class FileSystemAudioClipRepository(AudioClipRepository):
     """
     File system implementation of the AudioClipRepository.
     This is an outbound adapter in the hexagonal architecture.
+
+    Audio is stored as ``{clip_id}.wav``; clip metadata (title, duration,
+    detected language, content hash) lives in a ``{clip_id}.meta.json`` sidecar.
+    Files are spread over hash-sharded subdirectories (see ShardedLayout).
+    The audio file's access time records when the clip was last used, for
+    eviction; reads refresh it at most once per ACCESS_RESOLUTION seconds.
     """
+    ACCESS_RESOLUTION = 60
     def __init__(self, storage_path: str):
         self.storage_path = storage_path
-        os.makedirs(storage_path, exist_ok=True)
+        self._layout = ShardedLayout(storage_path)
 
-    def _get_file_path(self, clip_id: str) -> str:
+    def _path(self, clip_id: str, suffix: str, create: bool = False) -> str:
+        if create:
+            return self._layout.writable_path(clip_id, suffix)
+        return self._layout.path(clip_id, suffix)
+
+    def _get_file_path(self, clip_id: str, create: bool = False) -> str:
         """Get the full file path for an audio clip"""
-        return os.path.join(self.storage_path, f"{clip_id}.wav")
+        return self._path(clip_id, ".wav", create)
+
+    def _get_meta_path(self, clip_id: str, create: bool = False) -> str:
+        """Get the full file path for an audio clip's metadata"""
+        return self._path(clip_id, ".meta.json", create)
+
+    @staticmethod
+    def _read_duration(file_path: str) -> Optional[float]:
+        """Duration of a WAV file from its header (None if it is not a readable WAV)"""
+        try:
+            with wave.open(file_path, 'rb') as wav:
+                return wav.getnframes() / float(wav.getframerate())
+        except (wave.Error, EOFError, ZeroDivisionError):
+            return None
+
+    def _write_metadata(self, clip: AudioClip) -> None:
+        meta = {
+            "title": clip.title,
+            "filename": clip.filename,
+            "duration": clip.duration,
+            "language": clip.language.language if clip.language else None,
+            "language_probability": clip.language.probability if clip.language else None,
+            "content_hash": clip.content_hash
+        }
+        meta_path = self._get_meta_path(str(clip.id), create=True)
+        tmp_path = f"{meta_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    def _read_metadata(self, clip_id: str) -> dict:
+        meta_path = self._get_meta_path(clip_id)
+        if not os.path.exists(meta_path):
+            return {}
+        with open(meta_path, 'r') as f:
+            return json.load(f)
 
     def save(self, clip: AudioClip) -> AudioClip:
         """Save an audio clip to the file system"""
-        file_path = self._get_file_path(str(clip.id))
+        file_path = self._get_file_path(str(clip.id), create=True)
         
         # Save the audio content
         with open(file_path, 'wb') as f:
@@ -29,28 +92,81 @@ class FileSystemAudioClipRepository(AudioClipRepository):
         
         # Update the clip with the file path
         clip.file_path = file_path
+        if clip.duration is None:
+            clip.duration = self._read_duration(file_path)
+        clip.content_hash = hashlib.sha256(clip.content).hexdigest()
+        self._write_metadata(clip)
         return clip
 
+    def update(self, clip: AudioClip) -> None:
+        """Persist the clip's metadata"""
+        self._write_metadata(clip)
+
+    def _touch(self, file_path: str) -> bool:
+        """Record an access to the clip (keeping the modification time); False if it does not exist"""
+        try:
+            stat = os.stat(file_path)
+            now = time.time_ns()
+            if now - stat.st_atime_ns > self.ACCESS_RESOLUTION * 1_000_000_000:
+                os.utime(file_path, ns=(now, stat.st_mtime_ns))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def touch(self, clip_id: str) -> None:
+        """Record a use of the clip (such as a transcript read)"""
+        self._touch(self._get_file_path(clip_id))
+
+    def get_audio_path(self, clip_id: str) -> Optional[str]:
+        """Path of the clip's audio file"""
+        file_path = self._get_file_path(clip_id)
+        return file_path if self._touch(file_path) else None
+
     def get(self, clip_id: str) -> Optional[AudioClip]:
         """Get an audio clip from the file system"""
         file_path = self._get_file_path(clip_id)
-        if not os.path.exists(file_path):
+        if not self._touch(file_path):
             return None
 
         # Read the audio content
         with open(file_path, 'rb') as f:
             content = f.read()
 
+        # Clips stored before metadata sidecars existed fall back to the file name
+        meta = self._read_metadata(clip_id)
+        language = None
+        if meta.get("language"):
+            language = LanguageDetection(meta["language"], meta.get("language_probability") or 0.0)
+
         # Create and return the audio clip
         clip = AudioClip(
             id=clip_id,
-            title=os.path.basename(file_path),
-            filename=os.path.basename(file_path),
+            title=meta.get("title", os.path.basename(file_path)),
+            filename=meta.get("filename", os.path.basename(file_path)),
             content=content,
-            file_path=file_path
+            duration=meta.get("duration") or self._read_duration(file_path),
+            file_path=file_path,
+            language=language,
+            content_hash=meta.get("content_hash")
         )
+        if clip.content_hash is None:
+            # Clips stored before content hashes were recorded
+            clip.content_hash = hashlib.sha256(content).hexdigest()
+            self._write_metadata(clip)
         return clip
 
+    def usage(self) -> Iterator[ClipUsage]:
+        """Size and last access of every stored clip (audio file plus metadata)"""
+        for clip_id, entry in self._layout.files(".wav"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Deleted while listing
+                continue
+            meta_path = self._get_meta_path(clip_id)
+            size = stat.st_size + (os.path.getsize(meta_path) if os.path.exists(meta_path) else 0)
+            yield ClipUsage(clip_id, size, max(stat.st_atime, stat.st_mtime))
+
     def delete(self, clip_id: str) -> bool:
         """Delete an audio clip from the file system"""
         file_path = self._get_file_path(clip_id)
@@ -59,6 +175,9 @@ class FileSystemAudioClipRepository(AudioClipRepository):
 
         try:
             os.remove(file_path)
+            meta_path = self._get_meta_path(clip_id)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
             return True
         except Exception:
             return False 
@@ -67,41 +186,442 @@ class FileSystemTranscriptionTextRepository(TranscriptionTextRepository):
     """
     File system implementation of the TranscriptionTextRepository.
     This is an outbound adapter in the hexagonal architecture.
+
+    Transcripts are stored as an append-only JSONL segment log
+    (``{clip_id}.jsonl``), one segment per line. The log is finalized by a
+    trailing commit marker line; a log without the marker belongs to an
+    interrupted job and is only visible through ``list_pending``.
+    Files are spread over hash-sharded subdirectories (see ShardedLayout).
+    Legacy ``{clip_id}.json`` files are still readable. Draft transcripts of
+    progressive jobs are kept in ``{clip_id}.draft`` (JSONL, never indexed).
+
+    If a search index is given it is updated whenever a transcript is saved,
+    committed or deleted.
     """
-    def __init__(self, storage_path: str):
+    COMMIT_MARKER = {"committed": True}
+    COMMIT_LINE = (json.dumps(COMMIT_MARKER) + "\n").encode()
+
+    def __init__(self, storage_path: str, search_index: Optional[SearchIndexPort] = None):
         self.storage_path = storage_path
-        os.makedirs(storage_path, exist_ok=True)
+        self.search_index = search_index
+        self._layout = ShardedLayout(storage_path)
+
+    def _path(self, clip_id: str, suffix: str, create: bool = False) -> str:
+        if create:
+            return self._layout.writable_path(clip_id, suffix)
+        return self._layout.path(clip_id, suffix)
 
     def _get_file_path(self, clip_id: str) -> str:
-        """Get the full file path for a transcription text"""
-        return os.path.join(self.storage_path, f"{clip_id}.json")
+        """Get the full file path for a (legacy) transcription text"""
+        return self._path(clip_id, ".json")
 
-    def save(self, clip_id: str, segments: list[SpeakerSegment]) -> None:
-        """Save a list of speaker segments to the file system"""
+    def _get_log_path(self, clip_id: str, create: bool = False) -> str:
+        """Get the full file path for a transcription segment log"""
+        return self._path(clip_id, ".jsonl", create)
+
+    def _get_draft_path(self, clip_id: str, create: bool = False) -> str:
+        """Get the full file path for a draft transcript"""
+        return self._path(clip_id, ".draft", create)
+
+    def _read_log(self, clip_id: str) -> tuple[list[dict], bool, int]:
+        """
+        Read a segment log.
+
+        Returns:
+            (segment dicts, committed flag, byte offset of the last valid line end)
+        """
+        records, committed, valid_end = [], False, 0
+        log_path = self._get_log_path(clip_id)
+        if not os.path.exists(log_path):
+            return records, committed, valid_end
+
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn write from a crash: ignore the partial line
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                valid_end += len(line)
+                if record == self.COMMIT_MARKER:
+                    committed = True
+                    break
+                records.append(record)
+        return records, committed, valid_end
+
+    def _is_log_committed(self, log_path: str) -> bool:
+        """Check the tail of a segment log for the commit marker without reading it all"""
+        if not os.path.exists(log_path):
+            return False
+        with open(log_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size < len(self.COMMIT_LINE):
+                return False
+            f.seek(size - len(self.COMMIT_LINE))
+            return f.read() == self.COMMIT_LINE
+
+    def _committed_path(self, clip_id: str) -> Optional[str]:
+        """Path of the file holding the clip's committed transcript, if any"""
+        log_path = self._get_log_path(clip_id)
+        if self._is_log_committed(log_path):
+            return log_path
         file_path = self._get_file_path(clip_id)
-        with open(file_path, 'w') as f:
-            json.dump([seg.to_dict() for seg in segments], f)
+        if os.path.exists(file_path):
+            return file_path
+        return None
+
+    def _iter_records(self, clip_id: str) -> Iterator[dict]:
+        """Lazily yield the committed segment dicts of a clip in order"""
+        path = self._committed_path(clip_id)
+        if path is None:
+            return
+        if path.endswith(".jsonl"):
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line == self.COMMIT_LINE:
+                        return
+                    yield json.loads(line)
+        else:
+            with open(path, 'r') as f:
+                yield from json.load(f)
+
+    @staticmethod
+    def _to_table(clip_id: str, records: Iterable[dict]) -> SegmentTable:
+        """Build a segment table from stored segment dicts"""
+        table = SegmentTable(clip_id)
+        for record in records:
+            table.append(record["start"], record["end"], record["speaker_label"], record["text"])
+        return table
+
+    @timed("repository_save", attrs=lambda self, clip_id, segments: {"segments": len(segments)})
+    def save(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """Save a list of speaker segments to the file system"""
+        table = SegmentTable.coerce(segments, clip_id)
+        log_path = self._get_log_path(clip_id, create=True)
+        tmp_path = f"{log_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            for record in table.to_dicts():
+                f.write(json.dumps(record) + "\n")
+            f.write(json.dumps(self.COMMIT_MARKER) + "\n")
+        os.replace(tmp_path, log_path)
+
+        legacy_path = self._get_file_path(clip_id)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+
+        if self.search_index:
+            self.search_index.index(clip_id, table)
+
+    @timed("repository_append")
+    def append(self, clip_id: str, segment: SpeakerSegment) -> None:
+        """Append a segment to the clip's uncommitted segment log"""
+        with open(self._get_log_path(clip_id, create=True), 'a') as f:
+            f.write(json.dumps(segment.to_dict()) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @timed("repository_commit")
+    def commit(self, clip_id: str) -> None:
+        """Finalize the clip's segment log with a commit marker"""
+        with open(self._get_log_path(clip_id, create=True), 'a') as f:
+            f.write(json.dumps(self.COMMIT_MARKER) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
+        if self.search_index:
+            self.search_index.index(clip_id, self.list(clip_id))
 
-    def list(self, clip_id: str) -> list[SpeakerSegment]:
+    @timed("repository_list")
+    def list(self, clip_id: str) -> SegmentTable:
         """List all speaker segments for a given clip ID"""
-        file_path = self._get_file_path(clip_id)
-        if not os.path.exists(file_path):
-            return []
+        return self._to_table(clip_id, self._iter_records(clip_id))
+
+    def list_pending(self, clip_id: str) -> SegmentTable:
+        """List segments of an interrupted (uncommitted) segment log"""
+        records, committed, valid_end = self._read_log(clip_id)
+        if committed:
+            return SegmentTable(clip_id)
+
+        # Drop any torn trailing line so later appends start on a clean line
+        log_path = self._get_log_path(clip_id)
+        if os.path.exists(log_path) and os.path.getsize(log_path) > valid_end:
+            with open(log_path, 'r+b') as f:
+                f.truncate(valid_end)
+
+        return self._to_table(clip_id, records)
+
+    def save_draft(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """Save the draft transcript of a clip"""
+        table = SegmentTable.coerce(segments, clip_id)
+        draft_path = self._get_draft_path(clip_id, create=True)
+        tmp_path = f"{draft_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            for record in table.to_dicts():
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, draft_path)
+
+    def list_draft(self, clip_id: str) -> SegmentTable:
+        """List the draft segments of a clip"""
+        draft_path = self._get_draft_path(clip_id)
+        if not os.path.exists(draft_path):
+            return SegmentTable(clip_id)
+        with open(draft_path, 'r') as f:
+            return self._to_table(clip_id, (json.loads(line) for line in f if line.strip()))
 
-        with open(file_path, 'r') as f:
-            segments = json.load(f)
+    def list_range(self, clip_id: str, start: float, end: float) -> SegmentTable:
+        """List committed segments overlapping the [start, end) time window"""
+        return self.query(clip_id, start=start, end=end)
 
-        return [SpeakerSegment(**seg) for seg in segments]
+    def list_by_speaker(self, clip_id: str, speaker_label: str) -> SegmentTable:
+        """List committed segments spoken by one speaker"""
+        return self.query(clip_id, speaker_label=speaker_label)
+
+    def query(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> SegmentTable:
+        """
+        Page through committed segments matching optional filters.
+        Records are streamed from disk and only the returned page is kept.
+        """
+        records = self._iter_records(clip_id)
+        try:
+            matches = (
+                seg for seg in records
+                if (start is None or seg["end"] > start)
+                and (end is None or seg["start"] < end)
+                and (speaker_label is None or seg["speaker_label"] == speaker_label)
+            )
+            stop = offset + limit if limit is not None else None
+            return self._to_table(clip_id, islice(matches, offset, stop))
+        finally:
+            records.close()
+
+    def iter_pages(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        page_size: int = 500
+    ) -> Iterator[SegmentTable]:
+        """Committed segments matching optional filters, in pages, from one pass over the log"""
+        records = self._iter_records(clip_id)
+        try:
+            matches = (
+                seg for seg in records
+                if (start is None or seg["end"] > start)
+                and (end is None or seg["start"] < end)
+                and (speaker_label is None or seg["speaker_label"] == speaker_label)
+            )
+            while page := self._to_table(clip_id, islice(matches, page_size)):
+                yield page
+        finally:
+            records.close()
+
+    def get_version(self, clip_id: str) -> Optional[str]:
+        """Version token of the committed transcript, changing whenever it is rewritten"""
+        path = self._committed_path(clip_id)
+        if path is None:
+            return None
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
 
     def delete(self, clip_id: str) -> bool:
-        """Delete a transcription text from the file system""" 
-        file_path = self._get_file_path(clip_id)
-        if not os.path.exists(file_path):
+        """Delete a transcription text (and its draft) from the file system"""
+        deleted = False
+        for file_path in (self._get_log_path(clip_id), self._get_file_path(clip_id), self._get_draft_path(clip_id)):
+            if not os.path.exists(file_path):
+                continue
+            try:
+                os.remove(file_path)
+                deleted = True
+            except Exception:
+                return False
+
+        if deleted and self.search_index:
+            self.search_index.remove(clip_id)
+        return deleted
+
+
+class FileSystemSpeakerSegmentRepository(SpeakerSegmentRepository):
+    """
+    File system implementation of the SpeakerSegmentRepository.
+    This is an outbound adapter in the hexagonal architecture.
+
+    Diarized speaker turns are stored as ``{key}.turns`` (JSONL, one turn per
+    line, without text or clip id) under the key given by the caller, in
+    hash-sharded subdirectories.
+    """
+    def __init__(self, storage_path: str):
+        self.storage_path = storage_path
+        self._layout = ShardedLayout(storage_path)
+
+    def _get_file_path(self, key: str, create: bool = False) -> str:
+        if create:
+            return self._layout.writable_path(key, ".turns")
+        return self._layout.path(key, ".turns")
+
+    def save(self, key: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """Save the speaker turns stored under ``key``"""
+        table = SegmentTable.coerce(segments)
+        file_path = self._get_file_path(key, create=True)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            for start, end, speaker_label, _ in table.rows():
+                f.write(json.dumps({"start": start, "end": end, "speaker_label": speaker_label}) + "\n")
+        os.replace(tmp_path, file_path)
+
+    def list(self, key: str) -> Optional[SegmentTable]:
+        """Speaker turns stored under ``key`` (None if there are none)"""
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, 'r') as f:
+                table = SegmentTable()
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        table.append(record["start"], record["end"], record["speaker_label"], None)
+                return table
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str) -> bool:
+        """Delete the speaker turns stored under ``key``"""
+        try:
+            os.remove(self._get_file_path(key))
+            return True
+        except FileNotFoundError:
             return False
 
+
+class FileSystemWordTimingRepository(WordTimingRepository):
+    """
+    File system implementation of the WordTimingRepository.
+    This is an outbound adapter in the hexagonal architecture.
+
+    Words are appended to ``{clip_id}.words`` (JSONL, one segment per line:
+    its start, end and ``[start, end, word]`` triples) as segments are
+    transcribed, in hash-sharded subdirectories.
+    """
+    def __init__(self, storage_path: str):
+        self.storage_path = storage_path
+        self._layout = ShardedLayout(storage_path)
+
+    def _get_file_path(self, clip_id: str, create: bool = False) -> str:
+        if create:
+            return self._layout.writable_path(clip_id, ".words")
+        return self._layout.path(clip_id, ".words")
+
+    def append(self, clip_id: str, start: float, end: float, words: List[WordTiming]) -> None:
+        """Append the words of one segment"""
+        record = {"start": start, "end": end, "words": [[word.start, word.end, word.text] for word in words]}
+        with open(self._get_file_path(clip_id, create=True), 'a') as f:
+            f.write(json.dumps(record) + "\n")
+
+    def list(self, clip_id: str, start: Optional[float] = None, end: Optional[float] = None) -> Dict[float, List[WordTiming]]:
+        """
+        Words of the segments starting within [start, end].
+        Records are streamed from disk and only the matching ones are kept.
+        """
+        return {
+            segment_start: words for segment_start, words in self.iter_records(clip_id)
+            if (start is None or segment_start >= start) and (end is None or segment_start <= end)
+        }
+
+    def iter_records(self, clip_id: str) -> Iterator[Tuple[float, List[WordTiming]]]:
+        """Records in the order they were appended, one line at a time"""
         try:
-            os.remove(file_path)
+            f = open(self._get_file_path(clip_id), 'r')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield record["start"], [WordTiming(*word) for word in record["words"]]
+
+    def delete(self, clip_id: str) -> bool:
+        """Delete the clip's word timings"""
+        try:
+            os.remove(self._get_file_path(clip_id))
             return True
-        except Exception:
+        except FileNotFoundError:
             return False
+
+
+class FileSystemTranscriptExportRepository(TranscriptExportRepository):
+    """
+    File system implementation of the TranscriptExportRepository.
+    This is an outbound adapter in the hexagonal architecture.
+
+    Exports are stored as ``{clip_id}.{version digest}.{name}`` in
+    hash-sharded subdirectories. Storing an export removes the clip's exports
+    of other transcript versions.
+    """
+    def __init__(self, storage_path: str):
+        self.storage_path = storage_path
+        self._layout = ShardedLayout(storage_path)
+
+    @staticmethod
+    def _suffix(version: str, name: str) -> str:
+        return f".{hashlib.sha1(version.encode()).hexdigest()[:12]}.{name}"
+
+    def _clip_files(self, clip_id: str) -> Iterator[str]:
+        directory = self._layout.shard_dir(clip_id)
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.startswith(f"{clip_id}.") and not name.endswith(".tmp"):
+                yield os.path.join(directory, name)
+
+    def get_path(self, clip_id: str, version: str, name: str) -> Optional[str]:
+        """Path of a stored export"""
+        path = self._layout.path(clip_id, self._suffix(version, name))
+        return path if os.path.exists(path) else None
+
+    @contextmanager
+    def writer(self, clip_id: str, version: str, name: str) -> Iterator[BinaryIO]:
+        """Write an export to a temporary file and store it once complete"""
+        suffix = self._suffix(version, name)
+        path = self._layout.writable_path(clip_id, suffix)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                yield f
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        # Exports of earlier transcript versions will never be served again
+        current = suffix.split(".")[1]
+        for old_path in self._clip_files(clip_id):
+            if os.path.basename(old_path)[len(clip_id) + 1:].split(".")[0] != current:
+                try:
+                    os.remove(old_path)
+                except FileNotFoundError:
+                    pass
+
+    def delete(self, clip_id: str) -> bool:
+        """Delete every export of the clip"""
+        deleted = False
+        for path in self._clip_files(clip_id):
+            try:
+                os.remove(path)
+                deleted = True
+            except FileNotFoundError:
+                pass
+        return deleted
+
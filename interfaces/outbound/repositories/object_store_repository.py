@@ -0,0 +1,242 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Set
+
+from domain.audio_clip import AudioClip
+from domain.clip_usage import ClipUsage
+from domain.repositories import AudioClipRepository
+from domain.value_objects import LanguageDetection
+from interfaces.outbound.object_store.object_store_client import ObjectStoreClient
+from shared.utils.disk_cache import DiskLRUCache
+from shared.utils.metrics import measure
+from shared.utils.wav_layout import read_wav_layout
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectStoreAudioClipRepository(AudioClipRepository):
+    """
+    Object store implementation of the AudioClipRepository, so every replica
+    sees every clip. This is an outbound adapter in the hexagonal architecture.
+
+    Audio is stored as ``{prefix}{clip_id}.wav`` and clip metadata as
+    ``{prefix}{clip_id}.meta.json``; the metadata object is written last and
+    marks the clip as complete. Audio is read through a local DiskLRUCache,
+    whose files are the clips' ``file_path`` for the adapters, and can be
+    prefetched into it in the background when a job is queued. Jobs pin their
+    clip's cache file while they run, so it is not evicted under them. Saved
+    clips are uploaded from their cache file, so a new clip is already local
+    for its first transcription.
+
+    Object stores keep no access times: reading a clip rewrites its metadata
+    object (at most once per ACCESS_RESOLUTION seconds per process), whose
+    modification time is the clip's last access for eviction.
+    """
+    ACCESS_RESOLUTION = 300
+    # Forget recorded accesses beyond this many clips (they are only an optimization)
+    MAX_TOUCHED = 4096
+
+    def __init__(
+        self,
+        client: ObjectStoreClient,
+        cache: DiskLRUCache,
+        prefix: str = "audio/",
+        prefetch_workers: int = 2
+    ):
+        """
+        Args:
+            client: Object store holding the clips
+            cache: Local disk cache of clip audio
+            prefix: Key prefix of the clips' objects
+            prefetch_workers: Concurrent background downloads
+        """
+        self.client = client
+        self.cache = cache
+        self.prefix = prefix
+        self._prefetcher = ThreadPoolExecutor(max_workers=max(1, prefetch_workers), thread_name_prefix="audio-prefetch")
+        self._prefetching: Set[str] = set()
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _audio_key(self, clip_id: str) -> str:
+        return f"{self.prefix}{clip_id}.wav"
+
+    def _meta_key(self, clip_id: str) -> str:
+        return f"{self.prefix}{clip_id}.meta.json"
+
+    @staticmethod
+    def _read_duration(file_path: str) -> Optional[float]:
+        """Duration of a WAV file from its header (None if it is not a readable WAV)"""
+        try:
+            return read_wav_layout(file_path).duration
+        except (ValueError, ZeroDivisionError):
+            return None
+
+    def _write_metadata(self, clip: AudioClip) -> None:
+        meta = {
+            "title": clip.title,
+            "filename": clip.filename,
+            "duration": clip.duration,
+            "language": clip.language.language if clip.language else None,
+            "language_probability": clip.language.probability if clip.language else None,
+            "content_hash": clip.content_hash
+        }
+        self.client.put_bytes(self._meta_key(str(clip.id)), json.dumps(meta).encode())
+        self._record_access(str(clip.id))
+
+    def _read_metadata(self, clip_id: str) -> Optional[dict]:
+        data = self.client.get_bytes(self._meta_key(clip_id))
+        return json.loads(data) if data is not None else None
+
+    def _record_access(self, clip_id: str) -> bool:
+        """Note an access; False if one was already recorded within ACCESS_RESOLUTION seconds"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._touched.get(clip_id, -self.ACCESS_RESOLUTION) < self.ACCESS_RESOLUTION:
+                return False
+            if len(self._touched) >= self.MAX_TOUCHED:
+                self._touched = {
+                    key: touched for key, touched in self._touched.items()
+                    if now - touched < self.ACCESS_RESOLUTION
+                }
+            self._touched[clip_id] = now
+            return True
+
+    def _touch(self, clip_id: str, meta: dict) -> None:
+        if self._record_access(clip_id):
+            self.client.put_bytes(self._meta_key(clip_id), json.dumps(meta).encode())
+
+    def touch(self, clip_id: str) -> None:
+        """Record a use of the clip (such as a transcript read) by rewriting its metadata object"""
+        if not self._record_access(clip_id):
+            return
+        meta = self._read_metadata(clip_id)
+        if meta is not None:
+            self.client.put_bytes(self._meta_key(clip_id), json.dumps(meta).encode())
+
+    def _local_path(self, clip_id: str, prefetch: bool = False) -> Optional[str]:
+        """Local file of the clip's audio, downloaded on a miss (None if there is no such object)"""
+        def download(path: str) -> None:
+            with measure("object_store_download", prefetch=prefetch):
+                self.client.download(self._audio_key(clip_id), path)
+
+        try:
+            return self.cache.fill(clip_id, download, prefetch=prefetch)
+        except FileNotFoundError:
+            return None
+
+    def save(self, clip: AudioClip) -> AudioClip:
+        """Save an audio clip to the object store"""
+        clip_id = str(clip.id)
+
+        def write(path: str) -> None:
+            with open(path, 'wb') as f:
+                f.write(clip.content)
+
+        file_path = self.cache.put(clip_id, write)
+        with measure("object_store_upload", bytes=len(clip.content)), open(file_path, 'rb') as f:
+            self.client.upload(self._audio_key(clip_id), f)
+
+        clip.file_path = file_path
+        if clip.duration is None:
+            clip.duration = self._read_duration(file_path)
+        clip.content_hash = hashlib.sha256(clip.content).hexdigest()
+        self._write_metadata(clip)
+        return clip
+
+    def update(self, clip: AudioClip) -> None:
+        """Persist the clip's metadata"""
+        self._write_metadata(clip)
+
+    def get_audio_path(self, clip_id: str) -> Optional[str]:
+        """Path of the clip's audio in the local cache"""
+        meta = self._read_metadata(clip_id)
+        if meta is None:
+            return None
+        file_path = self._local_path(clip_id)
+        if file_path is not None:
+            self._touch(clip_id, meta)
+        return file_path
+
+    def get(self, clip_id: str) -> Optional[AudioClip]:
+        """Get an audio clip, through the local cache"""
+        meta = self._read_metadata(clip_id)
+        if meta is None:
+            return None
+        file_path = self._local_path(clip_id)
+        if file_path is None:
+            return None
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        self._touch(clip_id, meta)
+
+        language = None
+        if meta.get("language"):
+            language = LanguageDetection(meta["language"], meta.get("language_probability") or 0.0)
+        return AudioClip(
+            id=clip_id,
+            title=meta.get("title"),
+            filename=meta.get("filename"),
+            content=content,
+            duration=meta.get("duration") or self._read_duration(file_path),
+            file_path=file_path,
+            language=language,
+            content_hash=meta.get("content_hash") or hashlib.sha256(content).hexdigest()
+        )
+
+    @contextmanager
+    def in_use(self, clip_id: str) -> Iterator[None]:
+        """Pin the clip's cache file for the duration of the block"""
+        with self.cache.pinned(clip_id):
+            yield
+
+    def prefetch(self, clip_id: str) -> None:
+        """Download the clip's audio into the local cache in the background"""
+        with self._lock:
+            if clip_id in self._prefetching:
+                return
+            self._prefetching.add(clip_id)
+        self._prefetcher.submit(self._prefetch, clip_id)
+
+    def _prefetch(self, clip_id: str) -> None:
+        try:
+            self._local_path(clip_id, prefetch=True)
+        except Exception:
+            # The job will fetch the audio itself
+            logger.warning("Prefetching audio clip %s failed", clip_id, exc_info=True)
+        finally:
+            with self._lock:
+                self._prefetching.discard(clip_id)
+
+    def usage(self) -> Iterator[ClipUsage]:
+        """Size and last access of every stored clip (audio plus metadata objects)"""
+        clips: Dict[str, tuple[int, float]] = {}
+        for info in self.client.list(self.prefix):
+            clip_id, _, suffix = info.key[len(self.prefix):].partition(".")
+            if suffix not in ("wav", "meta.json"):
+                continue
+            size, last_access = clips.get(clip_id, (0, 0.0))
+            clips[clip_id] = (size + info.size, max(last_access, info.last_modified))
+        for clip_id, (size, last_access) in clips.items():
+            yield ClipUsage(clip_id, size, last_access)
+
+    def delete(self, clip_id: str) -> bool:
+        """Delete an audio clip from the object store and the local cache"""
+        exists = (
+            self.client.stat(self._meta_key(clip_id)) is not None
+            or self.client.stat(self._audio_key(clip_id)) is not None
+        )
+        self.cache.discard(clip_id)
+        if not exists:
+            return False
+        # Metadata first: without it the clip no longer exists for readers
+        self.client.delete(self._meta_key(clip_id))
+        self.client.delete(self._audio_key(clip_id))
+        with self._lock:
+            self._touched.pop(clip_id, None)
+        return True
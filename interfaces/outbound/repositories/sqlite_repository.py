@@ -1,43 +1,126 @@
 import sqlite3
-from typing import List, Optional
+import threading
+import time
+from typing import Iterable, List, Optional, Union
 import json
+from domain.ports.search_index_port import SearchIndexPort
 from domain.repositories import TranscriptionTextRepository
+from domain.segment_table import SegmentTable
 from domain.speaker_segment import SpeakerSegment
+from shared.utils.metrics import timed
 
 class SQLiteTranscriptionRepository(TranscriptionTextRepository):
     """
     SQLite implementation of the TranscriptionTextRepository.
     This is an outbound adapter in the hexagonal architecture.
+
+    Transcripts are stored row-per-segment in the ``segments`` table, indexed on
+    (clip_id, start) and (clip_id, speaker_label) so time windows and speakers can
+    be queried without loading the whole transcript. The ``transcripts`` table
+    tracks whether a clip's segments are committed or still an in-progress log.
+    Draft transcripts of progressive jobs live in ``draft_segments``.
+    The database runs in WAL mode with one connection per thread.
+
+    If a search index is given it is updated whenever a transcript is saved,
+    committed or deleted.
     """
-    def __init__(self, db_path: str = "transcriptions.db"):
+    _SEGMENT_COLUMNS = 'start, "end", speaker_label, text'
+
+    def __init__(self, db_path: str = "transcriptions.db", search_index: Optional[SearchIndexPort] = None):
         self.db_path = db_path
+        self.search_index = search_index
+        self._local = threading.local()
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
         """Initialize the database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._connection()
+        with conn:
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS transcriptions (
+                CREATE TABLE IF NOT EXISTS transcripts (
                     clip_id TEXT PRIMARY KEY,
-                    segments TEXT NOT NULL
+                    committed INTEGER NOT NULL DEFAULT 0,
+                    next_seq INTEGER NOT NULL DEFAULT 0,
+                    max_duration REAL NOT NULL DEFAULT 0,
+                    revision INTEGER NOT NULL DEFAULT 0
                 )
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS segments (
+                    clip_id TEXT NOT NULL
+                        REFERENCES transcripts (clip_id) ON DELETE CASCADE,
+                    seq INTEGER NOT NULL,
+                    start REAL NOT NULL,
+                    "end" REAL NOT NULL,
+                    speaker_label TEXT,
+                    text TEXT,
+                    PRIMARY KEY (clip_id, seq)
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_segments_clip_start ON segments (clip_id, start)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_segments_clip_speaker ON segments (clip_id, speaker_label)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS draft_segments (
+                    clip_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    start REAL NOT NULL,
+                    "end" REAL NOT NULL,
+                    speaker_label TEXT,
+                    text TEXT,
+                    PRIMARY KEY (clip_id, seq)
+                ) WITHOUT ROWID
+            """)
+        self._migrate_legacy_tables(conn)
 
-    def _serialize_segments(self, segments: List[SpeakerSegment]) -> str:
-        """Serialize segments to JSON string"""
-        return json.dumps([
-            {
-                "start": seg.start,
-                "end": seg.end,
-                "speaker_label": seg.speaker_label,
-                "text": seg.text,
-                "audio_clip_id": str(seg.audio_clip_id)
-            }
-            for seg in segments
-        ])
+    def _migrate_legacy_tables(self, conn: sqlite3.Connection) -> None:
+        """Move transcripts from the JSON-blob schema into the row-per-segment schema"""
+        tables = {
+            name for (name,) in
+            conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(transcripts)")}
+        with conn:
+            if "revision" not in columns:
+                conn.execute("ALTER TABLE transcripts ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+            if "transcriptions" in tables:
+                for clip_id, blob in conn.execute("SELECT clip_id, segments FROM transcriptions").fetchall():
+                    self._replace_segments(conn, clip_id, SegmentTable.from_segments(self._deserialize_segments(blob)))
+                conn.execute("DROP TABLE transcriptions")
+            if "segment_log" in tables:
+                rows = conn.execute(
+                    'SELECT clip_id, start, "end", speaker_label, text FROM segment_log ORDER BY clip_id, seq'
+                ).fetchall()
+                for clip_id, start, end, speaker_label, text in rows:
+                    self._append_segment(conn, clip_id, SpeakerSegment(
+                        audio_clip_id=clip_id, start=start, end=end,
+                        speaker_label=speaker_label, text=text
+                    ))
+                conn.execute("DROP TABLE segment_log")
 
     def _deserialize_segments(self, json_str: str) -> List[SpeakerSegment]:
-        """Deserialize segments from JSON string"""
+        """Deserialize segments from a legacy JSON blob"""
         data = json.loads(json_str)
         return [
             SpeakerSegment(
@@ -50,31 +133,242 @@ class SQLiteTranscriptionRepository(TranscriptionTextRepository):
             for item in data
         ]
 
-    def save(self, clip_id: str, segments: List[SpeakerSegment]) -> None:
+    def _to_segments(self, clip_id: str, rows: Iterable[tuple]) -> SegmentTable:
+        """Build a segment table from (start, end, speaker_label, text) rows"""
+        table = SegmentTable(clip_id)
+        for start, end, speaker_label, text in rows:
+            table.append(start, end, speaker_label, text)
+        return table
+
+    def _replace_segments(self, conn: sqlite3.Connection, clip_id: str, segments: SegmentTable) -> None:
+        """Replace all segments of a clip with a committed transcript (batch insert)"""
+        conn.execute("DELETE FROM segments WHERE clip_id = ?", (clip_id,))
+        max_duration = max((end - start for start, end in zip(segments.starts, segments.ends)), default=0.0)
+        conn.execute(
+            """
+            INSERT INTO transcripts (clip_id, committed, next_seq, max_duration, revision)
+            VALUES (?, 1, ?, ?, ?)
+            ON CONFLICT (clip_id) DO UPDATE SET
+                committed = 1, next_seq = excluded.next_seq, max_duration = excluded.max_duration,
+                revision = excluded.revision
+            """,
+            (clip_id, len(segments), max_duration, time.time_ns())
+        )
+        conn.executemany(
+            'INSERT INTO segments (clip_id, seq, start, "end", speaker_label, text) VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                (clip_id, seq, start, end, speaker_label, text)
+                for seq, (start, end, speaker_label, text) in enumerate(segments.rows())
+            )
+        )
+
+    def _append_segment(self, conn: sqlite3.Connection, clip_id: str, segment: SpeakerSegment) -> None:
+        """Append a segment to a clip's uncommitted log"""
+        conn.execute(
+            "INSERT OR IGNORE INTO transcripts (clip_id, committed) VALUES (?, 0)",
+            (clip_id,)
+        )
+        seq, = conn.execute(
+            """
+            UPDATE transcripts
+            SET next_seq = next_seq + 1, max_duration = MAX(max_duration, ?)
+            WHERE clip_id = ?
+            RETURNING next_seq - 1
+            """,
+            (segment.end - segment.start, clip_id)
+        ).fetchone()
+        conn.execute(
+            'INSERT INTO segments (clip_id, seq, start, "end", speaker_label, text) VALUES (?, ?, ?, ?, ?, ?)',
+            (clip_id, seq, segment.start, segment.end, segment.speaker_label, segment.text)
+        )
+
+    def _is_committed(self, conn: sqlite3.Connection, clip_id: str) -> bool:
+        row = conn.execute(
+            "SELECT committed FROM transcripts WHERE clip_id = ?",
+            (clip_id,)
+        ).fetchone()
+        return bool(row and row[0])
+
+    @timed("repository_save", attrs=lambda self, clip_id, segments: {"segments": len(segments)})
+    def save(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
         """Save transcription segments for an audio clip"""
-        with sqlite3.connect(self.db_path) as conn:
+        table = SegmentTable.coerce(segments, clip_id)
+        conn = self._connection()
+        with conn:
+            self._replace_segments(conn, clip_id, table)
+
+        if self.search_index:
+            self.search_index.index(clip_id, table)
+
+    @timed("repository_append")
+    def append(self, clip_id: str, segment: SpeakerSegment) -> None:
+        """Append a segment to the clip's uncommitted segment log"""
+        conn = self._connection()
+        with conn:
+            self._append_segment(conn, clip_id, segment)
+
+    @timed("repository_commit")
+    def commit(self, clip_id: str) -> None:
+        """Mark the clip's segment log as a committed transcription"""
+        conn = self._connection()
+        with conn:
+            # A log without segments commits an empty transcript
+            conn.execute(
+                "INSERT OR IGNORE INTO transcripts (clip_id, committed) VALUES (?, 0)",
+                (clip_id,)
+            )
             conn.execute(
-                "INSERT OR REPLACE INTO transcriptions (clip_id, segments) VALUES (?, ?)",
-                (clip_id, self._serialize_segments(segments))
+                "UPDATE transcripts SET committed = 1, revision = ? WHERE clip_id = ?",
+                (time.time_ns(), clip_id)
             )
 
-    def list(self, clip_id: str) -> Optional[List[SpeakerSegment]]:
+        if self.search_index:
+            self.search_index.index(clip_id, self.list(clip_id) or SegmentTable(clip_id))
+
+    def list_pending(self, clip_id: str) -> SegmentTable:
+        """List segments of an interrupted (uncommitted) segment log"""
+        conn = self._connection()
+        if self._is_committed(conn, clip_id):
+            return SegmentTable(clip_id)
+        rows = conn.execute(
+            f"SELECT {self._SEGMENT_COLUMNS} FROM segments WHERE clip_id = ? ORDER BY seq",
+            (clip_id,)
+        )
+        return self._to_segments(clip_id, rows)
+
+    @timed("repository_list")
+    def list(self, clip_id: str) -> Optional[SegmentTable]:
         """Get transcription segments for an audio clip"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT segments FROM transcriptions WHERE clip_id = ?",
-                (clip_id,)
+        conn = self._connection()
+        if not self._is_committed(conn, clip_id):
+            return None
+        rows = conn.execute(
+            f"SELECT {self._SEGMENT_COLUMNS} FROM segments WHERE clip_id = ? ORDER BY seq",
+            (clip_id,)
+        )
+        return self._to_segments(clip_id, rows)
+
+    def save_draft(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """Replace the draft transcript of a clip"""
+        table = SegmentTable.coerce(segments, clip_id)
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM draft_segments WHERE clip_id = ?", (clip_id,))
+            conn.executemany(
+                'INSERT INTO draft_segments (clip_id, seq, start, "end", speaker_label, text) VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    (clip_id, seq, start, end, speaker_label, text)
+                    for seq, (start, end, speaker_label, text) in enumerate(table.rows())
+                )
             )
-            row = cursor.fetchone()
-            if not row:
-                return None
-            return self._deserialize_segments(row[0])
+
+    def list_draft(self, clip_id: str) -> SegmentTable:
+        """Get the draft segments of a clip"""
+        rows = self._connection().execute(
+            f"SELECT {self._SEGMENT_COLUMNS} FROM draft_segments WHERE clip_id = ? ORDER BY seq",
+            (clip_id,)
+        )
+        return self._to_segments(clip_id, rows)
+
+    def list_range(self, clip_id: str, start: float, end: float) -> SegmentTable:
+        """Get the committed segments of a clip overlapping the [start, end) time window"""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT max_duration FROM transcripts WHERE clip_id = ? AND committed = 1",
+            (clip_id,)
+        ).fetchone()
+        if not row:
+            return SegmentTable(clip_id)
+        # A segment overlapping the window cannot start earlier than the longest
+        # segment's duration before it, which keeps the scan on the (clip_id, start) index
+        rows = conn.execute(
+            f"""
+            SELECT {self._SEGMENT_COLUMNS} FROM segments
+            WHERE clip_id = ? AND start >= ? AND start < ? AND "end" > ?
+            ORDER BY start
+            """,
+            (clip_id, start - row[0], end, start)
+        )
+        return self._to_segments(clip_id, rows)
+
+    def list_by_speaker(self, clip_id: str, speaker_label: str) -> SegmentTable:
+        """Get the committed segments of a clip spoken by one speaker"""
+        conn = self._connection()
+        if not self._is_committed(conn, clip_id):
+            return SegmentTable(clip_id)
+        rows = conn.execute(
+            f"""
+            SELECT {self._SEGMENT_COLUMNS} FROM segments
+            WHERE clip_id = ? AND speaker_label = ?
+            ORDER BY seq
+            """,
+            (clip_id, speaker_label)
+        )
+        return self._to_segments(clip_id, rows)
+
+    def query(
+        self,
+        clip_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        speaker_label: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> SegmentTable:
+        """Page through committed segments matching optional filters, in transcript order"""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT max_duration FROM transcripts WHERE clip_id = ? AND committed = 1",
+            (clip_id,)
+        ).fetchone()
+        if not row:
+            return SegmentTable(clip_id)
+
+        conditions, params = ["clip_id = ?"], [clip_id]
+        if start is not None:
+            conditions.append('"end" > ? AND start >= ?')
+            params.extend([start, start - row[0]])
+        if end is not None:
+            conditions.append("start < ?")
+            params.append(end)
+        if speaker_label is not None:
+            conditions.append("speaker_label = ?")
+            params.append(speaker_label)
+        params.extend([limit if limit is not None else -1, offset])
+
+        rows = conn.execute(
+            f"""
+            SELECT {self._SEGMENT_COLUMNS} FROM segments
+            WHERE {" AND ".join(conditions)}
+            ORDER BY seq
+            LIMIT ? OFFSET ?
+            """,
+            params
+        )
+        return self._to_segments(clip_id, rows)
+
+    def get_version(self, clip_id: str) -> Optional[str]:
+        """Version token of the committed transcript, renewed on every save/commit"""
+        row = self._connection().execute(
+            "SELECT revision, next_seq FROM transcripts WHERE clip_id = ? AND committed = 1",
+            (clip_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return f"{row[0]:x}-{row[1]:x}"
 
     def delete(self, clip_id: str) -> bool:
         """Delete transcription segments for an audio clip"""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._connection()
+        with conn:
             cursor = conn.execute(
-                "DELETE FROM transcriptions WHERE clip_id = ?",
+                "DELETE FROM transcripts WHERE clip_id = ?",
                 (clip_id,)
             )
-            return cursor.rowcount > 0 
\ No newline at end of file
+            deleted = cursor.rowcount > 0
+            cursor = conn.execute("DELETE FROM draft_segments WHERE clip_id = ?", (clip_id,))
+            deleted = deleted or cursor.rowcount > 0
+
+        if deleted and self.search_index:
+            self.search_index.remove(clip_id)
+        return deleted
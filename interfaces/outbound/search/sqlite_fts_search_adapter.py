@@ -0,0 +1,136 @@
+import os
+import sqlite3
+import threading
+from typing import List, Union
+
+from domain.ports.search_index_port import SearchIndexPort
+from domain.search_hit import SearchHit
+from domain.segment_table import SegmentTable
+from domain.speaker_segment import SpeakerSegment
+
+class SQLiteFTSSearchAdapter(SearchIndexPort):
+    """
+    SQLite FTS5 implementation of the SearchIndexPort.
+    This is an outbound adapter in the hexagonal architecture.
+
+    Segment metadata lives in ``search_segments`` (indexed on clip_id) and the
+    segment text in the ``search_fts`` FTS5 table sharing its rowid, so removing
+    a clip touches only that clip's rows and queries are answered from the
+    inverted index regardless of corpus size.
+    """
+    def __init__(self, db_path: str = "search_index.db"):
+        self.db_path = db_path
+        self._local = threading.local()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Initialize the database schema"""
+        conn = self._connection()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_segments (
+                    id INTEGER PRIMARY KEY,
+                    clip_id TEXT NOT NULL,
+                    start REAL NOT NULL,
+                    "end" REAL NOT NULL,
+                    speaker_label TEXT,
+                    text TEXT
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_segments_clip ON search_segments (clip_id)"
+            )
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+                    text,
+                    content='search_segments',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+
+    @staticmethod
+    def _to_match_expression(query: str) -> str:
+        """Turn free text into an FTS5 expression matching all terms (no query syntax)"""
+        terms = [term.replace('"', '""') for term in query.split()]
+        return " ".join(f'"{term}"' for term in terms if term)
+
+    def _remove(self, conn: sqlite3.Connection, clip_id: str) -> None:
+        # External-content FTS tables need the old values to drop their postings
+        conn.execute(
+            """
+            INSERT INTO search_fts (search_fts, rowid, text)
+            SELECT 'delete', id, text FROM search_segments WHERE clip_id = ?
+            """,
+            (clip_id,)
+        )
+        conn.execute("DELETE FROM search_segments WHERE clip_id = ?", (clip_id,))
+
+    def index(self, clip_id: str, segments: Union[SegmentTable, List[SpeakerSegment]]) -> None:
+        """Replace the indexed segments of a clip"""
+        table = SegmentTable.coerce(segments, clip_id)
+        conn = self._connection()
+        with conn:
+            self._remove(conn, clip_id)
+            for start, end, speaker_label, text in table.rows():
+                if not text:
+                    continue
+                cursor = conn.execute(
+                    'INSERT INTO search_segments (clip_id, start, "end", speaker_label, text) VALUES (?, ?, ?, ?, ?)',
+                    (clip_id, start, end, speaker_label, text)
+                )
+                conn.execute(
+                    "INSERT INTO search_fts (rowid, text) VALUES (?, ?)",
+                    (cursor.lastrowid, text)
+                )
+
+    def remove(self, clip_id: str) -> None:
+        """Remove all indexed segments of a clip"""
+        conn = self._connection()
+        with conn:
+            self._remove(conn, clip_id)
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[SearchHit]:
+        """Return matching segments ranked by BM25, best match first"""
+        expression = self._to_match_expression(query)
+        if not expression:
+            return []
+
+        rows = self._connection().execute(
+            """
+            SELECT s.clip_id, s.start, s."end", s.speaker_label, s.text,
+                   snippet(search_fts, 0, '[', ']', '...', 16), search_fts.rank
+            FROM search_fts
+            JOIN search_segments s ON s.id = search_fts.rowid
+            WHERE search_fts MATCH ?
+            ORDER BY search_fts.rank
+            LIMIT ? OFFSET ?
+            """,
+            (expression, limit, offset)
+        )
+        return [
+            SearchHit(
+                clip_id=clip_id,
+                start=start,
+                end=end,
+                speaker_label=speaker_label,
+                text=text,
+                snippet=snippet,
+                # FTS5 ranks are negated BM25 scores (lower is better)
+                score=-rank
+            )
+            for clip_id, start, end, speaker_label, text, snippet, rank in rows
+        ]
@@ -0,0 +1,98 @@
+from dataclasses import dataclass, asdict, replace
+from typing import Optional, Tuple
+
+from domain.ports.transcription_port import UnknownDecodingProfileError
+
+# faster-whisper's default temperature fallback schedule
+TEMPERATURE_FALLBACK = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+@dataclass(frozen=True)
+class DecodingProfile:
+    """
+    Named set of faster-whisper decoding options.
+
+    Attributes:
+        beam_size: Beam width (1 = greedy decoding)
+        best_of: Candidates sampled when decoding with a non-zero temperature
+        temperature: Temperatures tried in order when a decode fails the quality checks
+        language: Pinned language code (None auto-detects on every call)
+        vad_filter: Skip non-speech with Silero VAD
+        vad_min_silence_ms: Minimum silence the VAD splits on
+        condition_on_previous_text: Feed the previous window's text as a prompt
+    """
+    name: str
+    beam_size: int = 5
+    best_of: int = 5
+    temperature: Tuple[float, ...] = TEMPERATURE_FALLBACK
+    language: Optional[str] = None
+    vad_filter: bool = True
+    vad_min_silence_ms: int = 500
+    condition_on_previous_text: bool = True
+
+    def with_language(self, language: Optional[str]) -> "DecodingProfile":
+        """Copy of the profile pinned to ``language`` (unchanged if None)"""
+        if language is None:
+            return self
+        return replace(self, language=language)
+
+    def transcribe_options(self) -> dict:
+        """Keyword arguments for faster_whisper.WhisperModel.transcribe"""
+        return {
+            "beam_size": self.beam_size,
+            "best_of": self.best_of,
+            "temperature": list(self.temperature),
+            "language": self.language,
+            "vad_filter": self.vad_filter,
+            "vad_parameters": {"min_silence_duration_ms": self.vad_min_silence_ms} if self.vad_filter else None,
+            "condition_on_previous_text": self.condition_on_previous_text,
+        }
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+DECODING_PROFILES = {
+    # Greedy, no fallback: drafts and previews
+    "fast": DecodingProfile(
+        name="fast",
+        beam_size=1,
+        best_of=1,
+        temperature=(0.0,),
+        condition_on_previous_text=False
+    ),
+    # The historical server defaults
+    "balanced": DecodingProfile(name="balanced"),
+    # Wider beam; VAD off so quiet speech is never dropped
+    "accurate": DecodingProfile(
+        name="accurate",
+        beam_size=8,
+        best_of=8,
+        vad_filter=False
+    ),
+    # Short turns decoded independently, which avoids hallucinated repetition
+    # carried over from the previous window
+    "turns": DecodingProfile(
+        name="turns",
+        beam_size=5,
+        condition_on_previous_text=False
+    ),
+}
+
+DRAFT_PROFILE = "fast"
+
+
+def get_decoding_profile(name: Optional[str], default: str = "balanced") -> DecodingProfile:
+    """
+    Look up a decoding profile by name.
+
+    Raises:
+        UnknownDecodingProfileError: If no profile has that name
+    """
+    key = (name or default).strip().lower()
+    try:
+        return DECODING_PROFILES[key]
+    except KeyError:
+        raise UnknownDecodingProfileError(
+            f"Unknown decoding profile '{name}', expected one of: {', '.join(DECODING_PROFILES)}"
+        )
@@ -0,0 +1,157 @@
+from typing import AsyncGenerator, List, Optional, Tuple
+import asyncio
+import random
+import time
+import wave
+
+from domain.ports.transcription_port import TranscriptionPort
+from domain.audio_clip import AudioClip
+from domain.word_timing import WordTiming
+from shared.utils.metrics import measure
+from shared.utils.tracing import in_context
+
+"""
+Fake outbound adapter for transcription used in testing, benchmarks and load tests.
+
+In hexagonal architecture:
+- Outbound adapters implement ports defined by the domain
+- This fake adapter lets the whole service run without Whisper
+- It mirrors FakeDiarizationAdapter, its diarization counterpart
+"""
+
+WORDS = "the quick brown fox jumps over a lazy dog while speakers take turns talking".split()
+
+
+class FakeTranscriptionAdapter(TranscriptionPort):
+    """
+    A fake implementation of the TranscriptionPort for testing purposes.
+    Returns deterministic filler text after a simulated decoding cost that
+    scales with the length of the transcribed audio.
+    """
+    # Drafts (greedy decoding on a small model) cost a fraction of a full pass
+    DRAFT_COST = 0.1
+
+    def __init__(self,
+                 seconds_per_audio_second: float = 0.0,
+                 cpu_seconds_per_audio_second: float = 0.0,
+                 words_per_second: float = 2.5,
+                 read_audio: bool = True):
+        """
+        Initialize the fake transcription adapter.
+
+        Args:
+            seconds_per_audio_second: Simulated latency (sleep on a worker thread) per second of audio
+            cpu_seconds_per_audio_second: CPU burned on a worker thread per second of audio
+            words_per_second: Length of the generated text per second of audio
+            read_audio: Read the requested window of WAV clips, like the real adapter decodes it
+        """
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self.cpu_seconds_per_audio_second = cpu_seconds_per_audio_second
+        self.words_per_second = words_per_second
+        self.read_audio = read_audio
+
+    @staticmethod
+    def _audio_seconds(clip: AudioClip, start: float, end: float) -> float:
+        if end <= 0:
+            end = clip.duration or 0.0
+        return max(0.0, end - start)
+
+    def _read_window(self, clip: AudioClip, start: float, end: float) -> None:
+        with measure("audio_decode") as attrs:
+            try:
+                with wave.open(clip.file_path, "rb") as wav:
+                    rate = wav.getframerate()
+                    first = min(int(start * rate), wav.getnframes())
+                    last = int(end * rate) if end > 0 else wav.getnframes()
+                    wav.setpos(first)
+                    frames = wav.readframes(max(0, last - first))
+                    attrs["audio_seconds"] = len(frames) / (wav.getsampwidth() * wav.getnchannels() * rate)
+            except (wave.Error, EOFError, OSError, TypeError):
+                # Not a readable WAV file; the fake does not need the audio
+                pass
+
+    def _transcribe_window(self, clip: AudioClip, start: float, end: float, cost: float = 1.0) -> str:
+        """Blocking part of a fake transcription; runs on a worker thread"""
+        if self.read_audio:
+            self._read_window(clip, start, end)
+        seconds = self._audio_seconds(clip, start, end)
+
+        # Burn CPU, then sleep for the simulated latency
+        deadline = time.thread_time() + seconds * self.cpu_seconds_per_audio_second * cost
+        while time.thread_time() < deadline:
+            pass
+        time.sleep(seconds * self.seconds_per_audio_second * cost)
+
+        rng = random.Random(f"{clip.id}:{start:.3f}:{end:.3f}")
+        return " ".join(rng.choice(WORDS) for _ in range(int(seconds * self.words_per_second) + 1))
+
+    async def transcribe(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> str:
+        """
+        Return fake text for a segment of the clip.
+        """
+        segments = [segment async for segment in self.transcribe_stream(clip, start, end, draft=draft)]
+        return " ".join(segments)
+
+    async def transcribe_stream(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream fake text for a segment of the clip.
+
+        Args:
+            clip: The audio clip to process (only its WAV window is read)
+            start: Start time in seconds
+            end: End time in seconds (0 for the end of the clip)
+            model: Ignored
+            draft: Simulate a draft pass (DRAFT_COST of the full cost)
+            profile: Ignored
+            language: Ignored
+
+        Returns:
+            Async generator yielding the fake text
+        """
+        loop = asyncio.get_running_loop()
+        with measure("transcribe", start=start, end=end, draft=draft) as attrs:
+            text = await loop.run_in_executor(
+                None, in_context(self._transcribe_window), clip, start, end, self.DRAFT_COST if draft else 1.0
+            )
+            attrs["chars"] = len(text)
+        yield text
+
+    async def transcribe_timed(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[str, List[WordTiming]]:
+        """
+        Return fake text for a segment of the clip, its words spread evenly over the segment.
+        """
+        text = " ".join([segment async for segment in self.transcribe_stream(clip, start, end, draft=draft)])
+        words = text.split()
+        if end <= 0:
+            end = clip.duration or start
+        step = max(0.0, end - start) / max(1, len(words))
+        return text, [
+            WordTiming(start + i * step, start + (i + 1) * step, word) for i, word in enumerate(words)
+        ]
@@ -1,30 +1,242 @@
-from typing import AsyncGenerator
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, List, Optional, Tuple, TypeVar, Union
 from domain.ports.transcription_port import TranscriptionPort
 from domain.audio_clip import AudioClip
+from domain.value_objects import LanguageDetection
+from domain.word_timing import WordTiming
 import os
+import tempfile
+from shared.utils.audio_cache import DecodedAudioCache
 from shared.utils.audio_converter import convert_to_wav
+from shared.utils.model_lifecycle import ModelHandle, resolve_model_async
+from shared.utils.metrics import measure
+from shared.utils.tracing import in_context
+from interfaces.outbound.transcription.decoding_profile import (
+    DRAFT_PROFILE, DecodingProfile, get_decoding_profile
+)
 from pydub import AudioSegment
-from interfaces.outbound.transcription.whisper_model import WhisperModel
+
+if TYPE_CHECKING:
+    from interfaces.outbound.transcription.whisper_model import WhisperModel
+    from interfaces.outbound.transcription.whisper_model_registry import WhisperModelRegistry
+
+T = TypeVar("T")
 
 
 class WhisperAdapter(TranscriptionPort):
     """
     WhisperAdapter is an outbound adapter that implements the TranscriptionPort interface.
     It uses the WhisperModel to transcribe audio clips.
+    The model may be given as a ModelHandle still loading in the background.
+    With a WhisperModelRegistry, requests may pick another model by name,
+    alias or quality preset. Decoding options come from named decoding
+    profiles (see decoding_profile), selectable per request.
     """
-    def __init__(self, model: WhisperModel):
+    def __init__(
+        self,
+        model: Union["WhisperModel", ModelHandle],
+        registry: Optional["WhisperModelRegistry"] = None,
+        default_profile: str = "balanced",
+        language: Optional[str] = None,
+        language_windows: int = 3,
+        language_window_seconds: float = 30.0,
+        audio_cache: Optional[DecodedAudioCache] = None
+    ):
+        """
+        Args:
+            model: The default model, or a handle to it
+            registry: Registry serving models selected per request
+            default_profile: Decoding profile used when a request names none
+            language: Language pinned for every profile (None auto-detects)
+            language_windows: Number of windows sampled to detect a clip's language
+            language_window_seconds: Length of each sampled window
+            audio_cache: Cache of decoded clips shared with other adapters (None decodes every time)
+        """
         self.model = model
-        
-    async def transcribe(self, clip: AudioClip, start: float, end: float) -> str:
+        self.registry = registry
+        self.default_profile = get_decoding_profile(default_profile)
+        self.language = language
+        self.language_windows = language_windows
+        self.language_window_seconds = language_window_seconds
+        self.audio_cache = audio_cache
+
+    def resolve_model(self, model: Optional[str]) -> Optional[str]:
+        """Validate a requested model name against the registry"""
+        if model is None or self.registry is None:
+            return None
+        resolved = self.registry.resolve(model)
+        return None if resolved == self.registry.default_model else resolved
+
+    def resolve_profile(self, profile: Optional[str]) -> Optional[str]:
+        """Validate a requested decoding profile name"""
+        if profile is None:
+            return None
+        return get_decoding_profile(profile).name
+
+    def _get_profile(self, profile: Optional[str], draft: bool, language: Optional[str] = None) -> DecodingProfile:
+        if draft:
+            decoding_profile = get_decoding_profile(DRAFT_PROFILE)
+        elif profile is None:
+            decoding_profile = self.default_profile
+        else:
+            decoding_profile = get_decoding_profile(profile)
+        return decoding_profile.with_language(language or self.language)
+
+    async def _get_model(self, model: Optional[str]) -> "WhisperModel":
+        model_name = self.resolve_model(model)
+        if model_name is None:
+            return await resolve_model_async(self.model)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, in_context(self.registry.get), model_name)
+
+    async def transcribe(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> str:
         """
         Transcribe an audio clip.
         """
         segments = []
-        async for segment in self.transcribe_stream(clip, start, end):
+        async for segment in self.transcribe_stream(
+            clip, start, end, model=model, draft=draft, profile=profile, language=language
+        ):
             segments.append(segment)
-        return segments
+        return " ".join(segments)
+
+    @staticmethod
+    def _wav_path(clip: AudioClip) -> str:
+        # Convert to WAV format first if needed
+        wav_path = clip.file_path
+        if not clip.file_path.lower().endswith('.wav'):
+            wav_path = f"{os.path.splitext(clip.file_path)[0]}.wav"
+            convert_to_wav(clip.file_path, wav_path)
+        return wav_path
+
+    def _decode(self, wav_path: str) -> AudioSegment:
+        """Decode a WAV file, through the decoded audio cache when there is one"""
+        with measure("audio_decode") as attrs:
+            if self.audio_cache is None:
+                audio = AudioSegment.from_wav(wav_path)
+            else:
+                audio = self.audio_cache.get(wav_path, AudioSegment.from_wav)
+            attrs["audio_seconds"] = len(audio) / 1000
+        return audio
+
+    @staticmethod
+    def _run_on_window(audio: AudioSegment, start_ms: int, end_ms: int, run: Callable[[str], T]) -> T:
+        """Export audio[start_ms:end_ms] to a temporary WAV file and call ``run`` with its path"""
+        # Unique per call since draft and final passes may process the same clip concurrently
+        fd, temp_segment_path = tempfile.mkstemp(prefix="segment_", suffix=".wav")
+        os.close(fd)
+        try:
+            audio[start_ms:end_ms].export(temp_segment_path, format="wav")
+            return run(temp_segment_path)
+        finally:
+            # Clean up
+            if os.path.exists(temp_segment_path):
+                os.remove(temp_segment_path)
+
+    def _transcribe_file(
+        self, model: "WhisperModel", clip: AudioClip, start: float, end: float, profile: DecodingProfile
+    ):
+        """Blocking part of a transcription; runs on a worker thread"""
+        wav_path = self._wav_path(clip)
+
+        # Process full audio
+        if not (start > 0 or (end > 0 and (clip.duration is None or end < clip.duration))):
+            return model.transcribe(wav_path, word_timestamps=True, profile=profile)
+
+        # Extract segment using pydub
+        audio = self._decode(wav_path)
+        # Convert seconds to milliseconds
+        start_ms = int(start * 1000)
+        end_ms = int(end * 1000) if end > 0 else len(audio)
+        return self._run_on_window(
+            audio, start_ms, end_ms,
+            lambda path: model.transcribe(path, word_timestamps=True, profile=profile)
+        )
+
+    def _detect_language_file(
+        self, model: "WhisperModel", clip: AudioClip, start: float, end: float
+    ) -> Optional[LanguageDetection]:
+        """
+        Run language identification on a few windows spread over [start, end)
+        and vote: the language with the highest summed probability wins.
+        Blocking; runs on a worker thread.
+        """
+        audio = self._decode(self._wav_path(clip))
+        start_ms = int(start * 1000)
+        end_ms = int(end * 1000) if end > 0 else len(audio)
+        span_ms = end_ms - start_ms
+        if span_ms <= 0:
+            return None
+
+        window_ms = min(int(self.language_window_seconds * 1000), span_ms)
+        count = max(1, min(self.language_windows, span_ms // window_ms))
+        scores = defaultdict(float)
+        for i in range(count):
+            # Window centers evenly spaced across the span
+            center = start_ms + span_ms * (2 * i + 1) // (2 * count)
+            window_start = max(start_ms, min(center - window_ms // 2, end_ms - window_ms))
+            language, probability = self._run_on_window(
+                audio, window_start, window_start + window_ms, model.detect_language
+            )
+            if language:
+                scores[language] += probability
 
-    async def transcribe_stream(self, clip: AudioClip, start: float, end: float) -> AsyncGenerator[str, None]:
+        if not scores:
+            return None
+        best = max(scores, key=scores.get)
+        return LanguageDetection(best, min(1.0, scores[best] / count))
+
+    async def detect_language(
+        self, clip: AudioClip, start: float = 0.0, end: float = 0.0
+    ) -> Optional[LanguageDetection]:
+        """
+        Identify the spoken language of a clip from a few sampled windows.
+
+        Args:
+            clip: The audio clip to process
+            start: Start time in seconds
+            end: End time in seconds (0 for the end of the clip)
+
+        Returns:
+            The detected language with its probability; the pinned language
+            (probability 1.0) if one is configured; None if detection failed
+        """
+        if self.language:
+            return LanguageDetection(self.language, 1.0)
+        model = await self._get_model(None)
+        try:
+            loop = asyncio.get_running_loop()
+            with measure("language_detection", start=start, end=end) as attrs:
+                detection = await loop.run_in_executor(
+                    None, in_context(self._detect_language_file), model, clip, start, end
+                )
+                if detection is not None:
+                    attrs.update(language=detection.language, probability=detection.probability)
+                return detection
+        except Exception as e:
+            print(f"Error detecting language: {str(e)}")
+            return None
+
+    async def transcribe_stream(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream transcription segments for an audio clip.
 
@@ -32,56 +244,79 @@ class WhisperAdapter(TranscriptionPort):
             clip: The audio clip to transcribe
             start: The start time of the segment to transcribe
             end: The end time of the segment to transcribe
+            model: Model name, alias or quality preset (None for the default model)
+            draft: Use the fast (greedy) decoding profile for a quick draft
+            profile: Decoding profile name (None for the adapter default)
+            language: Language code to decode in (None keeps the profile's setting)
 
         Returns:
             An async generator of transcription segments
         """
-        try:
-            # Convert to WAV format first if needed
-            wav_path = clip.file_path
-            if not clip.file_path.lower().endswith('.wav'):
-                wav_path = f"{os.path.splitext(clip.file_path)[0]}.wav"
-                convert_to_wav(clip.file_path, wav_path)
-
-            # If we need to extract a segment
-            if start > 0 or (end > 0 and end < clip.duration):
-                # Extract segment using pydub
-                audio = AudioSegment.from_wav(wav_path)
-                # Convert seconds to milliseconds
-                start_ms = int(start * 1000)
-                end_ms = int(end * 1000) if end > 0 else len(audio)
-                segment = audio[start_ms:end_ms]
+        result = await self._run_transcription(clip, start, end, model, draft, profile, language)
+        if result is not None:
+            yield result[0]
 
-                # Save the segment to a temporary file
-                temp_segment_path = f"/tmp/segment_{os.path.basename(wav_path)}"
-                segment.export(temp_segment_path, format="wav")
-
-                # Transcribe the segment
-                result = self.model.transcribe(
-                    temp_segment_path, word_timestamps=True)
-
-                # Clean up
-                if os.path.exists(temp_segment_path):
-                    os.remove(temp_segment_path)
+    async def transcribe_timed(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str] = None,
+        draft: bool = False,
+        profile: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> Tuple[str, List[WordTiming]]:
+        """
+        Transcribe a segment of an audio clip with Whisper's word timestamps
+        (computed on every pass anyway).
 
-                # Handle the transformers pipeline output format
-                if isinstance(result, dict) and "text" in result:
-                    yield result["text"].strip()
-                else:
-                    # For transformers pipeline output
-                    yield result.strip()
+        Returns:
+            The transcribed text and its words (times from the start of the clip)
+        """
+        result = await self._run_transcription(clip, start, end, model, draft, profile, language)
+        return result if result is not None else ("", [])
 
-            else:
-                # Process full audio
-                result = self.model.transcribe(wav_path, word_timestamps=True)
+    async def _run_transcription(
+        self,
+        clip: AudioClip,
+        start: float,
+        end: float,
+        model: Optional[str],
+        draft: bool,
+        profile: Optional[str],
+        language: Optional[str]
+    ) -> Optional[Tuple[str, List[WordTiming]]]:
+        """Text and word timings of a segment (None if transcription failed)"""
+        decoding_profile = self._get_profile(profile, draft, language)
+        model_name = self.resolve_model(model) or "default"
+        model = await self._get_model(model)
+        try:
+            # Decode on a worker thread so the event loop keeps serving other requests
+            loop = asyncio.get_running_loop()
+            with measure(
+                "transcribe", start=start, end=end, model=model_name, profile=decoding_profile.name,
+                language=decoding_profile.language, draft=draft
+            ) as attrs:
+                result = await loop.run_in_executor(
+                    None, in_context(self._transcribe_file), model, clip, start, end, decoding_profile
+                )
 
                 # Handle the transformers pipeline output format
+                words = []
                 if isinstance(result, dict) and "text" in result:
-                    yield result["text"].strip()
+                    text = result["text"].strip()
+                    # Word times are relative to the transcribed window
+                    words = [
+                        WordTiming(start + word_start, start + word_end, word)
+                        for word_start, word_end, word in result.get("words", ())
+                    ]
                 else:
                     # For transformers pipeline output
-                    yield result.strip()
+                    text = result.strip()
+                attrs["chars"] = len(text)
+            return text, words
 
         except Exception as e:
-            # Log error and return empty generator
-            print(f"Error transcribing audio: {str(e)}") 
\ No newline at end of file
+            # Log error and return no transcription
+            print(f"Error transcribing audio: {str(e)}")
+            return None
@@ -1,49 +1,69 @@
 import os
+from typing import Optional, Tuple
 from faster_whisper import WhisperModel as FWWhisperModel
 import torch
-from config import WHISPER_MODEL
-_whisper_model_instance = None
+from config import WHISPER_CPU_COMPUTE_TYPE, WHISPER_GPU_COMPUTE_TYPE
+from interfaces.outbound.transcription.decoding_profile import DecodingProfile, get_decoding_profile
 
 
 class WhisperModel:
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, cpu_threads: int = 0):
         if torch.cuda.is_available():
             device = "cuda"
-            compute_type = "int8_float16"
+            compute_type = WHISPER_GPU_COMPUTE_TYPE
             print(f"WhisperModel: Using GPU: {torch.cuda.get_device_name(0)}")
         else:
             device = "cpu"
-            compute_type = "float32"
-            print("WhisperModel: CUDA not available, using CPU")
+            compute_type = WHISPER_CPU_COMPUTE_TYPE
+            print(f"WhisperModel: CUDA not available, using CPU ({compute_type})")
 
         self.model = FWWhisperModel(
             model_name,
             device=device,
             compute_type=compute_type,
-            cpu_threads=os.cpu_count(),
+            cpu_threads=cpu_threads or os.cpu_count(),
             num_workers=1
         )
 
-    def transcribe(self, audio_path: str, word_timestamps: bool = False) -> dict:
+    def transcribe(
+        self,
+        audio_path: str,
+        word_timestamps: bool = False,
+        profile: Optional[DecodingProfile] = None
+    ) -> dict:
+        profile = profile or get_decoding_profile(None)
         segments, info = self.model.transcribe(
             audio_path,
-            beam_size=5,
-            language=None,
-            vad_filter=True,
-            vad_parameters={"min_silence_duration_ms": 500},
-            word_timestamps=word_timestamps
+            word_timestamps=word_timestamps,
+            **profile.transcribe_options()
         )
+        # Segments are a lazy generator; decode them once
+        segments = list(segments)
         text = " ".join(seg.text for seg in segments)
         res = {
             "text": text,
         }
+        if word_timestamps:
+            res["words"] = [
+                (word.start, word.end, word.word.strip())
+                for seg in segments
+                for word in (seg.words or [])
+            ]
         return res
 
-def get_whisper_model():
+    def detect_language(self, audio_path: str) -> Tuple[Optional[str], float]:
+        """
+        Identify the language of an audio file without decoding it.
+        faster-whisper detects the language eagerly while the returned
+        segments are a lazy generator, so leaving them unconsumed skips decoding.
+        """
+        _, info = self.model.transcribe(audio_path, beam_size=1, vad_filter=True)
+        return info.language, info.language_probability
+
+def get_whisper_model(model: str = None):
     """
-    Get or create the Whisper model instance (singleton pattern)
+    Get the Whisper model (the configured default unless ``model`` is given)
+    from the shared model registry
     """
-    global _whisper_model_instance
-    if _whisper_model_instance is None:
-        _whisper_model_instance = WhisperModel(WHISPER_MODEL)
-    return _whisper_model_instance 
\ No newline at end of file
+    from interfaces.outbound.transcription.whisper_model_registry import get_whisper_model_registry
+    return get_whisper_model_registry().get(model)
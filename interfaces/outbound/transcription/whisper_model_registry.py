@@ -0,0 +1,188 @@
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from domain.ports.transcription_port import UnknownModelError
+from config import WHISPER_MODEL, WHISPER_MEMORY_BUDGET_MB
+from shared.utils.metrics import MODEL_LOAD_SECONDS
+from shared.utils.resource_governor import get_resource_governor
+
+logger = logging.getLogger(__name__)
+_registry_instance = None
+
+# Short names accepted by the API, mapped to faster-whisper model names
+MODEL_ALIASES = {
+    "tiny": "tiny",
+    "base": "base",
+    "small": "small",
+    "medium": "medium",
+    "distil": "distil-large-v3",
+    "large": "large-v3",
+}
+
+# Quality presets map to an alias, so callers need not know model names
+QUALITY_PRESETS = {
+    "draft": "tiny",
+    "preview": "base",
+    "balanced": "distil",
+    "final": "large",
+}
+
+# Approximate resident size (MB) of each model, used for the memory budget
+MODEL_MEMORY_MB = {
+    "tiny": 150,
+    "base": 300,
+    "small": 900,
+    "medium": 2000,
+    "distil-large-v3": 1600,
+    "large-v3": 3200,
+}
+DEFAULT_MODEL_MEMORY_MB = 3200
+
+# Hub repositories publishing the models above under their own names
+MODEL_REPOSITORY_PREFIXES = ("openai/whisper-", "systran/faster-whisper-", "distil-whisper/")
+
+
+def _load_whisper_model(model_name: str) -> Any:
+    # Imported lazily: faster-whisper/torch are only needed once a model loads
+    from interfaces.outbound.transcription.whisper_model import WhisperModel
+    # CTranslate2 gets the cores the resource governor leaves to Whisper
+    return WhisperModel(model_name, cpu_threads=get_resource_governor().ctranslate2_threads)
+
+
+class WhisperModelRegistry:
+    """
+    Holds several Whisper models in memory within a memory budget.
+
+    Models are loaded on first request and evicted least-recently-used first
+    when loading another one would exceed the budget. The default model is
+    pinned and never evicted.
+    """
+    def __init__(
+        self,
+        default_model: str,
+        memory_budget_mb: int,
+        loader: Callable[[str], Any] = _load_whisper_model
+    ):
+        self.default_model = default_model
+        self.memory_budget_mb = memory_budget_mb
+        self.loader = loader
+        # Names equivalent to the default model resolve to it instead of loading a second copy
+        self._default_key = self._canonical(default_model)
+        self._models: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _canonical(model: str) -> str:
+        """Model name for an alias, quality preset or hub repository name (lowercased as-is otherwise)"""
+        key = model.strip().lower()
+        key = QUALITY_PRESETS.get(key, key)
+        key = MODEL_ALIASES.get(key, key)
+        for prefix in MODEL_REPOSITORY_PREFIXES:
+            if key.startswith(prefix) and key[len(prefix):] in MODEL_MEMORY_MB:
+                return key[len(prefix):]
+        return key
+
+    def resolve(self, model: Optional[str] = None) -> str:
+        """
+        Map a model alias, full model name or quality preset to a model name.
+        Other names of the default model resolve to the default model itself.
+
+        Raises:
+            UnknownModelError: If the name is not known to the registry
+        """
+        if model is None or model == self.default_model:
+            return self.default_model
+        key = self._canonical(model)
+        if key == self._default_key:
+            return self.default_model
+        if key in MODEL_MEMORY_MB:
+            return key
+        raise UnknownModelError(
+            f"Unknown model '{model}', expected one of: "
+            f"{', '.join([*MODEL_ALIASES, *QUALITY_PRESETS])}"
+        )
+
+    @classmethod
+    def _size_mb(cls, model_name: str) -> int:
+        return MODEL_MEMORY_MB.get(cls._canonical(model_name), DEFAULT_MODEL_MEMORY_MB)
+
+    def _loaded_mb(self) -> int:
+        return sum(self._size_mb(name) for name in self._models)
+
+    def _evict_for(self, model_name: str) -> None:
+        """Unload least recently used models until ``model_name`` fits (caller holds the lock)"""
+        needed = self._size_mb(model_name)
+        for name in list(self._models):
+            if self._loaded_mb() + needed <= self.memory_budget_mb:
+                break
+            if name == self.default_model:
+                continue
+            logger.info(f"Unloading Whisper model '{name}' to stay within memory budget")
+            del self._models[name]
+        gc.collect()
+
+    def get(self, model: Optional[str] = None) -> Any:
+        """
+        Return a loaded model, loading it (and evicting others) if needed.
+        Blocking; call from a worker thread.
+
+        Args:
+            model: Alias, model name or quality preset; None for the default model
+
+        Returns:
+            The loaded WhisperModel
+        """
+        model_name = self.resolve(model)
+        with self._lock:
+            if model_name in self._models:
+                self._models.move_to_end(model_name)
+                return self._models[model_name]
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+
+        # Load outside the registry lock so other models stay available,
+        # but only once per model name
+        with load_lock:
+            with self._lock:
+                if model_name in self._models:
+                    self._models.move_to_end(model_name)
+                    return self._models[model_name]
+                self._evict_for(model_name)
+
+            logger.info(f"Loading Whisper model '{model_name}'...")
+            started = time.perf_counter()
+            loaded = self.loader(model_name)
+            MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=f"whisper:{model_name}")
+            logger.info(f"Whisper model '{model_name}' loaded")
+
+            with self._lock:
+                self._models[model_name] = loaded
+                return loaded
+
+    def loaded_models(self) -> List[str]:
+        """Names of the models currently in memory, least recently used first"""
+        with self._lock:
+            return list(self._models)
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "default_model": self.default_model,
+                "loaded_models": list(self._models),
+                "loaded_mb": self._loaded_mb(),
+                "memory_budget_mb": self.memory_budget_mb,
+            }
+
+
+def get_whisper_model_registry() -> WhisperModelRegistry:
+    """
+    Get or create the Whisper model registry (singleton pattern)
+    """
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = WhisperModelRegistry(WHISPER_MODEL, WHISPER_MEMORY_BUDGET_MB)
+    return _registry_instance
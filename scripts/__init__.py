@@ -0,0 +1 @@
+# Maintenance Scripts Package
\ No newline at end of file
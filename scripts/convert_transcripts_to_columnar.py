@@ -0,0 +1,62 @@
+"""
+Convert stored JSON/JSONL transcripts into the columnar ``.seg`` format.
+
+Usage:
+    python -m scripts.convert_transcripts_to_columnar [--storage-path PATH] [--dry-run]
+"""
+import argparse
+import os
+
+from config import TRANSCRIPTION_STORAGE_PATH
+from interfaces.outbound.repositories.columnar_repository import ColumnarTranscriptionTextRepository
+from interfaces.outbound.repositories.file_system_repository import FileSystemTranscriptionTextRepository
+
+
+def convert_transcripts(storage_path: str, dry_run: bool = False) -> dict:
+    """
+    Convert every committed JSON/JSONL transcript in a storage directory.
+    Uncommitted segment logs are left alone so interrupted jobs can still resume.
+
+    Returns:
+        Summary with the number of converted clips and bytes before/after
+    """
+    source = FileSystemTranscriptionTextRepository(storage_path)
+    target = ColumnarTranscriptionTextRepository(storage_path)
+    summary = {"converted": 0, "skipped": 0, "bytes_before": 0, "bytes_after": 0}
+
+    clip_ids = sorted({
+        clip_id
+        for suffix in (".json", ".jsonl")
+        for clip_id, _ in source._layout.files(suffix)
+    })
+    for clip_id in clip_ids:
+        path = source._committed_path(clip_id)
+        if path is None:
+            summary["skipped"] += 1
+            continue
+
+        size_before = os.path.getsize(path)
+        if not dry_run:
+            target.save(clip_id, source.list(clip_id))
+            summary["bytes_after"] += os.path.getsize(target._get_columnar_path(clip_id))
+        summary["bytes_before"] += size_before
+        summary["converted"] += 1
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--storage-path", default=TRANSCRIPTION_STORAGE_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be converted")
+    args = parser.parse_args()
+
+    summary = convert_transcripts(args.storage_path, dry_run=args.dry_run)
+    print(
+        f"Converted {summary['converted']} transcripts "
+        f"({summary['skipped']} uncommitted logs skipped): "
+        f"{summary['bytes_before']} -> {summary['bytes_after']} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
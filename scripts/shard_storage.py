@@ -0,0 +1,68 @@
+"""
+Move files stored flat by earlier versions into their hash-sharded directories.
+
+Usage:
+    python -m scripts.shard_storage [--storage-path PATH ...] [--dry-run]
+"""
+import argparse
+import os
+
+from config import AUDIO_STORAGE_PATH, TRANSCRIPTION_STORAGE_PATH, SPEAKER_SEGMENT_STORAGE_PATH
+from shared.utils.sharded_layout import ShardedLayout
+
+# Suffixes of the files the repositories store; anything else (such as the
+# search index, which may share a directory with them) is left in place
+REPOSITORY_SUFFIXES = ("wav", "meta.json", "jsonl", "json", "draft", "seg", "turns", "words")
+
+
+def shard_storage(storage_path: str, dry_run: bool = False) -> dict:
+    """
+    Move the flat repository files of a storage directory (audio, clip
+    metadata, transcripts, speaker turns, word timings) into their shards;
+    other files are skipped. The repositories still read
+    flat files, so this can run while the server is up.
+
+    Returns:
+        Summary with the number of moved and skipped files
+    """
+    layout = ShardedLayout(storage_path)
+    summary = {"moved": 0, "skipped": 0}
+
+    with os.scandir(storage_path) as entries:
+        names = [entry.name for entry in entries if entry.is_file(follow_symlinks=False)]
+    for name in names:
+        # Keys never contain dots, so everything after the first one is the suffix
+        key, dot, suffix = name.partition(".")
+        if not key or not dot or suffix not in REPOSITORY_SUFFIXES:
+            summary["skipped"] += 1
+            continue
+        target = os.path.join(layout.shard_dir(key), name)
+        if not dry_run:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(os.path.join(storage_path, name), target)
+        summary["moved"] += 1
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--storage-path",
+        action="append",
+        help="Storage directory (repeatable; defaults to the configured audio, transcript and speaker paths)"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be moved")
+    args = parser.parse_args()
+
+    paths = args.storage_path or [
+        path for path in (AUDIO_STORAGE_PATH, TRANSCRIPTION_STORAGE_PATH, SPEAKER_SEGMENT_STORAGE_PATH) if path
+    ]
+    for path in paths:
+        if not os.path.isdir(path):
+            continue
+        summary = shard_storage(path, dry_run=args.dry_run)
+        print(f"{path}: moved {summary['moved']} files, skipped {summary['skipped']}")
+
+
+if __name__ == "__main__":
+    main()
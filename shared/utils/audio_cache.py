@@ -0,0 +1,82 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, int, int]
+
+
+def _size_of(audio: Any) -> int:
+    # pydub AudioSegments keep their PCM samples in raw_data
+    raw_data = getattr(audio, "raw_data", None)
+    return len(raw_data) if raw_data is not None else 0
+
+
+class DecodedAudioCache:
+    """
+    Least-recently-used cache of decoded audio files, bounded by the size of
+    their decoded samples.
+
+    Diarization and every segment transcription of a clip would otherwise
+    decode the same file again. Entries are keyed by path, modification time
+    and size, so a replaced file is decoded afresh.
+    """
+    def __init__(self, max_mb: int = 256):
+        self.max_bytes = max_mb * 1024 * 1024
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: str) -> CacheKey:
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: str, decode: Callable[[str], Any]) -> Any:
+        """
+        Return the decoded audio of ``path``, decoding it with ``decode`` on a miss.
+        Blocking; call from a worker thread for large files.
+        """
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        audio = decode(path)
+        size = _size_of(audio)
+        if size > self.max_bytes:
+            return audio
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (audio, size)
+                self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+        return audio
+
+    def invalidate(self, path: str) -> None:
+        """Drop every cached version of ``path``"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,193 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from shared.utils.metrics import AUDIO_DISK_CACHE_BYTES, AUDIO_DISK_CACHE_LOOKUPS
+from shared.utils.sharded_layout import ShardedLayout
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLRUCache:
+    """
+    Least-recently-used cache of files in a local directory, bounded by their
+    total size. Used to keep hot clips of a remote store on local disk.
+
+    Entries are ``{key}{suffix}`` files in a ShardedLayout; files left by an
+    earlier process are adopted at start-up, oldest access first. Entries
+    pinned by a job that reads them are never evicted, so the cache can exceed
+    its budget while they are in use. Concurrent fills of the same key wait
+    for a single download.
+    """
+    def __init__(self, directory: str, max_mb: int = 2048, suffix: str = ".wav"):
+        """
+        Args:
+            directory: Cache directory
+            max_mb: Disk budget
+            suffix: File name suffix of entries (keeps the audio format recognizable)
+        """
+        self.max_bytes = max_mb * 1024 * 1024
+        self.suffix = suffix
+        self._layout = ShardedLayout(directory)
+        # key -> (size, last use), least recently used first
+        self._entries: "OrderedDict[str, tuple[int, float]]" = OrderedDict()
+        self._filling: Dict[str, threading.Event] = {}
+        # key -> number of holders of a pin
+        self._pins: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        found = []
+        for key, entry in self._layout.files(suffix):
+            stat = entry.stat()
+            found.append((max(stat.st_atime, stat.st_mtime), key, stat.st_size))
+        for last_used, key, size in sorted(found):
+            self._entries[key] = (size, last_used)
+            self._bytes += size
+        AUDIO_DISK_CACHE_BYTES.set(self._bytes)
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of the cached file (marking it used), or None"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            size, _ = self._entries.pop(key)
+            self._entries[key] = (size, time.time())
+        path = self._layout.path(key, self.suffix)
+        if not os.path.exists(path):
+            # Removed behind our back
+            self.discard(key)
+            return None
+        return path
+
+    @contextmanager
+    def pinned(self, key: str) -> Iterator[None]:
+        """Keep the entry of ``key`` (once it is filled) from being evicted until the block ends"""
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                remaining = self._pins.pop(key) - 1
+                if remaining:
+                    self._pins[key] = remaining
+                evicted = self._evict()
+            self._remove_files(evicted)
+
+    def fill(self, key: str, write: Callable[[str], None], prefetch: bool = False) -> Optional[str]:
+        """
+        Return the cached file of ``key``, creating it with ``write(path)`` on a miss
+
+        Args:
+            key: Entry key
+            write: Writes the entry's content to the given (temporary) path
+            prefetch: Opportunistic fill: skipped (returning None) when the
+                cache is full of pinned entries
+
+        Raises:
+            Whatever ``write`` raises; nothing is cached then
+        """
+        while True:
+            path = self.get(key)
+            if path is not None:
+                if not prefetch:
+                    AUDIO_DISK_CACHE_LOOKUPS.inc(result="hit")
+                return path
+            with self._lock:
+                filling = self._filling.get(key)
+                if filling is None:
+                    if prefetch and not self._has_room():
+                        return None
+                    self._filling[key] = threading.Event()
+                    break
+            # Another thread is fetching it; use its result (or retry if it failed)
+            filling.wait()
+
+        AUDIO_DISK_CACHE_LOOKUPS.inc(result="prefetch" if prefetch else "miss")
+        try:
+            return self.put(key, write)
+        finally:
+            with self._lock:
+                self._filling.pop(key).set()
+
+    def put(self, key: str, write: Callable[[str], None]) -> str:
+        """Create (or replace) the entry of ``key`` with ``write(path)`` and return its path"""
+        path = self._layout.writable_path(key, self.suffix)
+        tmp_path = f"{path}.tmp"
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._add(key, os.path.getsize(path))
+        return path
+
+    def _has_room(self) -> bool:
+        """Whether the cache is under budget or has unpinned entries to evict (lock held)"""
+        return self._bytes < self.max_bytes or any(key not in self._pins for key in self._entries)
+
+    def _evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Drop unpinned entries, least recently used first, until the cache fits
+        its budget (lock held); ``keep`` is spared as if it were pinned
+        """
+        evicted = []
+        for key, (size, _) in list(self._entries.items()):
+            if self._bytes <= self.max_bytes:
+                break
+            if key in self._pins or key == keep:
+                continue
+            del self._entries[key]
+            self._bytes -= size
+            evicted.append(key)
+        AUDIO_DISK_CACHE_BYTES.set(self._bytes)
+        return evicted
+
+    def _add(self, key: str, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[0]
+            self._entries[key] = (size, time.time())
+            self._bytes += size
+            # The new entry is about to be returned to its caller
+            evicted = self._evict(keep=key)
+            over_budget = self._bytes > self.max_bytes
+        self._remove_files(evicted)
+        if over_budget:
+            logger.warning("Audio disk cache holds %d bytes, over its %d byte budget; the other entries are pinned",
+                           self._bytes, self.max_bytes)
+
+    def _remove_files(self, keys: List[str]) -> None:
+        for key in keys:
+            self._remove_file(key)
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._layout.path(key, self.suffix))
+        except FileNotFoundError:
+            pass
+
+    def discard(self, key: str) -> None:
+        """Drop the entry of ``key``"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[0]
+            AUDIO_DISK_CACHE_BYTES.set(self._bytes)
+        self._remove_file(key)
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "pinned": len(self._pins),
+            }
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple
+
+from shared.utils.metrics import QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class FairScheduler:
+    """
+    Runs queued jobs on a fixed number of worker tasks, sharing the workers
+    fairly between groups (e.g. batches): workers take one job from each
+    group with queued work in turn, so a large group cannot starve the
+    others.
+    """
+    def __init__(self, workers: int = 2, name: str = "batch"):
+        """
+        Args:
+            workers: Number of jobs run concurrently
+            name: Queue name reported in the queue depth metric
+        """
+        self.workers = workers
+        self.name = name
+        self._groups: "OrderedDict[str, Deque[Tuple[Job, asyncio.Future]]]" = OrderedDict()
+        # Released once per submitted job; cancelled jobs leave stale permits
+        self._pending: Optional[asyncio.Semaphore] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def _start(self) -> None:
+        if self._tasks and not all(task.done() for task in self._tasks):
+            return
+        # Created on first use, inside the running event loop
+        self._pending = asyncio.Semaphore(0)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    def submit(self, group: str, job: Job) -> asyncio.Future:
+        """
+        Queue a job (a zero-argument coroutine function) for ``group``.
+
+        Returns:
+            Future resolved with the job's result or exception
+        """
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        self._groups.setdefault(group, deque()).append((job, future))
+        QUEUE_DEPTH.inc(queue=self.name)
+        self._pending.release()
+        return future
+
+    def cancel_group(self, group: str) -> int:
+        """Drop the group's queued jobs (running jobs finish); returns how many were dropped"""
+        queue = self._groups.pop(group, None)
+        if not queue:
+            return 0
+        for _, future in queue:
+            future.cancel()
+        QUEUE_DEPTH.dec(len(queue), queue=self.name)
+        return len(queue)
+
+    def queued(self, group: Optional[str] = None) -> int:
+        if group is not None:
+            return len(self._groups.get(group, ()))
+        return sum(len(queue) for queue in self._groups.values())
+
+    async def _next(self) -> Tuple[Job, asyncio.Future]:
+        while True:
+            await self._pending.acquire()
+            if self._groups:
+                break
+        # Round robin: take the first group's next job and move the group to the back
+        group, queue = self._groups.popitem(last=False)
+        item = queue.popleft()
+        if queue:
+            self._groups[group] = queue
+        QUEUE_DEPTH.dec(queue=self.name)
+        return item
+
+    async def _worker(self) -> None:
+        while True:
+            job, future = await self._next()
+            if future.cancelled():
+                continue
+            try:
+                result = await job()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,377 @@
+"""
+Dependency-free metrics in the Prometheus text exposition format.
+
+Metrics are process-local and updated under a per-metric lock, so recording
+a sample costs a dict lookup and a few additions; ``MetricsRegistry.render``
+produces the text served on ``/metrics``.
+"""
+
+import asyncio
+import functools
+import inspect
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import aclosing, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from shared.utils.tracing import span
+
+# Seconds; covers sub-millisecond repository reads up to multi-minute model calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        """Increment while the block runs"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets"""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            state[0][index] += 1
+            state[1][0] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the block"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels((*self.labelnames, "le"), (*key, _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together; metrics are created once by name"""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Pipeline metrics shared by adapters and use cases
+STAGE_SECONDS = REGISTRY.histogram(
+    "whisper_stage_duration_seconds",
+    "Duration of pipeline stages",
+    ("stage",)
+)
+JOBS_IN_FLIGHT = REGISTRY.gauge(
+    "whisper_jobs_in_flight",
+    "Transcription jobs currently running",
+    ("mode",)
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "whisper_queue_depth",
+    "Work items waiting to be processed",
+    ("queue",)
+)
+REAL_TIME_FACTOR = REGISTRY.histogram(
+    "whisper_real_time_factor",
+    "Processing time divided by audio duration, per transcribed clip",
+    ("mode",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+)
+MODEL_LOAD_SECONDS = REGISTRY.gauge(
+    "whisper_model_load_seconds",
+    "Time taken to load each model",
+    ("model",)
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "whisper_http_request_duration_seconds",
+    "HTTP request latency until the response starts",
+    ("method", "route", "status")
+)
+DIARIZATION_CACHE_LOOKUPS = REGISTRY.counter(
+    "whisper_diarization_cache_lookups_total",
+    "Lookups of stored diarization results before diarizing a clip",
+    ("result",)
+)
+AUDIO_DISK_CACHE_BYTES = REGISTRY.gauge(
+    "whisper_audio_disk_cache_bytes",
+    "Audio kept in the local disk cache of the object store"
+)
+AUDIO_DISK_CACHE_LOOKUPS = REGISTRY.counter(
+    "whisper_audio_disk_cache_lookups_total",
+    "Reads of object store audio through the local disk cache (hit, miss, or prefetch download)",
+    ("result",)
+)
+EXPORT_CACHE_LOOKUPS = REGISTRY.counter(
+    "whisper_export_cache_lookups_total",
+    "Whole-transcript exports served from the export cache (hit) or rendered and stored (miss)",
+    ("result",)
+)
+STORAGE_BYTES = REGISTRY.gauge(
+    "whisper_storage_bytes",
+    "Stored audio and clip metadata at the last storage sweep"
+)
+STORAGE_EVICTIONS = REGISTRY.counter(
+    "whisper_storage_evictions_total",
+    "Clips evicted by the storage sweeper",
+    ("reason",)
+)
+RESOURCE_THREADS = REGISTRY.gauge(
+    "whisper_resource_threads",
+    "CPU threads assigned to each inference runtime by the resource governor",
+    ("runtime",)
+)
+DIARIZATION_CHUNK_WORKERS = REGISTRY.gauge(
+    "whisper_diarization_chunk_workers",
+    "Diarization chunks processed concurrently (adjusted by the resource governor)"
+)
+PROCESS_RESIDENT_BYTES = REGISTRY.gauge(
+    "whisper_process_resident_memory_bytes",
+    "Resident memory of the server process at the governor's last adjustment"
+)
+
+
+@contextmanager
+def measure(stage: str, **attrs):
+    """
+    Time the block as a pipeline stage: observed in the stage histogram and
+    recorded as a span of the current job's trace. Yields the span's
+    attribute dict, so sizes known only at the end can be added.
+    """
+    with STAGE_SECONDS.time(stage=stage), span(stage, **attrs) as span_attrs:
+        yield span_attrs
+
+
+def timed(stage: str, attrs: Optional[Callable[..., dict]] = None) -> Callable:
+    """
+    Decorator measuring a sync or async function as a pipeline stage.
+
+    Args:
+        stage: Stage name
+        attrs: Called with the function's arguments; returns span attributes (e.g. sizes)
+    """
+    def decorator(func: Callable) -> Callable:
+        def span_attrs(args, kwargs) -> dict:
+            return attrs(*args, **kwargs) if attrs is not None else {}
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with measure(stage, **span_attrs(args, kwargs)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with measure(stage, **span_attrs(args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def observe_real_time_factor(mode: str, started: float, audio_seconds: Optional[float]) -> None:
+    """Record processing time / audio duration for a clip started at ``started`` (perf_counter)"""
+    if audio_seconds:
+        REAL_TIME_FACTOR.observe((time.perf_counter() - started) / audio_seconds, mode=mode)
+
+
+def track_job(mode: str, audio_end: Callable[[Any], float] = lambda segment: segment.end) -> Callable:
+    """
+    Decorator for transcription jobs (coroutines returning segments, or async
+    generators yielding them): counts in-flight jobs and records the real-time
+    factor, taking the audio duration from the latest ``audio_end`` produced.
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def generator_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                audio_seconds = 0.0
+                with JOBS_IN_FLIGHT.track_inprogress(mode=mode):
+                    async with aclosing(func(*args, **kwargs)) as items:
+                        async for item in items:
+                            audio_seconds = max(audio_seconds, audio_end(item))
+                            yield item
+                observe_real_time_factor(mode, started, audio_seconds)
+            return generator_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            with JOBS_IN_FLIGHT.track_inprogress(mode=mode):
+                result = await func(*args, **kwargs)
+            observe_real_time_factor(mode, started, max((audio_end(item) for item in result), default=0.0))
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from shared.utils.metrics import MODEL_LOAD_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class ModelState(str, Enum):
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class ModelUnavailableError(RuntimeError):
+    """Raised when a model is requested that failed to load or is disabled"""
+
+
+class ModelHandle:
+    """
+    Placeholder for a model that is loaded in the background.
+    Adapters hold the handle and resolve the model when they first need it.
+    """
+    def __init__(self, name: str, loader: Callable[[], Any], enabled: bool = True):
+        self.name = name
+        self.loader = loader
+        self.state = ModelState.PENDING if enabled else ModelState.SKIPPED
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._model = None
+        self._done = threading.Event()
+        # Futures of coroutines awaiting the load, with their event loops
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._waiters_lock = threading.Lock()
+        if not enabled:
+            self._done.set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.state != ModelState.SKIPPED
+
+    def load(self) -> None:
+        """Run the loader (called on a background thread by ModelLifecycleManager)"""
+        self.state = ModelState.LOADING
+        started = time.perf_counter()
+        logger.info(f"Loading model '{self.name}'...")
+        try:
+            self._model = self.loader()
+            self.state = ModelState.READY
+            logger.info(f"Model '{self.name}' loaded")
+        except Exception as e:
+            self.error = str(e)
+            self.state = ModelState.FAILED
+            logger.exception(f"Model '{self.name}' failed to load")
+        finally:
+            self.load_seconds = time.perf_counter() - started
+            MODEL_LOAD_SECONDS.set(self.load_seconds, model=self.name)
+            with self._waiters_lock:
+                self._done.set()
+                waiters, self._waiters = self._waiters, []
+            for loop, future in waiters:
+                try:
+                    loop.call_soon_threadsafe(_resolve, future)
+                except RuntimeError:
+                    pass  # The waiter's event loop is closed
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Block until the model is loaded and return it.
+
+        Raises:
+            ModelUnavailableError: If the model is disabled, failed to load or the timeout expired
+        """
+        if not self._done.wait(timeout):
+            raise ModelUnavailableError(f"Model '{self.name}' is still loading")
+        if self.state != ModelState.READY:
+            reason = self.error or self.state.value
+            raise ModelUnavailableError(f"Model '{self.name}' is unavailable: {reason}")
+        return self._model
+
+    async def get_async(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the model without blocking the event loop. Waiting holds no
+        thread: the loader completes a future on the caller's loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._waiters_lock:
+            if self._done.is_set():
+                return self.get(0)
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            raise ModelUnavailableError(f"Model '{self.name}' is still loading")
+        finally:
+            with self._waiters_lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        return self.get(0)
+
+    def status(self) -> dict:
+        return {
+            "state": self.state.value,
+            "load_seconds": self.load_seconds,
+            "error": self.error
+        }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def resolve_model(model: Any) -> Any:
+    """Return the model behind a ModelHandle (blocking), or the object itself"""
+    if isinstance(model, ModelHandle):
+        return model.get()
+    return model
+
+
+async def resolve_model_async(model: Any) -> Any:
+    """Return the model behind a ModelHandle without blocking the event loop"""
+    if isinstance(model, ModelHandle):
+        return await model.get_async()
+    return model
+
+
+class ModelLifecycleManager:
+    """
+    Loads registered models in parallel on background threads so the
+    application can start serving requests that do not need them right away.
+    """
+    def __init__(self):
+        self._handles: Dict[str, ModelHandle] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def register(self, name: str, loader: Callable[[], Any], enabled: bool = True) -> ModelHandle:
+        """
+        Register a model loader
+
+        Args:
+            name: Model name used in status reports
+            loader: Zero-argument callable returning the loaded model
+            enabled: Disabled models are never loaded and report "skipped"
+        """
+        handle = ModelHandle(name, loader, enabled=enabled)
+        self._handles[name] = handle
+        return handle
+
+    def handle(self, name: str) -> ModelHandle:
+        return self._handles[name]
+
+    def start(self) -> None:
+        """Start loading all enabled models in parallel"""
+        pending = [h for h in self._handles.values() if h.state == ModelState.PENDING]
+        if not pending:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="model-loader")
+        for handle in pending:
+            self._executor.submit(handle.load)
+        self._executor.shutdown(wait=False)
+
+    def is_ready(self) -> bool:
+        """True when every enabled model is loaded"""
+        return all(
+            h.state == ModelState.READY
+            for h in self._handles.values()
+            if h.enabled
+        )
+
+    def status(self) -> Dict[str, dict]:
+        return {name: handle.status() for name, handle in self._handles.items()}
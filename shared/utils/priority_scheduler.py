@@ -0,0 +1,267 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import math
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from shared.utils.metrics import QUEUE_DEPTH
+
+# Priority classes, most urgent first
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PRIORITIES = (INTERACTIVE, BATCH)
+
+ANONYMOUS_TENANT = "anonymous"
+
+
+class UnknownPriorityError(LookupError):
+    """Raised when a request names a priority class that does not exist"""
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when the queue ahead of a new job is too long to accept it"""
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class JobClass:
+    """Who a job runs for and how urgent it is"""
+    tenant: str = ANONYMOUS_TENANT
+    priority: str = INTERACTIVE
+
+
+class ScheduledJob:
+    """Accounting of one admitted job: the audio it still has to transcribe"""
+    def __init__(self, job_class: JobClass):
+        self.job_class = job_class
+        self.remaining = 0.0
+
+    def set_cost(self, audio_seconds: float) -> None:
+        self.remaining = max(0.0, audio_seconds)
+
+
+_job_class: ContextVar[JobClass] = ContextVar("job_class", default=JobClass())
+_current_job: ContextVar[Optional[ScheduledJob]] = ContextVar("scheduled_job", default=None)
+
+
+def tenant_id(api_key: Optional[str]) -> str:
+    """Tenant of a request: a digest of its API key, so keys never reach logs or metrics"""
+    if not api_key:
+        return ANONYMOUS_TENANT
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+def check_priority(priority: Optional[str], default: str = INTERACTIVE) -> str:
+    """
+    Validate a requested priority class
+
+    Raises:
+        UnknownPriorityError: If the class does not exist
+    """
+    if priority is None:
+        return default
+    if priority not in PRIORITIES:
+        raise UnknownPriorityError(
+            f"Unknown priority '{priority}'; expected one of: {', '.join(PRIORITIES)}"
+        )
+    return priority
+
+
+@contextmanager
+def job_class(tenant: str, priority: str) -> Iterator[JobClass]:
+    """Run the enclosed jobs for ``tenant`` in the ``priority`` class"""
+    value = JobClass(tenant, priority)
+    token = _job_class.set(value)
+    try:
+        yield value
+    finally:
+        try:
+            _job_class.reset(token)
+        except ValueError:
+            # Async generator finalized from another task's context
+            _job_class.set(JobClass())
+
+
+def current_job_class() -> JobClass:
+    return _job_class.get()
+
+
+class PriorityScheduler:
+    """
+    Shares the model slots (concurrent model calls) between jobs, one
+    segment at a time.
+
+    Every segment transcription waits for a slot. Free slots go to waiting
+    segments of the most urgent priority class first; within a class, tenants
+    get equal shares of model time through start-time fair queuing weighted
+    by the audio seconds of each segment. A long job therefore gives way to
+    newly arrived work between its segments.
+
+    Admission control estimates how long the queued work ahead of a new job
+    takes (remaining audio seconds of admitted jobs in classes at least as
+    urgent, times the observed model seconds per audio second, divided by the
+    slots) and rejects the job when that exceeds max_wait.
+    """
+    def __init__(self, slots: int = 2, max_wait: float = 300.0, seconds_per_audio_second: float = 0.5):
+        """
+        Args:
+            slots: Number of concurrent model calls
+            max_wait: Longest estimated queue wait (seconds) at which jobs are still admitted
+            seconds_per_audio_second: Initial estimate of model time per second of audio,
+                refined from observed segment durations
+        """
+        self.slots = slots
+        self.max_wait = max_wait
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self._free = slots
+        self._sequence = itertools.count()
+        # (priority rank, start tag, sequence, priority, future)
+        self._waiters: List[Tuple[int, float, int, str, asyncio.Future]] = []
+        self._virtual_time: Dict[str, float] = {priority: 0.0 for priority in PRIORITIES}
+        self._finish_tags: Dict[Tuple[str, str], float] = {}
+        self._queued: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self._jobs: List[ScheduledJob] = []
+        self._lock = threading.Lock()
+
+    def backlog(self, priority: str) -> float:
+        """Remaining audio seconds of admitted jobs at least as urgent as ``priority``"""
+        rank = PRIORITIES.index(priority)
+        with self._lock:
+            return sum(
+                job.remaining for job in self._jobs
+                if PRIORITIES.index(job.job_class.priority) <= rank
+            )
+
+    def estimated_wait(self, priority: Optional[str] = None) -> float:
+        """Seconds until the queued work ahead of a new job of ``priority`` is done"""
+        priority = priority or current_job_class().priority
+        return self.backlog(priority) * self.seconds_per_audio_second / self.slots
+
+    def admit(self, priority: Optional[str] = None) -> None:
+        """
+        Check that a new job may start
+
+        Raises:
+            AdmissionRejectedError: If the estimated queue wait exceeds max_wait;
+                its retry_after estimates when the queue will have drained enough
+        """
+        wait = self.estimated_wait(priority)
+        if wait > self.max_wait:
+            raise AdmissionRejectedError(
+                f"Transcription queue is full (estimated wait {wait:.0f} s)",
+                retry_after=math.ceil(wait - self.max_wait)
+            )
+
+    @contextmanager
+    def job(self) -> Iterator[ScheduledJob]:
+        """
+        Account for a job while it runs; call set_cost on the yielded job once
+        its audio length is known. A job started inside another one joins it.
+        """
+        outer = _current_job.get()
+        if outer is not None:
+            yield outer
+            return
+
+        job = ScheduledJob(current_job_class())
+        with self._lock:
+            self._jobs.append(job)
+        token = _current_job.set(job)
+        try:
+            yield job
+        finally:
+            try:
+                _current_job.reset(token)
+            except ValueError:
+                # Async generator finalized from another task's context
+                _current_job.set(None)
+            with self._lock:
+                self._jobs.remove(job)
+
+    def _enqueue(self, cost: float) -> asyncio.Future:
+        job_class = current_job_class()
+        priority = job_class.priority
+        key = (priority, job_class.tenant)
+        start = max(self._virtual_time[priority], self._finish_tags.get(key, 0.0))
+        self._finish_tags[key] = start + cost
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (PRIORITIES.index(priority), start, next(self._sequence), priority, future))
+        self._queued[priority] += 1
+        QUEUE_DEPTH.inc(queue="model_slots")
+        return future
+
+    def _advance(self, priority: str, virtual_time: float) -> None:
+        """Move the class's virtual time forward, dropping finish tags that no longer delay anyone"""
+        if virtual_time <= self._virtual_time[priority]:
+            return
+        self._virtual_time[priority] = virtual_time
+        self._finish_tags = {
+            key: finish for key, finish in self._finish_tags.items()
+            if key[0] != priority or finish > virtual_time
+        }
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, start, _, priority, future = heapq.heappop(self._waiters)
+            QUEUE_DEPTH.dec(queue="model_slots")
+            self._queued[priority] -= 1
+            if not self._queued[priority]:
+                # The class's queue drained: it is idle at its latest finish tag
+                start = max([start] + [finish for (p, _), finish in self._finish_tags.items() if p == priority])
+            self._advance(priority, start)
+            if not future.done():
+                # Hand the slot straight to the waiter
+                future.set_result(None)
+                return
+        self._free += 1
+
+    @asynccontextmanager
+    async def slot(self, cost: float):
+        """
+        Hold a model slot for one segment
+
+        Args:
+            cost: Audio seconds the segment covers
+        """
+        if self._free > 0:
+            # Slots are only free while nobody waits
+            self._free -= 1
+        else:
+            future = self._enqueue(cost)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted just before the cancellation; pass the slot on
+                    self._release()
+                raise
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._release()
+            elapsed = time.perf_counter() - started
+            if cost > 0:
+                # Exponentially weighted estimate of model seconds per audio second
+                self.seconds_per_audio_second += 0.1 * (elapsed / cost - self.seconds_per_audio_second)
+            job = _current_job.get()
+            if job is not None:
+                job.remaining = max(0.0, job.remaining - cost)
+
+    def status(self) -> dict:
+        return {
+            "slots": self.slots,
+            "free": self._free,
+            "waiting": sum(1 for *_, future in self._waiters if not future.done()),
+            "seconds_per_audio_second": self.seconds_per_audio_second,
+            "estimated_wait": {priority: self.estimated_wait(priority) for priority in PRIORITIES},
+        }
@@ -0,0 +1,169 @@
+import logging
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from shared.utils.metrics import DIARIZATION_CHUNK_WORKERS, PROCESS_RESIDENT_BYTES, RESOURCE_THREADS
+
+logger = logging.getLogger(__name__)
+_governor_instance = None
+
+
+def process_rss_bytes() -> Optional[int]:
+    """Current resident memory of this process (Linux), or None where unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def physical_memory_bytes() -> Optional[int]:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+class ResourceGovernor:
+    """
+    Splits the CPU between the two inference runtimes and tunes how many
+    diarization chunks run at once.
+
+    Pyannote (torch intra-op threads) gets diarization_share of the cores,
+    divided between the chunks that may run concurrently; CTranslate2
+    (Whisper) gets the rest, or every core when diarization is disabled.
+
+    Chunk concurrency is tuned by hill climbing: after every ``window``
+    finished chunks the governor compares the throughput (audio seconds
+    diarized per second of chunk time, times the concurrency) with the
+    previous window and keeps stepping in the same direction while it
+    improves, reversing otherwise. Memory above the high watermark halves the
+    concurrency, and a load average above the core count steps it down.
+    """
+    def __init__(
+        self,
+        cpu_threads: int = 0,
+        diarization_share: float = 0.5,
+        diarization_enabled: bool = True,
+        max_chunk_workers: int = 4,
+        memory_high_watermark_mb: int = 0,
+        window: int = 4
+    ):
+        """
+        Args:
+            cpu_threads: Cores to divide (0 uses every core)
+            diarization_share: Fraction of the cores given to Pyannote
+            diarization_enabled: Whether Pyannote runs at all
+            max_chunk_workers: Upper bound on concurrently processed diarization chunks
+            memory_high_watermark_mb: Resident memory above which chunk concurrency is
+                halved (0 uses 80% of physical memory)
+            window: Number of finished chunks between adjustments
+        """
+        self.cpu_threads = cpu_threads or os.cpu_count() or 1
+        self.max_chunk_workers = max(1, max_chunk_workers)
+        self.window = window
+
+        if diarization_enabled and self.cpu_threads > 1:
+            diarization_cores = min(self.cpu_threads - 1, max(1, round(self.cpu_threads * diarization_share)))
+        else:
+            diarization_cores = 0
+        self.ctranslate2_threads = self.cpu_threads - diarization_cores
+        # Every concurrent chunk runs its own torch thread team
+        self.torch_threads = max(1, diarization_cores // self.max_chunk_workers)
+
+        if memory_high_watermark_mb:
+            self.memory_high_watermark = memory_high_watermark_mb * 1024 * 1024
+        else:
+            physical = physical_memory_bytes()
+            self.memory_high_watermark = int(physical * 0.8) if physical else None
+
+        self.chunk_workers = max(1, self.max_chunk_workers // 2)
+        self._direction = 1
+        self._previous_throughput: Optional[float] = None
+        self._samples: List[Tuple[float, float]] = []
+        self._lock = threading.Lock()
+
+        RESOURCE_THREADS.set(self.torch_threads, runtime="torch")
+        RESOURCE_THREADS.set(self.ctranslate2_threads, runtime="ctranslate2")
+        DIARIZATION_CHUNK_WORKERS.set(self.chunk_workers)
+
+    def apply_torch_threads(self) -> None:
+        """Limit torch's intra-op threads; call where torch is imported anyway"""
+        import torch
+        torch.set_num_threads(self.torch_threads)
+
+    def observe_chunk(self, audio_seconds: float, elapsed: float) -> None:
+        """Record a finished diarization chunk and adjust the concurrency every window"""
+        with self._lock:
+            self._samples.append((audio_seconds, elapsed))
+            if len(self._samples) >= self.window:
+                self._adjust()
+
+    def _adjust(self) -> None:
+        audio = sum(audio_seconds for audio_seconds, _ in self._samples)
+        busy = sum(elapsed for _, elapsed in self._samples)
+        self._samples.clear()
+        throughput = audio / busy * self.chunk_workers if busy > 0 else None
+
+        rss = process_rss_bytes()
+        if rss is not None:
+            PROCESS_RESIDENT_BYTES.set(rss)
+        try:
+            load_per_core = os.getloadavg()[0] / self.cpu_threads
+        except OSError:
+            load_per_core = 0.0
+
+        workers = self.chunk_workers
+        if rss is not None and self.memory_high_watermark and rss > self.memory_high_watermark:
+            workers = max(1, workers // 2)
+            self._direction = -1
+        elif load_per_core > 1.5:
+            workers -= 1
+            self._direction = -1
+        else:
+            if throughput is not None and self._previous_throughput is not None and (
+                throughput < self._previous_throughput * 0.95
+            ):
+                self._direction = -self._direction
+            if not 1 <= workers + self._direction <= self.max_chunk_workers:
+                # Probe back from the bounds
+                self._direction = -self._direction
+            workers += self._direction
+        self._previous_throughput = throughput
+
+        workers = min(self.max_chunk_workers, max(1, workers))
+        if workers != self.chunk_workers:
+            logger.info(
+                "Diarization chunk workers %d -> %d (throughput %.2f, load/core %.2f, rss %s)",
+                self.chunk_workers, workers, throughput or 0.0, load_per_core, rss
+            )
+            self.chunk_workers = workers
+            DIARIZATION_CHUNK_WORKERS.set(workers)
+
+    def status(self) -> dict:
+        return {
+            "cpu_threads": self.cpu_threads,
+            "torch_threads": self.torch_threads,
+            "ctranslate2_threads": self.ctranslate2_threads,
+            "chunk_workers": self.chunk_workers,
+            "max_chunk_workers": self.max_chunk_workers,
+        }
+
+
+def get_resource_governor() -> ResourceGovernor:
+    """Shared governor configured from the environment (model loaders and adapters use the same split)"""
+    global _governor_instance
+    if _governor_instance is None:
+        from config import (
+            CPU_THREADS, DIARIZATION_CPU_SHARE, ENABLE_DIARIZATION,
+            DIARIZATION_MAX_CHUNK_WORKERS, MEMORY_HIGH_WATERMARK_MB
+        )
+        _governor_instance = ResourceGovernor(
+            cpu_threads=CPU_THREADS,
+            diarization_share=DIARIZATION_CPU_SHARE,
+            diarization_enabled=ENABLE_DIARIZATION,
+            max_chunk_workers=DIARIZATION_MAX_CHUNK_WORKERS,
+            memory_high_watermark_mb=MEMORY_HIGH_WATERMARK_MB
+        )
+    return _governor_instance
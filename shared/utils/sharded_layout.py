@@ -0,0 +1,72 @@
+import hashlib
+import os
+from typing import Iterator, Tuple
+
+
+class ShardedLayout:
+    """
+    Spreads a repository's files over nested subdirectories named after a
+    hash of their key: ``root/3f/a2/{key}{suffix}`` with the default depth of
+    two levels of two hex digits (65536 directories), so no directory grows
+    large enough to slow down lookups.
+
+    Files stored flat in ``root`` by earlier versions are still found (see
+    scripts.shard_storage to move them into their shards).
+    """
+    def __init__(self, root: str, depth: int = 2, width: int = 2):
+        """
+        Args:
+            root: Storage directory
+            depth: Number of nested shard directories
+            width: Hex digits per shard directory name
+        """
+        self.root = root
+        self.depth = depth
+        self.width = width
+        os.makedirs(root, exist_ok=True)
+
+    def shard_dir(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        parts = [digest[i * self.width:(i + 1) * self.width] for i in range(self.depth)]
+        return os.path.join(self.root, *parts)
+
+    def legacy_path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.root, f"{key}{suffix}")
+
+    def path(self, key: str, suffix: str) -> str:
+        """Path of an existing file (sharded or legacy flat), or where a new one belongs"""
+        sharded = os.path.join(self.shard_dir(key), f"{key}{suffix}")
+        if os.path.exists(sharded):
+            return sharded
+        legacy = self.legacy_path(key, suffix)
+        if os.path.exists(legacy):
+            return legacy
+        return sharded
+
+    def writable_path(self, key: str, suffix: str) -> str:
+        """Like path(), creating the shard directory of a new file"""
+        path = self.path(key, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def _is_shard(self, name: str) -> bool:
+        return len(name) == self.width and all(c in "0123456789abcdef" for c in name)
+
+    def _walk(self, directory: str, level: int) -> Iterator[os.DirEntry]:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if level < self.depth:
+                    if self._is_shard(entry.name) and entry.is_dir(follow_symlinks=False):
+                        yield from self._walk(entry.path, level + 1)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+    def files(self, suffix: str) -> Iterator[Tuple[str, os.DirEntry]]:
+        """(key, directory entry) of every stored file with ``suffix``, sharded or legacy"""
+        for entry in self._walk(self.root, 0):
+            if entry.name.endswith(suffix):
+                yield entry.name[:-len(suffix)], entry
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                    yield entry.name[:-len(suffix)], entry
@@ -0,0 +1,77 @@
+import math
+import threading
+from typing import List, Optional, Sequence
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = math.fsum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(math.fsum(x * x for x in a)) * math.sqrt(math.fsum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class OnlineSpeakerTracker:
+    """
+    Assigns speaker labels to utterances as they arrive, by comparing each
+    utterance's speaker embedding with the centroid of every speaker seen so
+    far. An utterance joins the most similar speaker when the cosine
+    similarity reaches the threshold and starts a new speaker otherwise
+    (until max_speakers, after which it joins the nearest one).
+    """
+    def __init__(self, similarity: float = 0.5, max_speakers: int = 8):
+        """
+        Args:
+            similarity: Minimum cosine similarity to an existing speaker's centroid
+            max_speakers: Upper bound on the number of speakers told apart
+        """
+        self.similarity = similarity
+        self.max_speakers = max_speakers
+        self._centroids: List[List[float]] = []
+        self._weights: List[float] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def label(index: int) -> str:
+        return f"SPEAKER_{index:02d}"
+
+    def assign(self, embedding: Sequence[float], weight: float = 1.0, update: bool = True) -> Optional[str]:
+        """
+        Label of the speaker of an utterance
+
+        Args:
+            embedding: Speaker embedding of the utterance
+            weight: Weight of the utterance in the centroid (e.g. its duration)
+            update: Fold the embedding into the speaker's centroid (False for provisional labels)
+
+        Returns:
+            The speaker label, or None when there is no speaker yet and update is False
+        """
+        with self._lock:
+            best, best_similarity = None, -1.0
+            for index, centroid in enumerate(self._centroids):
+                similarity = cosine_similarity(embedding, centroid)
+                if similarity > best_similarity:
+                    best, best_similarity = index, similarity
+
+            new_speaker = best is None or (
+                best_similarity < self.similarity and len(self._centroids) < self.max_speakers
+            )
+            if new_speaker:
+                if not update:
+                    return None
+                self._centroids.append(list(embedding))
+                self._weights.append(weight)
+                return self.label(len(self._centroids) - 1)
+
+            if update:
+                # Running weighted mean of the speaker's embeddings
+                total = self._weights[best] + weight
+                self._centroids[best] = [
+                    (c * self._weights[best] + e * weight) / total
+                    for c, e in zip(self._centroids[best], embedding)
+                ]
+                self._weights[best] = total
+            return self.label(best)
+
+    @property
+    def speakers(self) -> int:
+        return len(self._centroids)
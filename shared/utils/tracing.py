@@ -0,0 +1,229 @@
+"""
+Per-job trace timelines.
+
+A JobTrace is activated for the duration of a transcription job through a
+context variable, so adapters record spans without the trace being passed
+around. Work submitted to executor threads must be wrapped with
+``in_context`` to stay attached to the job; the same wrapper runs the work
+under cProfile when the job was started with profiling enabled.
+"""
+
+import asyncio
+import contextvars
+import cProfile
+import os
+import pstats
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Functions listed in a profile report, by cumulative time
+PROFILE_TOP_FUNCTIONS = 30
+
+_current_trace: contextvars.ContextVar[Optional["JobTrace"]] = contextvars.ContextVar(
+    "current_trace", default=None
+)
+_profiling = threading.local()
+
+
+@dataclass
+class Span:
+    """One timed step of a job; ``start`` is relative to the start of the job"""
+    name: str
+    start: float
+    duration: float
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    thread: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration": round(self.duration, 6),
+            "thread": self.thread,
+            "attrs": self.attrs,
+        }
+
+
+class JobTrace:
+    """
+    Timeline of one transcription job.
+    Spans may be added from worker threads.
+    """
+    def __init__(self, clip_id: str, mode: str, profile: bool = False):
+        self.job_id = str(uuid.uuid4())
+        self.clip_id = clip_id
+        self.mode = mode
+        self.profile = profile
+        self.status = RUNNING
+        self.error: Optional[str] = None
+        self.started_at = time.time()
+        self.duration: Optional[float] = None
+        self._started = time.perf_counter()
+        self._spans: List[Span] = []
+        self._stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def add_span(self, name: str, started: float, duration: float, attrs: Dict[str, Any]) -> None:
+        span = Span(name, started - self._started, duration, attrs, threading.current_thread().name)
+        with self._lock:
+            self._spans.append(span)
+
+    def add_profile(self, profiler: cProfile.Profile) -> None:
+        """Merge the stats of a finished profiler run into the job's profile"""
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profiler)
+            else:
+                self._stats.add(profiler)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.duration = self.elapsed()
+        if error is None:
+            self.status = COMPLETED
+        elif isinstance(error, (GeneratorExit, asyncio.CancelledError)):
+            # Client disconnected or the request was cancelled
+            self.status = CANCELLED
+        else:
+            self.status = FAILED
+            self.error = str(error) or type(error).__name__
+
+    def _profile_report(self) -> List[dict]:
+        rows = []
+        for (filename, line, function), (_, calls, self_time, cumulative, _) in self._stats.stats.items():
+            # Built-ins are reported with the filename "~"
+            name = f"{function} ({os.path.basename(filename)}:{line})" if filename != "~" else function
+            rows.append({
+                "function": name,
+                "calls": calls,
+                "self_seconds": round(self_time, 6),
+                "cumulative_seconds": round(cumulative, 6),
+            })
+        rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+        return rows[:PROFILE_TOP_FUNCTIONS]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span.start)
+            profile = self._profile_report() if self._stats is not None else None
+        return {
+            "job_id": self.job_id,
+            "clip_id": self.clip_id,
+            "mode": self.mode,
+            "status": self.status,
+            "error": self.error,
+            "started_at": self.started_at,
+            "duration": self.duration if self.duration is not None else self.elapsed(),
+            "spans": [span.to_dict() for span in spans],
+            "profile": profile,
+        }
+
+
+class TraceStore:
+    """Latest trace of each clip, bounded to the most recently started jobs"""
+    def __init__(self, max_traces: int = 100):
+        self.max_traces = max_traces
+        self._traces: "OrderedDict[str, JobTrace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, trace: JobTrace) -> None:
+        with self._lock:
+            self._traces[trace.clip_id] = trace
+            self._traces.move_to_end(trace.clip_id)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+    def get(self, clip_id: str) -> Optional[JobTrace]:
+        with self._lock:
+            return self._traces.get(clip_id)
+
+
+def current_trace() -> Optional[JobTrace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def job_trace(store: Optional[TraceStore], clip_id: str, mode: str, profile: bool = False):
+    """
+    Record a job's trace in ``store`` while the block runs.
+    Nested jobs (e.g. get_or_transcribe calling execute) join the outer trace.
+    """
+    trace = _current_trace.get()
+    if store is None or trace is not None:
+        yield trace
+        return
+
+    trace = JobTrace(clip_id, mode, profile=profile)
+    store.put(trace)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.finish(e)
+        raise
+    else:
+        trace.finish()
+    finally:
+        try:
+            _current_trace.reset(token)
+        except ValueError:
+            # Async generator finalized from another task's context
+            _current_trace.set(None)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Record the block as a span of the current job (no-op outside a job).
+    Yields the span's attribute dict so sizes known only at the end can be added.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield attrs
+        return
+    started = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        trace.add_span(name, started, time.perf_counter() - started, attrs)
+
+
+def _run_profiled(func: Callable, *args, **kwargs):
+    trace = _current_trace.get()
+    # cProfile hooks a single thread; nested calls are covered by the outer run
+    if trace is None or not trace.profile or getattr(_profiling, "active", False):
+        return func(*args, **kwargs)
+    profiler = cProfile.Profile()
+    _profiling.active = True
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        _profiling.active = False
+        trace.add_profile(profiler)
+
+
+def in_context(func: Callable) -> Callable:
+    """
+    Bind ``func`` to the current job for use with ``run_in_executor``
+    (which, unlike asyncio.to_thread, does not carry context variables over).
+    The call is profiled when the job asked for a profile.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.run(_run_profiled, func, *args, **kwargs)
+    return run
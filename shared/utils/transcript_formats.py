@@ -0,0 +1,130 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from domain.speaker_segment import SpeakerSegment
+from domain.word_timing import WordTiming
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    millis = max(0, round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _one_line(text: Optional[str]) -> str:
+    # A blank line would end a subtitle cue
+    return " ".join((text or "").split())
+
+
+class TranscriptFormat(ABC):
+    """
+    Renders a transcript one segment at a time, so exports can be streamed
+    without holding the transcript or the output in memory.
+    """
+    name = ""
+    media_type = "text/plain; charset=utf-8"
+
+    def header(self) -> str:
+        return ""
+
+    @abstractmethod
+    def segment(self, index: int, segment: SpeakerSegment, words: Optional[List[WordTiming]] = None) -> str:
+        """
+        Render one segment
+
+        Args:
+            index: Position of the segment in the export (from 0)
+            segment: The segment
+            words: The segment's word timings, if requested and known
+        """
+        pass
+
+
+class SrtFormat(TranscriptFormat):
+    """
+    SubRip subtitles, one cue per segment. SRT has no inline timing, so with
+    word timings each word gets its own cue showing the segment with the
+    current word underlined.
+    """
+    name = "srt"
+    media_type = "application/x-subrip; charset=utf-8"
+
+    def __init__(self):
+        self._cue = 0
+
+    def _cue_text(self, start: float, end: float, text: str) -> str:
+        self._cue += 1
+        return f"{self._cue}\n{_timestamp(start, ',')} --> {_timestamp(end, ',')}\n{text}\n\n"
+
+    def segment(self, index: int, segment: SpeakerSegment, words: Optional[List[WordTiming]] = None) -> str:
+        prefix = f"[{segment.speaker_label}] " if segment.speaker_label else ""
+        if not words:
+            return self._cue_text(segment.start, segment.end, prefix + _one_line(segment.text))
+        texts = [_one_line(word.text) for word in words]
+        return "".join(
+            self._cue_text(word.start, word.end, prefix + " ".join(
+                f"<u>{text}</u>" if position == current else text for position, text in enumerate(texts)
+            ))
+            for current, word in enumerate(words)
+        )
+
+
+class VttFormat(TranscriptFormat):
+    """WebVTT subtitles, one cue per segment with the speaker as its voice; word timings become inline timestamps"""
+    name = "vtt"
+    media_type = "text/vtt; charset=utf-8"
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+    def header(self) -> str:
+        return "WEBVTT\n\n"
+
+    def segment(self, index: int, segment: SpeakerSegment, words: Optional[List[WordTiming]] = None) -> str:
+        if words:
+            # The first word starts with the cue
+            text = " ".join(
+                (f"<{_timestamp(word.start, '.')}>" if position else "") + self._escape(_one_line(word.text))
+                for position, word in enumerate(words)
+            )
+        else:
+            text = self._escape(_one_line(segment.text))
+        if segment.speaker_label:
+            text = f"<v {self._escape(segment.speaker_label)}>{text}"
+        return f"{index + 1}\n{_timestamp(segment.start, '.')} --> {_timestamp(segment.end, '.')}\n{text}\n\n"
+
+
+class JsonlFormat(TranscriptFormat):
+    """One JSON object per segment and line, with a ``words`` list when word timings are requested"""
+    name = "jsonl"
+    media_type = "application/x-ndjson"
+
+    def segment(self, index: int, segment: SpeakerSegment, words: Optional[List[WordTiming]] = None) -> str:
+        record = {
+            "start": segment.start,
+            "end": segment.end,
+            "speaker_label": segment.speaker_label,
+            "text": segment.text,
+        }
+        if words is not None:
+            record["words"] = [{"start": word.start, "end": word.end, "word": word.text} for word in words]
+        return json.dumps(record) + "\n"
+
+
+class TextFormat(TranscriptFormat):
+    """Plain text, one line per segment prefixed with its speaker; word timings are not shown"""
+    name = "txt"
+
+    def segment(self, index: int, segment: SpeakerSegment, words: Optional[List[WordTiming]] = None) -> str:
+        prefix = f"{segment.speaker_label}: " if segment.speaker_label else ""
+        return f"{prefix}{_one_line(segment.text)}\n"
+
+
+# Format name -> renderer class (renderers keep per-export state, so create one per export)
+TRANSCRIPT_FORMATS: Dict[str, type] = {
+    fmt.name: fmt for fmt in (SrtFormat, VttFormat, JsonlFormat, TextFormat)
+}
@@ -0,0 +1,50 @@
+import array
+import math
+import sys
+from typing import Iterator, Tuple
+
+
+class EnergyVAD:
+    """
+    Frame-level voice activity detection on 16-bit mono PCM: a frame is
+    speech when its level is above a dBFS threshold, the same criterion
+    pydub's silence detection applies to whole files.
+    """
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 30, threshold_db: float = -40.0):
+        """
+        Args:
+            sample_rate: Sample rate of the PCM fed in
+            frame_ms: Length of the frames classified
+            threshold_db: Frames below this level (dBFS) are silence
+        """
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_bytes = 2 * sample_rate * frame_ms // 1000
+        self.threshold_db = threshold_db
+        self._pending = b""
+
+    @staticmethod
+    def level_db(frame: bytes) -> float:
+        """RMS level of a 16-bit little-endian PCM frame in dBFS"""
+        samples = array.array("h", frame)
+        if sys.byteorder == "big":
+            samples.byteswap()
+        if not samples:
+            return -math.inf
+        rms = math.sqrt(math.fsum(sample * sample for sample in samples) / len(samples))
+        return 20 * math.log10(rms / 32768) if rms else -math.inf
+
+    def feed(self, pcm: bytes) -> Iterator[Tuple[bytes, bool]]:
+        """
+        Split PCM into frames and classify them; a trailing partial frame is
+        kept until the next call.
+
+        Returns:
+            Iterator of (frame, is_speech)
+        """
+        data = self._pending + pcm
+        whole = len(data) - len(data) % self.frame_bytes
+        self._pending = data[whole:]
+        for offset in range(0, whole, self.frame_bytes):
+            frame = data[offset:offset + self.frame_bytes]
+            yield frame, self.level_db(frame) >= self.threshold_db
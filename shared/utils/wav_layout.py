@@ -0,0 +1,80 @@
+import math
+import struct
+from dataclasses import dataclass
+
+_CHUNK = struct.Struct("<4sI")
+
+
+@dataclass(frozen=True)
+class WavLayout:
+    """Where the samples of a PCM WAV file are and how they are framed"""
+    fmt_chunk: bytes  # the file's fmt chunk (header and body), copied into sliced files
+    data_offset: int
+    data_size: int
+    channels: int
+    sample_rate: int
+    block_align: int  # bytes per frame (all channels)
+
+    @property
+    def frames(self) -> int:
+        return self.data_size // self.block_align
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+    def frame_range(self, start: float, end: float) -> tuple[int, int]:
+        """Byte (offset, length) of the frames covering [start, end) seconds"""
+        first = min(self.frames, max(0, int(start * self.sample_rate)))
+        last = min(self.frames, max(first, math.ceil(end * self.sample_rate)))
+        return self.data_offset + first * self.block_align, (last - first) * self.block_align
+
+    def header(self, data_size: int) -> bytes:
+        """RIFF header of a file holding ``data_size`` bytes of these frames"""
+        riff_size = 4 + len(self.fmt_chunk) + _CHUNK.size + data_size + (data_size & 1)
+        return b"".join([
+            _CHUNK.pack(b"RIFF", riff_size),
+            b"WAVE",
+            self.fmt_chunk,
+            _CHUNK.pack(b"data", data_size),
+        ])
+
+
+def read_wav_layout(path: str) -> WavLayout:
+    """
+    Locate the fmt and data chunks of a WAV file by walking its RIFF chunk
+    headers; the samples themselves are not read.
+
+    Raises:
+        ValueError: If the file is not an uncompressed (PCM or float) WAV file
+    """
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            raise ValueError("Not a WAV file")
+        file_size = f.seek(0, 2)
+        position = 12
+        fmt_chunk = None
+        while position + _CHUNK.size <= file_size:
+            f.seek(position)
+            chunk_id, chunk_size = _CHUNK.unpack(f.read(_CHUNK.size))
+            body = position + _CHUNK.size
+            if chunk_id == b"fmt ":
+                f.seek(position)
+                fmt_chunk = f.read(_CHUNK.size + chunk_size)
+            elif chunk_id == b"data":
+                if fmt_chunk is None:
+                    raise ValueError("WAV data chunk precedes its fmt chunk")
+                format_tag, channels, sample_rate, _, block_align = struct.unpack_from(
+                    "<HHIIH", fmt_chunk, _CHUNK.size
+                )
+                # PCM, IEEE float or WAVE_FORMAT_EXTENSIBLE
+                if format_tag not in (1, 3, 0xFFFE) or not block_align or not sample_rate:
+                    raise ValueError("WAV file is not uncompressed PCM")
+                # Streamed writers may leave the data size unset or too large
+                data_size = min(chunk_size, file_size - body)
+                data_size -= data_size % block_align
+                return WavLayout(fmt_chunk, body, data_size, channels, sample_rate, block_align)
+            # Chunks are word aligned
+            position = body + chunk_size + (chunk_size & 1)
+    raise ValueError("WAV file has no data chunk")